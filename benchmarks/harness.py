@@ -0,0 +1,188 @@
+# benchmarks/harness.py
+
+import asyncio
+import importlib
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# Placeholder credentials so core.py imports; nothing ever reaches a real API
+DUMMY_ENV = {
+    "BOT_TOKEN": "benchmark",
+    "TENOR_API_KEY": "benchmark",
+    "NEWS_API_KEY": "benchmark",
+    "OMDB_API_KEY": "benchmark",
+    "ALPHA_VANTAGE_API_KEY": "benchmark",
+    "NASA_API_KEY": "benchmark",
+    "METRICS_PORT": "0",
+}
+
+
+def load_bot(workdir=None):
+    """Import core.py with dummy credentials and a throwaway database, without connecting to Discord.
+
+    The command cogs are loaded by `bot.setup_hook()`.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="infonexus-bench-")
+    for key, value in DUMMY_ENV.items():
+        os.environ.setdefault(key, value)
+    os.environ.setdefault("USER_DB_FILE", os.path.join(workdir, "bench.db"))
+    return importlib.import_module("core")
+
+
+class FakeUser:
+    def __init__(self, user_id=1000, name="bench-user"):
+        self.id = user_id
+        self.name = name
+        self.display_name = name
+        self.mention = f"<@{user_id}>"
+        self.bot = False
+
+    def __str__(self):
+        return self.name
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None, embed=None, view=None):
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+        self.view = view
+
+    async def edit(self, **kwargs):
+        self.channel.edits += 1
+
+    async def add_reaction(self, emoji):
+        pass
+
+
+class FakeChannel:
+    def __init__(self, channel_id=2000):
+        self.id = channel_id
+        self.sent = []
+        self.edits = 0
+
+    async def send(self, content=None, *, embed=None, view=None, **kwargs):
+        message = FakeMessage(self, content, embed, view)
+        self.sent.append(message)
+        if view is not None:
+            # Nobody will click; stop the view so its timeout task doesn't outlive the run
+            view.stop()
+        return message
+
+
+class FakeGuild:
+    def __init__(self, guild_id=3000, owner=None):
+        self.id = guild_id
+        self.name = "Benchmark Guild"
+        self.owner = owner
+
+
+class FakeContext:
+    """The parts of `commands.Context` the commands use; every `send` is recorded on the channel."""
+
+    def __init__(self, bot, command, author=None, channel=None):
+        self.bot = bot
+        self.command = command
+        self.author = author or FakeUser()
+        self.channel = channel or FakeChannel()
+        self.guild = FakeGuild(owner=self.author)
+        self.message = FakeMessage(self.channel)
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+    @property
+    def sent(self):
+        return self.channel.sent
+
+
+class Result:
+    """Latency samples and outcomes for one scenario run."""
+
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.outcomes = Counter()
+        self.sends = 0
+        self.elapsed = 0.0
+        self.peak_rss_kb = 0
+        self.traced_peak_kb = None
+        self.upstream_requests = 0
+
+    def percentile(self, fraction):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self):
+        count = len(self.latencies)
+        lines = [
+            f"== {self.name} ==",
+            f"commands:     {count} in {self.elapsed:.2f}s ({count / self.elapsed if self.elapsed else 0:.1f} commands/sec)",
+            f"latency:      p50 {self.percentile(0.5) * 1000:.1f} ms, p99 {self.percentile(0.99) * 1000:.1f} ms, "
+            f"mean {statistics.fmean(self.latencies) * 1000 if count else 0:.1f} ms",
+            f"outcomes:     {dict(self.outcomes)}",
+            f"messages:     {self.sends} sent, {self.upstream_requests} upstream requests",
+            f"memory:       peak RSS {self.peak_rss_kb / 1024:.1f} MiB",
+        ]
+        if self.traced_peak_kb is not None:
+            lines[-1] += f", traced peak {self.traced_peak_kb / 1024:.1f} MiB"
+        return "\n".join(lines)
+
+
+async def invoke(bot_module, name, args=(), kwargs=None):
+    """Run one command callback the way the bot would, returning (latency, outcome, sends).
+
+    Registration checks are skipped and the deadline is started as in
+    `before_invoke`; a failed command's outcome is its exception type name.
+    """
+    command = bot_module.bot.get_command(name)
+    ctx = FakeContext(bot_module.bot, command)
+    bot_module.deadline.start(bot_module.deadline.budget_for(command.qualified_name))
+    started = time.perf_counter()
+    try:
+        # Cog commands are methods; the cog instance comes first
+        prefix = (command.cog, ctx) if command.cog is not None else (ctx,)
+        await command.callback(*prefix, *args, **(kwargs or {}))
+        outcome = "ok"
+    except Exception as e:
+        outcome = type(e).__name__
+    return time.perf_counter() - started, outcome, len(ctx.sent)
+
+
+async def run_workload(bot_module, name, workload, concurrency=50, stub=None, trace_memory=False):
+    """Run `workload`, a list of (command, args, kwargs), with at most `concurrency` commands in flight."""
+    result = Result(name)
+    semaphore = asyncio.Semaphore(concurrency)
+    requests_before = stub.requests if stub else 0
+
+    async def one(item):
+        async with semaphore:
+            latency, outcome, sends = await invoke(bot_module, *item)
+        result.latencies.append(latency)
+        result.outcomes[outcome] += 1
+        result.sends += sends
+
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    # gather runs each command in its own task, so deadlines don't leak between commands
+    await asyncio.gather(*(one(item) for item in workload))
+    result.elapsed = time.perf_counter() - started
+    if trace_memory:
+        result.traced_peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    result.peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result.upstream_requests = (stub.requests - requests_before) if stub else 0
+    return result
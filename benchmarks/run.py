@@ -0,0 +1,158 @@
+# benchmarks/run.py
+"""Offline throughput benchmarks for the bot's commands.
+
+Usage: python benchmarks/run.py [--scenario NAME] [--commands N] [--concurrency N]
+                                [--latency SECONDS] [--jitter SECONDS] [--error-rate FRACTION]
+                                [--warmup SECONDS] [--no-rate-limits] [--trace-memory]
+                                [--cassette PATH [--cassette-mode replay|replay-fast]]
+
+Every scenario runs in a fresh interpreter so caches, pools and circuit
+breakers start cold; pools get `--warmup` seconds to fill first. Commands are driven through a fake context against a
+local stub server; nothing touches Discord or a real API.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import load_bot, run_workload  # noqa: E402
+from stub_server import StubUpstream  # noqa: E402
+from cassette import Cassette  # noqa: E402
+import throttle  # noqa: E402
+
+# (command, args, kwargs, weight) for the mixed workload
+MIXED_COMMANDS = [
+    ("trivia", (), {}, 10),
+    ("fact", (), {}, 8),
+    ("joke", (), {}, 8),
+    ("dad_joke", (), {}, 5),
+    ("quote", (), {}, 5),
+    ("dog", (), {}, 8),
+    ("cat", (), {}, 8),
+    ("fox", (), {}, 4),
+    ("meme", (), {}, 6),
+    ("stock", ("AAPL",), {}, 4),
+    ("bitcoin", (), {}, 4),
+    ("nasa_apod", (), {}, 3),
+    ("github", ("octocat",), {}, 3),
+    ("movie", (), {"title": "Inception"}, 3),
+    ("define", (), {"word": "latency"}, 3),
+    ("comic", (), {}, 3),
+    ("pokemon", (), {}, 3),
+    ("color", (), {}, 2),
+    ("number_fact", (42,), {}, 2),
+    ("binary", (), {"text": "hello world"}, 2),
+    ("morse", (), {"text": "sos"}, 2),
+    ("ascii", (), {"text": "hi"}, 2),
+    ("fortune", (), {}, 4),
+    ("space_fact", (), {}, 4),
+    ("what", (), {}, 2),
+]
+
+# Upstream outage: these hosts fail outright or hang past every command budget
+OUTAGE_DOWN = {"www.alphavantage.co": 503, "api.github.com": 503, "dog.ceo": 503, "api.thecatapi.com": 502}
+OUTAGE_SLOW = {"pokeapi.co": 30, "xkcd.com": 30}
+
+
+def mixed_workload(count, seed=0):
+    rng = random.Random(seed)
+    weights = [weight for *_, weight in MIXED_COMMANDS]
+    return [(name, args, kwargs) for name, args, kwargs, _ in rng.choices(MIXED_COMMANDS, weights, k=count)]
+
+
+def trivia_burst(count, seed=0):
+    return [("trivia", (), {})] * count
+
+
+def outage_setup(stub):
+    stub.down.update(OUTAGE_DOWN)
+    stub.slow.update(OUTAGE_SLOW)
+
+
+# Scenario name -> (workload builder, stub setup)
+SCENARIOS = {
+    "trivia_burst": (trivia_burst, None),
+    "mixed": (mixed_workload, None),
+    "outage": (mixed_workload, outage_setup),
+}
+
+
+async def stop_bot(bot_module):
+    """Stop the background work `setup_hook` started, without the Discord disconnect in `bot.close`."""
+    for extension in tuple(bot_module.bot.extensions):
+        await bot_module.bot.unload_extension(extension)
+    bot_module.stall_watchdog.stop()
+    bot_module.reminder_scheduler.stop()
+    await bot_module.cancel_refreshes()
+    await bot_module.trivia_bank.stop()
+
+
+async def run_scenario(name, options):
+    build, setup = SCENARIOS[name]
+    stub = StubUpstream(latency=options.latency, jitter=options.jitter, error_rate=options.error_rate)
+    base_url = await stub.start()
+    if setup:
+        setup(stub)
+    bot_module = load_bot()
+    if options.cassette:
+        # Serve recorded production responses instead of the stub's canned ones
+        bot_module.http_client.set_cassette(Cassette(options.cassette, options.cassette_mode))
+    else:
+        bot_module.http_client.set_upstream_override(base_url)
+    if options.no_rate_limits:
+        for host in throttle.DEFAULT_HOST_LIMITS:
+            throttle.host_limiter.set_limit(host, 1_000_000, 1)
+    try:
+        await bot_module.bot.setup_hook()
+        # Let the warm-up refreshes and pool refills settle before measuring
+        await asyncio.sleep(options.warmup)
+        result = await run_workload(
+            bot_module, name, build(options.commands), concurrency=options.concurrency,
+            stub=stub, trace_memory=options.trace_memory
+        )
+    finally:
+        await stop_bot(bot_module)
+        await bot_module.user_registry.flush()
+        await bot_module.http_client.close()
+        await bot_module.metrics.stop()
+        await stub.stop()
+    print(result.summary())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run offline command benchmarks against a local stub upstream.")
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "all"], default="all")
+    parser.add_argument("--commands", type=int, default=500, help="commands per scenario")
+    parser.add_argument("--concurrency", type=int, default=50, help="commands in flight at once")
+    parser.add_argument("--latency", type=float, default=0.02, help="stub response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="extra random delay, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub responses that fail")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds to let pools fill before measuring")
+    parser.add_argument("--no-rate-limits", action="store_true", help="lift the per-host request budgets")
+    parser.add_argument("--trace-memory", action="store_true", help="report tracemalloc peak (slows the run)")
+    parser.add_argument("--cassette", help="replay upstream responses from this cassette instead of the stub")
+    parser.add_argument("--cassette-mode", choices=["replay", "replay-fast"], default="replay-fast")
+    options = parser.parse_args()
+
+    if options.scenario != "all":
+        asyncio.run(run_scenario(options.scenario, options))
+        return
+    shared = [
+        f"--commands={options.commands}", f"--concurrency={options.concurrency}",
+        f"--latency={options.latency}", f"--jitter={options.jitter}",
+        f"--error-rate={options.error_rate}", f"--warmup={options.warmup}",
+    ]
+    shared += ["--no-rate-limits"] * options.no_rate_limits + ["--trace-memory"] * options.trace_memory
+    if options.cassette:
+        shared += [f"--cassette={options.cassette}", f"--cassette-mode={options.cassette_mode}"]
+    for name in SCENARIOS:
+        subprocess.run([sys.executable, os.path.abspath(__file__), f"--scenario={name}", *shared], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# benchmarks/stub_server.py
+
+import asyncio
+import json
+import random
+
+from aiohttp import web
+
+
+def _joke(n):
+    return {"id": n, "setup": f"Why did benchmark {n} cross the road?", "punchline": "To measure the other side."}
+
+
+def _meme(n):
+    return {"title": f"Benchmark meme {n}", "url": f"https://i.example.com/meme{n}.png"}
+
+
+def _trivia(n):
+    return {
+        "category": "General Knowledge",
+        "type": "multiple",
+        "difficulty": "easy",
+        "question": f"Benchmark question {n}?",
+        "correct_answer": "Right",
+        "incorrect_answers": ["Wrong A", "Wrong B", "Wrong C"]
+    }
+
+
+def _count(path, default=1):
+    tail = path.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else default
+
+
+# Host -> handler(path, query) returning a JSON-serialisable payload or a str body
+PAYLOADS = {
+    "uselessfacts.jsph.pl": lambda path, query: {"text": "Honey never spoils."},
+    "official-joke-api.appspot.com": lambda path, query: (
+        [_joke(n) for n in range(10)] if path.endswith("/ten") else _joke(0)
+    ),
+    "api.quotable.io": lambda path, query: {"content": "Measure twice, cut once.", "author": "Proverb"},
+    "dog.ceo": lambda path, query: {
+        "message": (
+            [f"https://images.dog.ceo/breeds/stub/{n}.jpg" for n in range(_count(path))]
+            if path.rstrip("/").rsplit("/", 1)[-1].isdigit() else "https://images.dog.ceo/breeds/stub/0.jpg"
+        ),
+        "status": "success"
+    },
+    "api.thecatapi.com": lambda path, query: [
+        {"id": str(n), "url": f"https://cdn2.thecatapi.com/images/{n}.jpg"} for n in range(int(query.get("limit", 1)))
+    ],
+    "hp-api.onrender.com": lambda path, query: [
+        {"name": "Lumos", "description": "Illuminates the wand tip"},
+        {"name": "Nox", "description": "Extinguishes the wand tip"}
+    ],
+    "www.themealdb.com": lambda path, query: {"meals": [{
+        "strMeal": "Stub Stew", "strCategory": "Benchmark", "strArea": "Local",
+        "strInstructions": "Stir until fast.", "strMealThumb": "https://www.themealdb.com/stub.jpg"
+    }]},
+    "www.reddit.com": lambda path, query: [
+        {"data": {"children": [{"data": {"title": "Stub post", "url": "https://reddit.com/stub"}}]}}
+    ],
+    "api.github.com": lambda path, query: {
+        "login": path.rsplit("/", 1)[-1], "name": "Stub User", "bio": "Benchmarks things",
+        "public_repos": 42, "followers": 7, "following": 3,
+        "avatar_url": "https://avatars.githubusercontent.com/u/0"
+    },
+    "www.omdbapi.com": lambda path, query: {
+        "Response": "True", "Title": query.get("t", "Stub"), "Year": "2010", "Genre": "Benchmark",
+        "Director": "Stub Director", "Plot": "A bot answers commands quickly.", "Poster": ""
+    },
+    "www.alphavantage.co": lambda path, query: {
+        "Global Quote": {"01. symbol": query.get("symbol", "STUB"), "05. price": "123.4500", "09. change": "1.2300"}
+    },
+    "api.coindesk.com": lambda path, query: {"bpi": {"USD": {"rate": "65,000.0000"}}},
+    "api.nasa.gov": lambda path, query: {
+        "title": "Stub Nebula", "explanation": "A picture of the loopback interface.",
+        "url": "https://apod.nasa.gov/stub.jpg"
+    },
+    "tenor.googleapis.com": lambda path, query: {
+        "results": [{"media_formats": {"gif": {"url": "https://media.tenor.com/stub.gif"}}}]
+    },
+    "ghapi.huchen.dev": lambda path, query: [
+        {"name": f"repo{n}", "author": "stub", "url": f"https://github.com/stub/repo{n}"} for n in range(5)
+    ],
+    "numbersapi.com": lambda path, query: f"{path.split('/')[1]} is the number of this benchmark.",
+    "meme-api.herokuapp.com": lambda path, query: (
+        {"count": _count(path), "memes": [_meme(n) for n in range(_count(path))]}
+        if path.rstrip("/").rsplit("/", 1)[-1].isdigit() else _meme(0)
+    ),
+    "icanhazdadjoke.com": lambda path, query: {"id": "stub", "joke": "I'm afraid for the calendar. Its days are numbered.", "status": 200},
+    "randomfox.ca": lambda path, query: {"image": "https://randomfox.ca/images/1.jpg"},
+    "aztro.sameerkumar.website": lambda path, query: {"description": "A fast day for benchmarks."},
+    "api.dictionaryapi.dev": lambda path, query: [{
+        "word": path.rsplit("/", 1)[-1],
+        "meanings": [{"definitions": [{"definition": "A stub definition.", "example": "Stubs are fast."}]}]
+    }],
+    "www.boredapi.com": lambda path, query: {"activity": "Run a benchmark"},
+    "xkcd.com": lambda path, query: {
+        "num": 2500 if path == "/info.0.json" else int(path.split("/")[1]),
+        "title": "Stub Comic", "img": "https://imgs.xkcd.com/comics/stub.png", "alt": "Alt text"
+    },
+    "openlibrary.org": lambda path, query: {
+        "title": "The Stub Book", "authors": [{"name": "A. Author"}], "description": "Fast reading."
+    },
+    "pokeapi.co": lambda path, query: {
+        "name": "pikachu", "sprites": {"front_default": "https://raw.githubusercontent.com/stub/25.png"},
+        "types": [{"type": {"name": "electric"}}]
+    },
+    "www.thecolorapi.com": lambda path, query: {"name": {"value": "Stub Blue"}, "hex": {"value": "1E90FF"}},
+    "libretranslate.de": lambda path, query: {"translatedText": "Hola"},
+    "opentdb.com": lambda path, query: (
+        {"response_code": 0, "token": "stub-token"} if path == "/api_token.php"
+        else {"response_code": 0, "results": [_trivia(n) for n in range(int(query.get("amount", 10)))]}
+    ),
+}
+
+
+class StubUpstream:
+    """Local HTTP server that answers for every upstream host the bot calls.
+
+    Requests arrive as `/<host>/<path>` (see `http_client.set_upstream_override`).
+    Each response is delayed by `latency` seconds (plus up to `jitter`), a
+    random `error_rate` fraction fail with `error_status`, hosts in `down`
+    always answer with their mapped status, and hosts in `slow` wait for
+    their mapped number of seconds first.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.down = {}
+        self.slow = {}
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._runner = None
+        self.base_url = None
+
+    async def start(self, host="127.0.0.1", port=0):
+        app = web.Application()
+        app.router.add_route("*", "/{host}/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request):
+        self.requests += 1
+        host = request.match_info["host"]
+        path = "/" + request.match_info["path"]
+        delay = self.slow.get(host, self.latency + self._random.uniform(0, self.jitter))
+        if delay:
+            await asyncio.sleep(delay)
+        if host in self.down:
+            return web.Response(status=self.down[host], text="stub outage")
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.Response(status=self.error_status, text="stub error")
+        handler = PAYLOADS.get(host)
+        if handler is None:
+            return web.Response(status=404, text=f"no stub for {host}")
+        payload = handler(path, request.query)
+        if isinstance(payload, str):
+            return web.Response(text=payload)
+        return web.Response(body=json.dumps(payload).encode("utf-8"), content_type="application/json")
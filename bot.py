@@ -1,2003 +1,8 @@
 # bot.py
+# Entry point; the bot, its services and core commands live in core.py and the command cogs in cogs/
 
-import os
-import discord
-from discord.ext import commands
-from discord.ui import Button, View
-from dotenv import load_dotenv
-import requests
-import random
-import asyncio
-import logging
-import json
-from datetime import datetime
-from discord import Activity, ActivityType
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Retrieve API keys and tokens from environment variables
-BOT_TOKEN = os.getenv("BOT_TOKEN")
-TENOR_API_KEY = os.getenv("TENOR_API_KEY")
-NEWS_API_KEY = os.getenv("NEWS_API_KEY")
-OMDB_API_KEY = os.getenv("OMDB_API_KEY")
-ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
-NASA_API_KEY = os.getenv("NASA_API_KEY")
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")  # Optional: For authenticated GitHub API requests
-
-# Validate essential API keys
-required_keys = {
-    "BOT_TOKEN": BOT_TOKEN,
-    "TENOR_API_KEY": TENOR_API_KEY,
-    "NEWS_API_KEY": NEWS_API_KEY,
-    "OMDB_API_KEY": OMDB_API_KEY,
-    "ALPHA_VANTAGE_API_KEY": ALPHA_VANTAGE_API_KEY,
-    "NASA_API_KEY": NASA_API_KEY
-}
-
-missing_keys = [key for key, value in required_keys.items() if not value]
-if missing_keys:
-    missing = ", ".join(missing_keys)
-    raise EnvironmentError(f"Missing required environment variables: {missing}")
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger('discord')
-
-# Define bot intents
-intents = discord.Intents.default()
-intents.message_content = True  # Enable access to message content
-
-# Initialize bot
-bot = commands.Bot(command_prefix="!", intents=intents, description="InfoNexus - The Ultimate Discord Bot!")
-
-# Initialize user data storage
-USER_DATA_FILE = "user_data.json"
-
-if not os.path.exists(USER_DATA_FILE):
-    with open(USER_DATA_FILE, "w") as f:
-        json.dump({}, f)
-
-def load_user_data():
-    with open(USER_DATA_FILE, "r") as f:
-        return json.load(f)
-
-def save_user_data(data):
-    with open(USER_DATA_FILE, "w") as f:
-        json.dump(data, f, indent=4)
-
-@bot.event
-async def on_ready():
-    await bot.change_presence(activity=Activity(type=ActivityType.watching, name="AnshKabra2012"))
-    print(f"Logged in as {bot.user}")
-
-# Helper Functions
-
-def fetch_trivia_question(category=None):
-    """Fetch a trivia question from Open Trivia DB."""
-    base_url = "https://opentdb.com/api.php"
-    params = {"amount": 1}
-    if category:
-        category_map = {
-            "general": 9,
-            "books": 10,
-            "film": 11,
-            "music": 12,
-            "science": 17,
-            "computers": 18,
-            "math": 19,
-            "sports": 21,
-            "geography": 22,
-            "history": 23,
-            "politics": 24,
-            "art": 25,
-            "celebrities": 26,
-            "animals": 27,
-            "vehicles": 28,
-            "comics": 29,
-            "gadgets": 30,
-            "anime": 31,
-            "cartoon": 32
-        }
-        category_id = category_map.get(category.lower())
-        if category_id:
-            params["category"] = category_id
-    response = requests.get(base_url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        return data["results"][0] if data["results"] else None
-    return None
-
-def fetch_random_fact():
-    """Fetch a random fact from Useless Facts API."""
-    response = requests.get("https://uselessfacts.jsph.pl/random.json?language=en")
-    if response.status_code == 200:
-        return response.json().get("text", "No fact found.")
-    return "Couldn't fetch a fact right now."
-
-def fetch_joke():
-    """Fetch a random joke from Official Joke API."""
-    response = requests.get("https://official-joke-api.appspot.com/jokes/random")
-    if response.status_code == 200:
-        joke = response.json()
-        return f"{joke['setup']} - {joke['punchline']}"
-    return "Couldn't fetch a joke right now."
-
-def fetch_quote():
-    """Fetch a random inspirational quote from Quotable API."""
-    response = requests.get("https://api.quotable.io/random")
-    if response.status_code == 200:
-        data = response.json()
-        return f"\"{data['content']}\" - {data['author']}"
-    return "Couldn't fetch a quote right now."
-
-def fetch_random_dog_image():
-    """Fetch a random dog image from Dog CEO API."""
-    response = requests.get("https://dog.ceo/api/breeds/image/random")
-    if response.status_code == 200:
-        return response.json().get("message", "")
-    return ""
-
-def fetch_random_cat_image():
-    """Fetch a random cat image from TheCatAPI."""
-    response = requests.get("https://api.thecatapi.com/v1/images/search")
-    if response.status_code == 200:
-        data = response.json()
-        if data:
-            return data[0].get("url", "")
-    return ""
-
-def fetch_spells():
-    """Fetch spells from Harry Potter API."""
-    response = requests.get("https://hp-api.onrender.com/api/spells")
-    if response.status_code == 200:
-        return response.json()
-    return []
-
-def fetch_random_meal():
-    """Fetch a random meal from TheMealDB."""
-    response = requests.get("https://www.themealdb.com/api/json/v1/1/random.php")
-    if response.status_code == 200:
-        data = response.json()
-        if data.get("meals"):
-            return data["meals"][0]
-    return {}
-
-def fetch_reddit_post(subreddit):
-    """Fetch a random post from a subreddit."""
-    headers = {'User-agent': 'Mozilla/5.0'}
-    response = requests.get(f"https://www.reddit.com/r/{subreddit}/random.json", headers=headers)
-    if response.status_code == 200:
-        data = response.json()
-        if isinstance(data, list) and len(data) > 0:
-            post = data[0]['data']['children'][0]['data']
-            title = post.get("title", "No title")
-            url = post.get("url", "")
-            return title, url
-    return None, None
-
-def fetch_github_user(username):
-    """Fetch GitHub user information."""
-    headers = {}
-    if GITHUB_TOKEN:
-        headers['Authorization'] = f'token {GITHUB_TOKEN}'
-    response = requests.get(f"https://api.github.com/users/{username}", headers=headers)
-    if response.status_code == 200:
-        data = response.json()
-        name = data.get("name", "N/A")
-        bio = data.get("bio", "N/A")
-        repos = data.get("public_repos", 0)
-        followers = data.get("followers", 0)
-        following = data.get("following", 0)
-        avatar = data.get("avatar_url", "")
-        return name, bio, repos, followers, following, avatar
-    return None
-
-def fetch_movie_info(title):
-    """Fetch movie information from OMDB API."""
-    response = requests.get(f"http://www.omdbapi.com/?t={title}&apikey={OMDB_API_KEY}")
-    if response.status_code == 200:
-        data = response.json()
-        if data.get("Response") == "True":
-            title = data.get("Title", "N/A")
-            year = data.get("Year", "N/A")
-            genre = data.get("Genre", "N/A")
-            director = data.get("Director", "N/A")
-            plot = data.get("Plot", "N/A")
-            poster = data.get("Poster", "")
-            return title, year, genre, director, plot, poster
-    return None
-
-def fetch_alpha_vantage_stock(symbol):
-    """Fetch stock price from Alpha Vantage API."""
-    response = requests.get(
-        f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={ALPHA_VANTAGE_API_KEY}"
-    )
-    if response.status_code == 200:
-        data = response.json()
-        quote = data.get("Global Quote", {})
-        price = quote.get("05. price", "N/A")
-        change = quote.get("09. change", "N/A")
-        return price, change
-    return None, None
-
-def fetch_bitcoin_price():
-    """Fetch current Bitcoin price in USD from Coindesk API."""
-    response = requests.get("https://api.coindesk.com/v1/bpi/currentprice/BTC.json")
-    if response.status_code == 200:
-        data = response.json()
-        rate = data["bpi"]["USD"]["rate"]
-        return rate
-    return "Couldn't fetch Bitcoin price right now."
-
-def fetch_nasa_apod():
-    """Fetch NASA Astronomy Picture of the Day."""
-    response = requests.get(f"https://api.nasa.gov/planetary/apod?api_key={NASA_API_KEY}")
-    if response.status_code == 200:
-        data = response.json()
-        title = data.get("title", "N/A")
-        explanation = data.get("explanation", "N/A")
-        url = data.get("url", "")
-        return title, explanation, url
-    return None, None, None
-
-def fetch_tenor_gif(tag="random"):
-    """Fetch a random GIF from Tenor."""
-    response = requests.get(f"https://tenor.googleapis.com/v2/search?q={tag}&key={TENOR_API_KEY}&limit=1")
-    if response.status_code == 200:
-        results = response.json().get("results", [])
-        if results:
-            media = results[0].get("media_formats", {})
-            gif = media.get("gif", {}).get("url")
-            if gif:
-                return gif
-    return None
-
-def fetch_trending_repositories():
-    """Fetch trending repositories from GitHub Trending API."""
-    # Note: GitHub doesn't provide an official trending API. Using a third-party API.
-    response = requests.get("https://ghapi.huchen.dev/repositories?since=daily")
-    if response.status_code == 200:
-        data = response.json()
-        trending_repos = [f"**{repo['name']}** by **{repo['author']}**\n[Repository]({repo['url']})" for repo in data[:5]]
-        return trending_repos
-    return ["Couldn't fetch trending repositories right now."]
-
-def fetch_random_fact_about_number(number):
-    """Fetch a fact about a number from Numbers API."""
-    response = requests.get(f"http://numbersapi.com/{number}/trivia")
-    if response.status_code == 200:
-        return response.text
-    return "Couldn't fetch a number fact right now."
-
-def fetch_random_fortune():
-    """Fetch a random fortune from a static list."""
-    fortunes = [
-        "You will have a great day!",
-        "Success is in your future.",
-        "Adventure awaits you.",
-        "Embrace the challenges ahead.",
-        "A pleasant surprise is waiting for you."
-    ]
-    return random.choice(fortunes)
-
-def fetch_random_meme():
-    """Fetch a random meme from Meme API."""
-    response = requests.get("https://meme-api.herokuapp.com/gimme")
-    if response.status_code == 200:
-        data = response.json()
-        title = data.get("title", "No title")
-        url = data.get("url", "")
-        return title, url
-    return None, None
-
-def fetch_dad_joke():
-    """Fetch a random dad joke from icanhazdadjoke API."""
-    headers = {'Accept': 'application/json'}
-    response = requests.get("https://icanhazdadjoke.com/", headers=headers)
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("joke", "Couldn't fetch a joke right now.")
-    return "Couldn't fetch a joke right now."
-
-def fetch_random_fox_image():
-    """Fetch a random fox image from randomfox.ca."""
-    response = requests.get("https://randomfox.ca/floof/")
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("image", "")
-    return ""
-
-def fetch_inspirational_story():
-    """Fetch an inspirational story from a static list."""
-    inspirational_stories = [
-        "Once upon a time, in a land far, far away, there lived a brave adventurer who overcame all odds to achieve their dreams.",
-        "In the heart of the forest, a small seed grew into a mighty tree, symbolizing resilience and growth.",
-        "Through persistent effort and unwavering determination, she conquered her fears and soared to new heights.",
-        "Against all expectations, the underdog team triumphed, teaching us that perseverance pays off.",
-        "He turned his failures into stepping stones, proving that every setback is a setup for a comeback."
-    ]
-    return random.choice(inspirational_stories)
-
-def fetch_horoscope(sign):
-    """Fetch daily horoscope from Horoscope API."""
-    response = requests.post(f"https://aztro.sameerkumar.website/?sign={sign.lower()}&day=today")
-    if response.status_code == 200:
-        data = response.json()
-        horoscope = data.get("description", "No horoscope found.")
-        return horoscope
-    return "Couldn't fetch horoscope right now."
-
-def fetch_dictionary_definition(word):
-    """Fetch the definition of a word from Dictionary API."""
-    response = requests.get(f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}")
-    if response.status_code == 200:
-        data = response.json()[0]
-        definitions = data["meanings"][0]["definitions"][0]["definition"]
-        example = data["meanings"][0]["definitions"][0].get("example", "No example provided.")
-        return definitions, example
-    return None, None
-
-def fetch_random_activity():
-    """Fetch a random activity suggestion from Bored API."""
-    response = requests.get("https://www.boredapi.com/api/activity/")
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("activity", "Couldn't fetch an activity right now.")
-    return "Couldn't fetch an activity right now."
-
-def fetch_random_music_quote():
-    """Fetch a random music-related quote from a static list."""
-    music_quotes = [
-        "Music is the universal language of mankind. – Henry Wadsworth Longfellow",
-        "Where words fail, music speaks. – Hans Christian Andersen",
-        "Without music, life would be a mistake. – Friedrich Nietzsche",
-        "One good thing about music, when it hits you, you feel no pain. – Bob Marley",
-        "Music expresses that which cannot be said and on which it is impossible to be silent. – Victor Hugo"
-    ]
-    return random.choice(music_quotes)
-
-def fetch_random_art_quote():
-    """Fetch a random art-related quote from a static list."""
-    art_quotes = [
-        "Every artist was first an amateur. – Ralph Waldo Emerson",
-        "Art is not what you see, but what you make others see. – Edgar Degas",
-        "Creativity takes courage. – Henri Matisse",
-        "Art enables us to find ourselves and lose ourselves at the same time. – Thomas Merton",
-        "The purpose of art is washing the dust of daily life off our souls. – Pablo Picasso"
-    ]
-    return random.choice(art_quotes)
-
-def fetch_random_math_fact():
-    """Fetch a random math fact from a static list."""
-    math_facts = [
-        "Zero is the only number that cannot be represented by Roman numerals.",
-        "A triangle has three sides, a square has four.",
-        "The number pi is irrational.",
-        "There are infinitely many prime numbers.",
-        "Euler's identity is considered the most beautiful theorem in mathematics."
-    ]
-    return random.choice(math_facts)
-
-def fetch_random_geography_fact():
-    """Fetch a random geography fact from a static list."""
-    geography_facts = [
-        "Canada has the longest coastline in the world.",
-        "Russia is the largest country by area.",
-        "There are seven continents on Earth.",
-        "The Amazon River is the largest by discharge volume.",
-        "Mount Everest is the highest mountain above sea level."
-    ]
-    return random.choice(geography_facts)
-
-def fetch_random_politics_fact():
-    """Fetch a random politics fact from a static list."""
-    politics_facts = [
-        "The United Nations has 193 member states.",
-        "The first female Prime Minister was Sirimavo Bandaranaike of Sri Lanka.",
-        "The term 'democracy' comes from the Greek words 'demos' and 'kratos'.",
-        "There are over 200 recognized political systems globally.",
-        "The longest-serving head of state was King Bhumibol Adulyadej of Thailand."
-    ]
-    return random.choice(politics_facts)
-
-def fetch_random_computer_fact():
-    """Fetch a random computer fact from a static list."""
-    computer_facts = [
-        "The first computer bug was a moth trapped in a Harvard Mark II computer.",
-        "The QWERTY keyboard was designed to prevent typewriter jams.",
-        "The first computer virus was created in 1983.",
-        "Approximately 90% of the world's data has been created in the last two years.",
-        "The term 'debugging' was popularized by Grace Hopper."
-    ]
-    return random.choice(computer_facts)
-
-def fetch_random_cinema_fact():
-    """Fetch a random cinema fact from a static list."""
-    cinema_facts = [
-        "The first feature-length film was 'The Story of the Kelly Gang' (1906).",
-        "Avatar is the highest-grossing film of all time.",
-        "Gone with the Wind was the first film to earn over $1 billion.",
-        "The silent film era lasted from the late 1890s to the late 1920s.",
-        "Pixar's 'Toy Story' was the first entirely computer-animated feature film."
-    ]
-    return random.choice(cinema_facts)
-
-def fetch_random_religion_fact():
-    """Fetch a random religion fact from a static list."""
-    religion_facts = [
-        "There are over 4,000 religions in the world.",
-        "Buddhism originated in India around the 5th century BCE.",
-        "Christianity is the largest religion globally.",
-        "Islam was founded in the 7th century CE in Mecca.",
-        "Hinduism is the oldest living religion."
-    ]
-    return random.choice(religion_facts)
-
-def fetch_random_physics_fact():
-    """Fetch a random physics fact from a static list."""
-    physics_facts = [
-        "Light can behave both as a wave and as a particle.",
-        "Einstein's theory of relativity revolutionized physics.",
-        "Quantum entanglement is a phenomenon where particles remain connected.",
-        "The speed of light is approximately 299,792 kilometers per second.",
-        "Black holes are regions in space with gravitational pulls so strong that nothing can escape."
-    ]
-    return random.choice(physics_facts)
-
-def fetch_random_technology_fact():
-    """Fetch a random technology fact from a static list."""
-    technology_facts = [
-        "The first computer was invented in the 1940s.",
-        "The internet was initially developed for military use.",
-        "Over 3 billion people use the internet worldwide.",
-        "Artificial Intelligence is a rapidly growing field in technology.",
-        "Blockchain technology underpins cryptocurrencies like Bitcoin."
-    ]
-    return random.choice(technology_facts)
-
-def fetch_random_environment_fact():
-    """Fetch a random environment fact from a static list."""
-    environment_facts = [
-        "The Amazon rainforest produces over 20% of the world's oxygen.",
-        "Plastic pollution is one of the biggest threats to marine life.",
-        "Renewable energy sources are crucial for combating climate change.",
-        "Deforestation contributes to the loss of biodiversity.",
-        "Recycling helps reduce greenhouse gas emissions."
-    ]
-    return random.choice(environment_facts)
-
-def fetch_random_entertainment_fact():
-    """Fetch a random entertainment fact from a static list."""
-    entertainment_facts = [
-        "The Grammy Awards were established in 1959.",
-        "The Oscars statuette is made of gold-plated britannium.",
-        "MTV was launched on August 1, 1981.",
-        "The Super Bowl is one of the most-watched sporting events in the US.",
-        "Broadway in New York City is known for its theater productions."
-    ]
-    return random.choice(entertainment_facts)
-
-def fetch_random_fashion_fact():
-    """Fetch a random fashion fact from a static list."""
-    fashion_facts = [
-        "The little black dress became popular thanks to Coco Chanel.",
-        "Blue jeans were invented by Levi Strauss in the 1870s.",
-        "The first fashion magazine was published in Germany in 1586.",
-        "Heels were originally worn by men in the 10th century.",
-        "Nike is one of the largest sportswear brands in the world."
-    ]
-    return random.choice(fashion_facts)
-
-def fetch_random_lifestyle_fact():
-    """Fetch a random lifestyle fact from a static list."""
-    lifestyle_facts = [
-        "Meditation can reduce stress and improve focus.",
-        "A balanced diet is essential for maintaining good health.",
-        "Regular exercise boosts mental and physical well-being.",
-        "Adequate sleep is crucial for overall health.",
-        "Hydration plays a key role in bodily functions."
-    ]
-    return random.choice(lifestyle_facts)
-
-def fetch_random_animals_fact():
-    """Fetch a random animals fact from a static list."""
-    animals_facts = [
-        "Honey never spoils. Archaeologists have found pots of honey in ancient Egyptian tombs that are over 3,000 years old and still edible.",
-        "A group of flamingos is called a 'flamboyance'.",
-        "Octopuses have three hearts.",
-        "Dolphins have names for each other.",
-        "Elephants are the only animals that can't jump."
-    ]
-    return random.choice(animals_facts)
-
-def fetch_random_artistic_fact():
-    """Fetch a random artistic fact from a static list."""
-    artistic_facts = [
-        "Leonardo da Vinci could write with one hand and draw with the other simultaneously.",
-        "Vincent van Gogh only sold one painting during his lifetime.",
-        "The Mona Lisa has no eyebrows. It was the fashion in Renaissance Florence to shave them off.",
-        "The word 'palette' comes from the Italian word for a small shovel used by artists.",
-        "Pablo Picasso could draw before he could walk."
-    ]
-    return random.choice(artistic_facts)
-
-def fetch_random_philosophy_fact():
-    """Fetch a random philosophy fact from a static list."""
-    philosophy_facts = [
-        "Socrates never wrote down his teachings; all knowledge of his philosophy comes from his students.",
-        "Plato founded the first institution of higher learning in the Western world.",
-        "Aristotle tutored Alexander the Great.",
-        "Immanuel Kant never traveled more than 10 miles from his hometown.",
-        "Friedrich Nietzsche declared 'God is dead' in his works."
-    ]
-    return random.choice(philosophy_facts)
-
-def fetch_random_game_fact():
-    """Fetch a random game fact from a static list."""
-    game_facts = [
-        "The first video game ever created was 'Tennis for Two' in 1958.",
-        "Pac-Man was originally called 'Puck-Man', but was changed to avoid vandalism.",
-        "The character Mario was named after the landlord of Nintendo's warehouse in Brooklyn.",
-        "The iconic Konami Code (↑ ↑ ↓ ↓ ← → ← → B A) was first used in the game Gradius.",
-        "Minecraft is the best-selling video game of all time."
-    ]
-    return random.choice(game_facts)
-
-def fetch_random_comic():
-    """Fetch a random xkcd comic."""
-    latest_comic_num = get_latest_comic_number()
-    if latest_comic_num:
-        random_num = random.randint(1, latest_comic_num)
-        response = requests.get(f"https://xkcd.com/{random_num}/info.0.json")
-        if response.status_code == 200:
-            data = response.json()
-            title = data.get("title", "N/A")
-            img = data.get("img", "")
-            alt = data.get("alt", "")
-            return title, img, alt
-    return None, None, None
-
-def get_latest_comic_number():
-    """Get the latest xkcd comic number."""
-    response = requests.get("https://xkcd.com/info.0.json")
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("num")
-    return None
-
-def fetch_random_book():
-    """Fetch a random book from Open Library API."""
-    response = requests.get("https://openlibrary.org/random.json?count=1")
-    if response.status_code == 200:
-        data = response.json()
-        title = data.get("title", "N/A")
-        authors = ", ".join([author.get("name", "Unknown") for author in data.get("authors", [])])
-        description = data.get("description", {}).get("value", "No description available.") if isinstance(data.get("description"), dict) else data.get("description", "No description available.")
-        return title, authors, description
-    return None, None, None
-
-def fetch_random_pokemon():
-    """Fetch a random Pokémon from PokéAPI."""
-    pokemon_id = random.randint(1, 898)  # As of now, there are 898 Pokémon
-    response = requests.get(f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}")
-    if response.status_code == 200:
-        data = response.json()
-        name = data.get("name", "N/A").title()
-        image = data["sprites"]["front_default"]
-        types = ", ".join([t["type"]["name"].title() for t in data.get("types", [])])
-        return name, image, types
-    return None, None, None
-
-def fetch_random_color():
-    """Fetch a random color from The Color API."""
-    response = requests.get("https://www.thecolorapi.com/id?format=json&hex=random")
-    if response.status_code == 200:
-        data = response.json()
-        name = data.get("name", {}).get("value", "N/A")
-        hex_code = f"#{data.get('hex', {}).get('value', '000000')}"
-        return name, hex_code
-    return None, None
-
-def fetch_random_weather_fact():
-    """Fetch a random weather fact from a static list."""
-    weather_facts = [
-        "Lightning strikes the Earth about 100 times every second.",
-        "The highest temperature ever recorded on Earth was 56.7°C (134°F) in Death Valley, USA.",
-        "A single hurricane can release energy equivalent to a 10-megaton nuclear bomb every 20 minutes.",
-        "Rainbows can only be seen when the sun is less than 42 degrees above the horizon.",
-        "The coldest temperature ever recorded on Earth was -89.2°C (-128.6°F) in Antarctica."
-    ]
-    return random.choice(weather_facts)
-
-def fetch_random_space_fact():
-    """Fetch a random space fact from a static list."""
-    space_facts = [
-        "A day on Venus is longer than a year on Venus.",
-        "There are more stars in the universe than grains of sand on all the beaches on Earth.",
-        "Neutron stars are so dense that a sugar-cube-sized amount would weigh about a billion tons.",
-        "The largest volcano in the solar system is Olympus Mons on Mars.",
-        "Space is completely silent; there is no atmosphere for sound to travel through."
-    ]
-    return random.choice(space_facts)
-
-def fetch_random_career_advice():
-    """Fetch a random career advice from a static list."""
-    career_advice = [
-        "Always be willing to learn new skills.",
-        "Network with professionals in your field.",
-        "Set clear and achievable goals.",
-        "Seek feedback to improve your performance.",
-        "Maintain a healthy work-life balance."
-    ]
-    return random.choice(career_advice)
-
-def fetch_random_health_tip():
-    """Fetch a random health tip from a static list."""
-    health_tips = [
-        "Drink at least 8 glasses of water a day.",
-        "Incorporate regular exercise into your routine.",
-        "Eat a balanced diet rich in fruits and vegetables.",
-        "Ensure you get 7-9 hours of sleep each night.",
-        "Practice mindfulness or meditation to reduce stress."
-    ]
-    return random.choice(health_tips)
-
-def fetch_random_travel_tip():
-    """Fetch a random travel tip from a static list."""
-    travel_tips = [
-        "Always have a digital and physical copy of your important documents.",
-        "Learn a few basic phrases in the local language.",
-        "Keep your valuables secure and be aware of your surroundings.",
-        "Pack light and versatile clothing.",
-        "Research your destination's culture and customs beforehand."
-    ]
-    return random.choice(travel_tips)
-
-def fetch_random_sports_fact():
-    """Fetch a random sports fact from a static list."""
-    sports_facts = [
-        "The Olympic Games were originally a religious festival in honor of Zeus.",
-        "Basketball was invented by Dr. James Naismith in 1891.",
-        "The FIFA World Cup is the most widely viewed sporting event in the world.",
-        "Golf is the only sport to have been played on the moon.",
-        "The fastest goal in soccer history was scored just 2.8 seconds after kickoff."
-    ]
-    return random.choice(sports_facts)
-
-def fetch_random_science_fact():
-    """Fetch a random science fact from a static list."""
-    science_facts = [
-        "Water can boil and freeze at the same time under the right conditions, a phenomenon known as the triple point.",
-        "Bananas are berries, but strawberries are not.",
-        "Sound travels five times faster in water than in air.",
-        "There are more possible iterations of a game of chess than there are atoms in the known universe.",
-        "Venus spins clockwise, making it the only planet that rotates in this direction."
-    ]
-    return random.choice(science_facts)
-
-def fetch_random_history_fact():
-    """Fetch a random history fact from a static list."""
-    history_facts = [
-        "The Great Wall of China is not visible from space with the naked eye.",
-        "Cleopatra lived closer in time to the moon landing than to the construction of the Great Pyramid of Giza.",
-        "The shortest war in history lasted only 38 minutes between Britain and Zanzibar in 1896.",
-        "Oxford University is older than the Aztec Empire.",
-        "The first programmable computer was created in 1936 by Konrad Zuse."
-    ]
-    return random.choice(history_facts)
-
-def fetch_random_literature_fact():
-    """Fetch a random literature fact from a static list."""
-    literature_facts = [
-        "William Shakespeare introduced over 1,700 words to the English language.",
-        "The longest novel ever written is 'In Search of Lost Time' by Marcel Proust.",
-        "Agatha Christie is the best-selling novelist of all time.",
-        "The first printed book was the Diamond Sutra in 868 AD.",
-        "George Orwell's real name was Eric Arthur Blair."
-    ]
-    return random.choice(literature_facts)
-
-# Interactive Views
-
-class TriviaView(View):
-    def __init__(self, correct_answer, options):
-        super().__init__(timeout=60)
-        self.correct_answer = correct_answer
-        self.options = options
-
-        for option in options:
-            button = Button(label=option, style=discord.ButtonStyle.primary)
-            button.callback = self.create_callback(option)
-            self.add_item(button)
-
-    def create_callback(self, selected_option):
-        async def callback(interaction: discord.Interaction):
-            if selected_option == self.correct_answer:
-                content = f"✅ Correct! The answer was: **{self.correct_answer}**"
-            else:
-                content = f"❌ Incorrect! The correct answer was: **{self.correct_answer}**"
-
-            # Disable all buttons after answer
-            for child in self.children:
-                child.disabled = True
-
-            await interaction.response.edit_message(content=content, view=self)
-            self.stop()
-
-        return callback
-
-    async def on_timeout(self):
-        # Disable all buttons on timeout
-        for child in self.children:
-            child.disabled = True
-        if hasattr(self, 'message'):
-            await self.message.edit(content="⏰ Time's up! You didn't answer in time.", view=self)
-
-class HelpView(View):
-    def __init__(self, embeds):
-        super().__init__(timeout=180)
-        self.embeds = embeds
-        self.current = 0
-
-        # Previous Button
-        self.previous_button = Button(label="Previous", style=discord.ButtonStyle.secondary)
-        self.previous_button.callback = self.previous_page
-        self.add_item(self.previous_button)
-
-        # Next Button
-        self.next_button = Button(label="Next", style=discord.ButtonStyle.secondary)
-        self.next_button.callback = self.next_page
-        self.add_item(self.next_button)
-
-    async def previous_page(self, interaction: discord.Interaction):
-        if self.current > 0:
-            self.current -= 1
-            await interaction.response.edit_message(embed=self.embeds[self.current], view=self)
-
-    async def next_page(self, interaction: discord.Interaction):
-        if self.current < len(self.embeds) - 1:
-            self.current += 1
-            await interaction.response.edit_message(embed=self.embeds[self.current], view=self)
-
-    async def on_timeout(self):
-        # Disable buttons on timeout
-        for child in self.children:
-            child.disabled = True
-        if hasattr(self, 'message'):
-            await self.message.edit(view=self)
-
-# Enforced Registration Decorator
-def is_registered():
-    async def predicate(ctx):
-        user_data = load_user_data()
-        return str(ctx.author.id) in user_data
-    return commands.check(predicate)
-
-# Commands
-
-# 1. About Command
-@bot.command(name="about", help="Get information about the bot. Usage: !about")
-async def about(ctx):
-    # Fetch GitHub user data
-    github_username = "polarxcised"
-    github_data = fetch_github_user(github_username)
-
-    if github_data:
-        name, bio, repos, followers, following, avatar = github_data
-        embed = discord.Embed(
-            title="🤖 About InfoNexus",
-            description="Welcome to InfoNexus! I'm your ultimate Discord companion, here to provide you with a wealth of information, fun facts, and interactive experiences.",
-            color=discord.Color.blue()
-        )
-        embed.set_author(name=name, url=f"https://github.com/{github_username}", icon_url=avatar)
-        embed.add_field(
-            name="⭐ Star Our Project",
-            value="If you enjoy using me, please consider starring our GitHub repository!",
-            inline=False
-        )
-        embed.add_field(
-            name="💻 GitHub Repository",
-            value="[InfoNexus-discord-bot](https://github.com/polarxcised/InfoNexus-discord-bot)",
-            inline=False
-        )
-        embed.add_field(
-            name="📊 GitHub Stats",
-            value=f"**Public Repos:** {repos}\n**Followers:** {followers}\n**Following:** {following}",
-            inline=False
-        )
-        embed.set_thumbnail(url=avatar)
-        github_logo_url = "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png"
-        embed.set_footer(text="Thank you for using InfoNexus!", icon_url=github_logo_url)
-        await ctx.send(embed=embed)
-    else:
-        embed = discord.Embed(
-            title="🤖 About InfoNexus",
-            description="Welcome to InfoNexus! I'm your ultimate Discord companion, here to provide you with a wealth of information, fun facts, and interactive experiences.",
-            color=discord.Color.blue()
-        )
-        embed.add_field(
-            name="⭐ Star Our Project",
-            value="If you enjoy using me, please consider starring our GitHub repository!",
-            inline=False
-        )
-        embed.add_field(
-            name="💻 GitHub Repository",
-            value="[InfoNexus-discord-bot](https://github.com/polarxcised/InfoNexus-discord-bot)",
-            inline=False
-        )
-        embed.set_footer(text="Thank you for using InfoNexus!", icon_url=github_logo_url)
-        await ctx.send(embed=embed)
-
-# 2. Register Command
-@bot.command(name="register", help="Register yourself to use the bot. Usage: !register <username>")
-async def register(ctx, username: str = None):
-    if not username:
-        await ctx.send("❗ Please provide a username. Usage: `!register <username>`")
-        return
-    user_data = load_user_data()
-    user_data[str(ctx.author.id)] = {
-        "username": username,
-        "registered_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    }
-    save_user_data(user_data)
-    embed = discord.Embed(
-        title="✅ Registration Successful!",
-        description=f"Welcome, **{username}**! You can now access all the bot's features.",
-        color=discord.Color.green()
-    )
-    await ctx.send(embed=embed)
-
-# 3. Trivia
-@bot.command(name="trivia", help="Start a trivia game. Usage: !trivia [category]")
-@is_registered()
-async def trivia(ctx, category: str = "general"):
-    question = fetch_trivia_question(category)
-    if question:
-        embed = discord.Embed(
-            title="🎯 Trivia Time!",
-            description=question["question"],
-            color=discord.Color.blue()
-        )
-        answers = question["incorrect_answers"] + [question["correct_answer"]]
-        random.shuffle(answers)
-        view = TriviaView(question["correct_answer"], answers)
-        embed.add_field(name="Choose the correct answer:", value="Click one of the buttons below.", inline=False)
-        message = await ctx.send(embed=embed, view=view)
-        view.message = message  # Reference for timeout handling
-    else:
-        await ctx.send("❗ Couldn't fetch a trivia question right now.")
-
-# 4. Random Fact
-@bot.command(name="fact", help="Get a random fact. Usage: !fact")
-@is_registered()
-async def fact(ctx):
-    random_fact = fetch_random_fact()
-    embed = discord.Embed(
-        title="🤔 Random Fact",
-        description=random_fact,
-        color=discord.Color.green()
-    )
-    await ctx.send(embed=embed)
-
-# 5. Joke
-@bot.command(name="joke", help="Get a random joke. Usage: !joke")
-@is_registered()
-async def joke(ctx):
-    joke_text = fetch_joke()
-    embed = discord.Embed(
-        title="😂 Here's a Joke for You!",
-        description=joke_text,
-        color=discord.Color.gold()
-    )
-    await ctx.send(embed=embed)
-
-# 6. Quote
-@bot.command(name="quote", help="Get a random inspirational quote. Usage: !quote")
-@is_registered()
-async def quote(ctx):
-    quote_text = fetch_quote()
-    embed = discord.Embed(
-        title="🌟 Inspirational Quote",
-        description=quote_text,
-        color=discord.Color.purple()
-    )
-    await ctx.send(embed=embed)
-
-# 7. Dog Image
-@bot.command(name="dog", help="Get a random dog image. Usage: !dog")
-@is_registered()
-async def dog(ctx):
-    image_url = fetch_random_dog_image()
-    if image_url:
-        embed = discord.Embed(
-            title="🐶 Here's a Cute Dog for You!",
-            color=discord.Color.brown()
-        ).set_image(url=image_url)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a dog image right now.")
-
-# 8. Cat Image
-@bot.command(name="cat", help="Get a random cat image. Usage: !cat")
-@is_registered()
-async def cat(ctx):
-    image_url = fetch_random_cat_image()
-    if image_url:
-        embed = discord.Embed(
-            title="🐱 Here's a Cute Cat for You!",
-            color=discord.Color.dark_purple()
-        ).set_image(url=image_url)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a cat image right now.")
-
-# 9. Spell (Harry Potter)
-@bot.command(name="spell", help="Get a random Harry Potter spell. Usage: !spell")
-@is_registered()
-async def spell(ctx):
-    spells = fetch_spells()
-    if spells:
-        spell = random.choice(spells)
-        embed = discord.Embed(
-            title=f"🔮 {spell['name']}",
-            description=spell['description'],
-            color=discord.Color.purple()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a spell right now.")
-
-# 10. Meal
-@bot.command(name="meal", help="Get a random meal. Usage: !meal")
-@is_registered()
-async def meal(ctx):
-    meal = fetch_random_meal()
-    if meal:
-        embed = discord.Embed(
-            title=f"🍽️ {meal['strMeal']}",
-            description=f"Cuisine: {meal['strArea']}\nCategory: {meal['strCategory']}",
-            color=discord.Color.orange()
-        ).set_image(url=meal['strMealThumb'])
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a meal right now.")
-
-# 11. Reddit Post
-@bot.command(name="reddit", help="Get a random post from a subreddit. Usage: !reddit <subreddit>")
-@is_registered()
-async def reddit(ctx, subreddit: str = None):
-    if not subreddit:
-        await ctx.send("❗ Please specify a subreddit. Usage: `!reddit <subreddit>`")
-        return
-    title, url = fetch_reddit_post(subreddit)
-    if title and url:
-        embed = discord.Embed(
-            title=title,
-            url=url,
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a Reddit post. Please check the subreddit name.")
-
-# 12. GitHub User Info
-@bot.command(name="github", help="Get GitHub user information. Usage: !github <username>")
-@is_registered()
-async def github(ctx, username: str = None):
-    if not username:
-        await ctx.send("❗ Please specify a GitHub username. Usage: `!github <username>`")
-        return
-    result = fetch_github_user(username)
-    if result:
-        name, bio, repos, followers, following, avatar = result
-        embed = discord.Embed(
-            title=f"👤 GitHub User: {username}",
-            description=bio,
-            color=discord.Color.dark_blue()
-        )
-        embed.set_thumbnail(url=avatar)
-        embed.add_field(name="Name", value=name, inline=True)
-        embed.add_field(name="Public Repos", value=repos, inline=True)
-        embed.add_field(name="Followers", value=followers, inline=True)
-        embed.add_field(name="Following", value=following, inline=True)
-        embed.add_field(name="Profile", value=f"[GitHub Profile](https://github.com/{username})", inline=False)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch GitHub user information. Please check the username.")
-
-# 13. Movie Information
-@bot.command(name="movie", help="Get information about a movie. Usage: !movie <movie name>")
-@is_registered()
-async def movie(ctx, *, title: str = None):
-    if not title:
-        await ctx.send("❗ Please specify a movie title. Usage: `!movie <movie name>`")
-        return
-    result = fetch_movie_info(title)
-    if result:
-        title, year, genre, director, plot, poster = result
-        embed = discord.Embed(
-            title=f"{title} ({year})",
-            description=plot,
-            color=discord.Color.dark_gold()
-        )
-        embed.add_field(name="Genre", value=genre, inline=True)
-        embed.add_field(name="Director", value=director, inline=True)
-        if poster and poster != "N/A":
-            embed.set_thumbnail(url=poster)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch movie information. Please check the movie title.")
-
-# 14. Stock Price
-@bot.command(name="stock", help="Get current stock price. Usage: !stock <symbol>")
-@is_registered()
-async def stock(ctx, symbol: str = None):
-    if not symbol:
-        await ctx.send("❗ Please specify a stock symbol. Usage: `!stock <symbol>`")
-        return
-    price, change = fetch_alpha_vantage_stock(symbol)
-    if price and change:
-        embed = discord.Embed(
-            title=f"📈 Stock: {symbol.upper()}",
-            description=f"**Price:** ${price}\n**Change:** {change}",
-            color=discord.Color.dark_blue()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch stock information. Please check the symbol.")
-
-# 15. Bitcoin Price
-@bot.command(name="bitcoin", help="Get the current Bitcoin price in USD. Usage: !bitcoin")
-@is_registered()
-async def bitcoin(ctx):
-    price = fetch_bitcoin_price()
-    if price:
-        embed = discord.Embed(
-            title="💰 Bitcoin Price",
-            description=f"Current Bitcoin price: **${price} USD**",
-            color=discord.Color.gold()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch Bitcoin price right now.")
-
-# 16. NASA APOD
-@bot.command(name="nasa_apod", help="Get NASA's Astronomy Picture of the Day. Usage: !nasa_apod")
-@is_registered()
-async def nasa_apod(ctx):
-    title, explanation, url = fetch_nasa_apod()
-    if title and explanation and url:
-        embed = discord.Embed(
-            title=f"🪐 NASA Astronomy Picture of the Day: {title}",
-            description=explanation,
-            color=discord.Color.dark_blue()
-        ).set_image(url=url)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch NASA APOD right now.")
-
-# 17. Random GIF
-@bot.command(name="gif", help="Get a random GIF. Usage: !gif <tag>")
-@is_registered()
-async def gif(ctx, *, tag: str = "random"):
-    gif_url = fetch_tenor_gif(tag)
-    if gif_url:
-        embed = discord.Embed(
-            title=f"🎬 Random GIF - {tag.title()}",
-            color=discord.Color.pink()
-        ).set_image(url=gif_url)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a GIF right now.")
-
-# 18. Trending Repositories
-@bot.command(name="trending_repos", help="Get trending GitHub repositories. Usage: !trending_repos")
-@is_registered()
-async def trending_repos(ctx):
-    trending = fetch_trending_repositories()
-    if trending:
-        embed = discord.Embed(
-            title="📈 Trending GitHub Repositories",
-            description="\n\n".join(trending),
-            color=discord.Color.dark_blue()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch trending repositories right now.")
-
-# 19. Number Fact
-@bot.command(name="number_fact", help="Get a fact about a number. Usage: !number_fact <number>")
-@is_registered()
-async def number_fact(ctx, number: int = None):
-    if number is None:
-        await ctx.send("❗ Please specify a number. Usage: `!number_fact <number>`")
-        return
-    fact = fetch_random_fact_about_number(number)
-    embed = discord.Embed(
-        title=f"🔢 Number Fact: {number}",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 20. Fortune
-@bot.command(name="fortune", help="Get a random fortune. Usage: !fortune")
-@is_registered()
-async def fortune(ctx):
-    fortune_text = fetch_random_fortune()
-    embed = discord.Embed(
-        title="🔮 Your Fortune",
-        description=fortune_text,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 21. Meme
-@bot.command(name="meme", help="Get a random meme. Usage: !meme")
-@is_registered()
-async def meme(ctx):
-    title, url = fetch_random_meme()
-    if title and url:
-        embed = discord.Embed(
-            title=title,
-            color=discord.Color.purple()
-        ).set_image(url=url)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a meme right now.")
-
-# 22. Dad Joke
-@bot.command(name="dad_joke", help="Get a random dad joke. Usage: !dad_joke")
-@is_registered()
-async def dad_joke(ctx):
-    joke = fetch_dad_joke()
-    embed = discord.Embed(
-        title="👨‍🦳 Dad Joke",
-        description=joke,
-        color=discord.Color.orange()
-    )
-    await ctx.send(embed=embed)
-
-# 23. Fox Image
-@bot.command(name="fox", help="Get a random fox image. Usage: !fox")
-@is_registered()
-async def fox(ctx):
-    image_url = fetch_random_fox_image()
-    if image_url:
-        embed = discord.Embed(
-            title="🦊 Here's a Cute Fox for You!",
-            color=discord.Color.dark_gray()
-        ).set_image(url=image_url)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a fox image right now.")
-
-# 24. Inspirational Story
-@bot.command(name="story", help="Get an inspirational story. Usage: !story")
-@is_registered()
-async def story(ctx):
-    story_text = fetch_inspirational_story()
-    embed = discord.Embed(
-        title="📖 Inspirational Story",
-        description=story_text,
-        color=discord.Color.orange()
-    )
-    await ctx.send(embed=embed)
-
-# 25. Horoscope
-@bot.command(name="horoscope", help="Get today's horoscope. Usage: !horoscope <sign>")
-@is_registered()
-async def horoscope(ctx, sign: str = None):
-    if not sign:
-        await ctx.send("❗ Please specify your zodiac sign. Usage: `!horoscope <sign>`")
-        return
-    horoscope_text = fetch_horoscope(sign)
-    if horoscope_text:
-        embed = discord.Embed(
-            title=f"🔮 Today's Horoscope for {sign.title()}",
-            description=horoscope_text,
-            color=discord.Color.dark_purple()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch horoscope. Please check the zodiac sign.")
-
-# 26. Binary Converter
-@bot.command(name="binary", help="Convert text to binary. Usage: !binary <text>")
-@is_registered()
-async def binary(ctx, *, text: str = None):
-    if not text:
-        await ctx.send("❗ Please provide text to convert. Usage: `!binary <text>`")
-        return
-    binary = ' '.join(format(ord(char), '08b') for char in text)
-    embed = discord.Embed(
-        title="🔤 Binary Converter",
-        description=f"**Text:** {text}\n**Binary:** {binary}",
-        color=discord.Color.blue()
-    )
-    await ctx.send(embed=embed)
-
-# 27. Morse Code Converter
-@bot.command(name="morse", help="Convert text to Morse code. Usage: !morse <text>")
-@is_registered()
-async def morse(ctx, *, text: str = None):
-    MORSE_CODE_DICT = {
-        'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.', 'F': '..-.',
-        'G': '--.', 'H': '....', 'I': '..', 'J': '.---', 'K': '-.-', 'L': '.-..',
-        'M': '--', 'N': '-.', 'O': '---', 'P': '.--.', 'Q': '--.-', 'R': '.-.',
-        'S': '...', 'T': '-', 'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-',
-        'Y': '-.--', 'Z': '--..',
-        '0': '-----', '1': '.----', '2': '..---', '3': '...--', '4': '....-',
-        '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
-        ' ': '/'
-    }
-    if not text:
-        await ctx.send("❗ Please provide text to convert. Usage: `!morse <text>`")
-        return
-    morse = ' '.join(MORSE_CODE_DICT.get(char.upper(), '') for char in text)
-    embed = discord.Embed(
-        title="📡 Morse Code Converter",
-        description=f"**Text:** {text}\n**Morse Code:** {morse}",
-        color=discord.Color.dark_purple()
-    )
-    await ctx.send(embed=embed)
-
-# 28. Reverse Text
-@bot.command(name="reverse_text", help="Reverse the provided text. Usage: !reverse_text <text>")
-@is_registered()
-async def reverse_text(ctx, *, text: str = None):
-    if not text:
-        await ctx.send("❗ Please provide text to reverse. Usage: `!reverse_text <text>`")
-        return
-    reversed_text = text[::-1]
-    embed = discord.Embed(
-        title="🔄 Reverse Text",
-        description=f"**Original:** {text}\n**Reversed:** {reversed_text}",
-        color=discord.Color.dark_red()
-    )
-    await ctx.send(embed=embed)
-
-# 29. Unshorten URL
-@bot.command(name="unshorten", help="Unshorten a shortened URL. Usage: !unshorten <url>")
-@is_registered()
-async def unshorten(ctx, url: str = None):
-    if not url:
-        await ctx.send("❗ Please provide a URL to unshorten. Usage: `!unshorten <url>`")
-        return
-    try:
-        response = requests.head(url, allow_redirects=True, timeout=10)
-        final_url = response.url
-        embed = discord.Embed(
-            title="🔗 URL Unshortener",
-            description=f"**Shortened URL:** {url}\n**Original URL:** {final_url}",
-            color=discord.Color.teal()
-        )
-        await ctx.send(embed=embed)
-    except Exception as e:
-        await ctx.send("❗ Couldn't unshorten the URL. Please check the URL and try again.")
-
-# 30. Magic 8-Ball
-@bot.command(name="8ball", help="Ask the magic 8-ball a question. Usage: !8ball <question>")
-@is_registered()
-async def eight_ball(ctx, *, question: str = None):
-    if not question:
-        await ctx.send("❗ Please ask a question. Usage: `!8ball <question>`")
-        return
-    responses = [
-        "Yes!", "No!", "Maybe.", "Ask again later.", "Certainly!", "I don't think so.",
-        "Absolutely!", "Not sure.", "Definitely not.", "It is certain."
-    ]
-    answer = random.choice(responses)
-    embed = discord.Embed(
-        title="🎱 Magic 8-Ball",
-        description=f"**Question:** {question}\n**Answer:** {answer}",
-        color=discord.Color.dark_gold()
-    )
-    await ctx.send(embed=embed)
-
-# 31. Reminder
-@bot.command(name="reminder", help="Set a reminder. Usage: !reminder <time_in_seconds> <message>")
-@is_registered()
-async def reminder(ctx, time_seconds: int = None, *, message: str = None):
-    if time_seconds is None or message is None:
-        await ctx.send("❗ Please provide time in seconds and a message. Usage: `!reminder <time_in_seconds> <message>`")
-        return
-    await ctx.send(f"⏰ Reminder set for {time_seconds} seconds from now.")
-    await asyncio.sleep(time_seconds)
-    await ctx.send(f"🔔 **Reminder:** {message}")
-
-# 32. Poll
-@bot.command(name="poll", help="Create a poll. Usage: !poll <question>")
-@is_registered()
-async def poll(ctx, *, question: str = None):
-    if not question:
-        await ctx.send("❗ Please provide a poll question. Usage: `!poll <question>`")
-        return
-    embed = discord.Embed(
-        title="📊 New Poll",
-        description=question,
-        color=discord.Color.blue()
-    )
-    message = await ctx.send(embed=embed)
-    await message.add_reaction("👍")
-    await message.add_reaction("👎")
-
-# 33. Server Info
-@bot.command(name="serverinfo", help="Get information about the server. Usage: !serverinfo")
-@is_registered()
-async def serverinfo(ctx):
-    guild = ctx.guild
-    embed = discord.Embed(
-        title=f"📋 Server Info - {guild.name}",
-        description=guild.description or "No description.",
-        color=discord.Color.blue()
-    )
-    embed.add_field(name="Owner", value=str(guild.owner), inline=True)
-    embed.add_field(name="Region", value=str(guild.region), inline=True)
-    embed.add_field(name="Member Count", value=guild.member_count, inline=True)
-    embed.add_field(name="Roles", value=len(guild.roles), inline=True)
-    if guild.icon:
-        embed.set_thumbnail(url=guild.icon.url)
-    await ctx.send(embed=embed)
-
-# 34. User Info
-@bot.command(name="userinfo", help="Get information about a user. Usage: !userinfo <@user>")
-@is_registered()
-async def userinfo(ctx, member: discord.Member = None):
-    member = member or ctx.author
-    embed = discord.Embed(
-        title=f"👤 User Info - {member}",
-        color=discord.Color.blue()
-    )
-    embed.add_field(name="ID", value=member.id, inline=False)
-    embed.add_field(name="Joined Server", value=member.joined_at.strftime("%Y-%m-%d"), inline=False)
-    embed.add_field(name="Account Created", value=member.created_at.strftime("%Y-%m-%d"), inline=False)
-    if member.avatar:
-        embed.set_thumbnail(url=member.avatar.url)
-    await ctx.send(embed=embed)
-
-# 35. Avatar
-@bot.command(name="avatar", help="Get a user's avatar. Usage: !avatar <@user>")
-@is_registered()
-async def avatar(ctx, member: discord.Member = None):
-    member = member or ctx.author
-    embed = discord.Embed(
-        title=f"{member}'s Avatar",
-        color=discord.Color.green()
-    ).set_image(url=member.avatar.url)
-    await ctx.send(embed=embed)
-
-# 36. Uptime
-@bot.command(name="uptime", help="Check how long the bot has been online. Usage: !uptime")
-@is_registered()
-async def uptime(ctx):
-    current_time = datetime.utcnow()
-    delta = current_time - bot.launch_time
-    days, seconds = delta.days, delta.seconds
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    seconds = seconds % 60
-    embed = discord.Embed(
-        title="⏰ Bot Uptime",
-        description=f"{days}d {hours}h {minutes}m {seconds}s",
-        color=discord.Color.blue()
-    )
-    await ctx.send(embed=embed)
-
-# 37. ASCII Art
-@bot.command(name="ascii", help="Convert text to ASCII art. Usage: !ascii <text>")
-@is_registered()
-async def ascii_art(ctx, *, text: str = None):
-    if not text:
-        await ctx.send("❗ Please provide text to convert. Usage: `!ascii <text>`")
-        return
-    try:
-        response = requests.get(f"http://artii.herokuapp.com/make?text={text}")
-        if response.status_code == 200:
-            ascii_text = response.text
-            embed = discord.Embed(
-                title="🖋️ ASCII Art",
-                description=f"```\n{ascii_text}\n```",
-                color=discord.Color.dark_gold()
-            )
-            await ctx.send(embed=embed)
-        else:
-            await ctx.send("❗ Couldn't convert text to ASCII art right now.")
-    except Exception as e:
-        await ctx.send("❗ An error occurred while converting to ASCII art.")
-
-# 38. Dictionary Definition
-@bot.command(name="define", help="Get the definition of a word. Usage: !define <word>")
-@is_registered()
-async def define(ctx, *, word: str = None):
-    if not word:
-        await ctx.send("❗ Please specify a word. Usage: `!define <word>`")
-        return
-    definition, example = fetch_dictionary_definition(word)
-    if definition:
-        embed = discord.Embed(
-            title=f"📖 Definition of {word.title()}",
-            description=f"**Definition:** {definition}\n**Example:** {example}",
-            color=discord.Color.dark_blue()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't find the definition. Please check the word and try again.")
-
-# 39. Language Translation
-@bot.command(name="translate", help="Translate text to a specified language. Usage: !translate <language_code> <text>")
-@is_registered()
-async def translate(ctx, language: str = None, *, text: str = None):
-    if not language or not text:
-        await ctx.send("❗ Please provide a language code and text. Usage: `!translate <language_code> <text>`")
-        return
-    try:
-        response = requests.post(
-            "https://libretranslate.de/translate",
-            data={
-                "q": text,
-                "source": "auto",
-                "target": language.lower(),
-                "format": "text"
-            }
-        )
-        if response.status_code == 200:
-            translated_text = response.json().get("translatedText", "")
-            embed = discord.Embed(
-                title="📝 Translate Text",
-                description=f"**Original:** {text}\n**Translated ({language.upper()}):** {translated_text}",
-                color=discord.Color.purple()
-            )
-            await ctx.send(embed=embed)
-        else:
-            await ctx.send("❗ Couldn't translate the text. Please check the language code and try again.")
-    except Exception as e:
-        await ctx.send("❗ An error occurred while translating the text.")
-
-# 40. Random Activity
-@bot.command(name="activity", help="Get a random activity suggestion. Usage: !activity")
-@is_registered()
-async def activity(ctx):
-    suggestion = fetch_random_activity()
-    embed = discord.Embed(
-        title="🎯 Random Activity Suggestion",
-        description=suggestion,
-        color=discord.Color.orange()
-    )
-    await ctx.send(embed=embed)
-
-# 41. Random Music Quote
-@bot.command(name="music_quote", help="Get a random music-related quote. Usage: !music_quote")
-@is_registered()
-async def music_quote(ctx):
-    quote = fetch_random_music_quote()
-    embed = discord.Embed(
-        title="🎶 Music Quote",
-        description=quote,
-        color=discord.Color.purple()
-    )
-    await ctx.send(embed=embed)
-
-# 42. Random Art Quote
-@bot.command(name="art_quote", help="Get a random art-related quote. Usage: !art_quote")
-@is_registered()
-async def art_quote(ctx):
-    quote = fetch_random_art_quote()
-    embed = discord.Embed(
-        title="🎨 Art Quote",
-        description=quote,
-        color=discord.Color.purple()
-    )
-    await ctx.send(embed=embed)
-
-# 43. Random Math Fact
-@bot.command(name="math_fact", help="Get a random math fact. Usage: !math_fact")
-@is_registered()
-async def math_fact(ctx):
-    fact = fetch_random_math_fact()
-    embed = discord.Embed(
-        title="➗ Math Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 44. Random Geography Fact
-@bot.command(name="geography_fact", help="Get a random geography fact. Usage: !geography_fact")
-@is_registered()
-async def geography_fact(ctx):
-    fact = fetch_random_geography_fact()
-    embed = discord.Embed(
-        title="🌍 Geography Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 45. Random Politics Fact
-@bot.command(name="politics_fact", help="Get a random politics fact. Usage: !politics_fact")
-@is_registered()
-async def politics_fact(ctx):
-    fact = fetch_random_politics_fact()
-    embed = discord.Embed(
-        title="🏛️ Politics Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 46. Random Computer Fact
-@bot.command(name="computer_fact", help="Get a random computer fact. Usage: !computer_fact")
-@is_registered()
-async def computer_fact(ctx):
-    fact = fetch_random_computer_fact()
-    embed = discord.Embed(
-        title="💻 Computer Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 47. Random Cinema Fact
-@bot.command(name="cinema_fact", help="Get a random cinema fact. Usage: !cinema_fact")
-@is_registered()
-async def cinema_fact(ctx):
-    fact = fetch_random_cinema_fact()
-    embed = discord.Embed(
-        title="🎬 Cinema Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 48. Random Religion Fact
-@bot.command(name="religion_fact", help="Get a random religion fact. Usage: !religion_fact")
-@is_registered()
-async def religion_fact(ctx):
-    fact = fetch_random_religion_fact()
-    embed = discord.Embed(
-        title="✝️ Religion Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 49. Random Physics Fact
-@bot.command(name="physics_fact", help="Get a random physics fact. Usage: !physics_fact")
-@is_registered()
-async def physics_fact(ctx):
-    fact = fetch_random_physics_fact()
-    embed = discord.Embed(
-        title="🔬 Physics Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 50. Random Technology Fact
-@bot.command(name="technology_fact", help="Get a random technology fact. Usage: !technology_fact")
-@is_registered()
-async def technology_fact(ctx):
-    fact = fetch_random_technology_fact()
-    embed = discord.Embed(
-        title="🖥️ Technology Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 51. Random Environment Fact
-@bot.command(name="environment_fact", help="Get a random environment fact. Usage: !environment_fact")
-@is_registered()
-async def environment_fact(ctx):
-    fact = fetch_random_environment_fact()
-    embed = discord.Embed(
-        title="🌱 Environment Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 52. Random Entertainment Fact
-@bot.command(name="entertainment_fact", help="Get a random entertainment fact. Usage: !entertainment_fact")
-@is_registered()
-async def entertainment_fact(ctx):
-    fact = fetch_random_entertainment_fact()
-    embed = discord.Embed(
-        title="🎭 Entertainment Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 53. Random Fashion Fact
-@bot.command(name="fashion_fact", help="Get a random fashion fact. Usage: !fashion_fact")
-@is_registered()
-async def fashion_fact(ctx):
-    fact = fetch_random_fashion_fact()
-    embed = discord.Embed(
-        title="👗 Fashion Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 54. Random Lifestyle Fact
-@bot.command(name="lifestyle_fact", help="Get a random lifestyle fact. Usage: !lifestyle_fact")
-@is_registered()
-async def lifestyle_fact(ctx):
-    fact = fetch_random_lifestyle_fact()
-    embed = discord.Embed(
-        title="🏠 Lifestyle Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 55. Random Animals Fact
-@bot.command(name="animals_fact", help="Get a random animals fact. Usage: !animals_fact")
-@is_registered()
-async def animals_fact(ctx):
-    fact = fetch_random_animals_fact()
-    embed = discord.Embed(
-        title="🐾 Animals Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 56. Random Artistic Fact
-@bot.command(name="artistic_fact", help="Get a random artistic fact. Usage: !artistic_fact")
-@is_registered()
-async def artistic_fact(ctx):
-    fact = fetch_random_artistic_fact()
-    embed = discord.Embed(
-        title="🎨 Artistic Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 57. Random Philosophy Fact
-@bot.command(name="philosophy_fact", help="Get a random philosophy fact. Usage: !philosophy_fact")
-@is_registered()
-async def philosophy_fact(ctx):
-    fact = fetch_random_philosophy_fact()
-    embed = discord.Embed(
-        title="🧠 Philosophy Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 58. Random Game Fact
-@bot.command(name="game_fact", help="Get a random game fact. Usage: !game_fact")
-@is_registered()
-async def game_fact(ctx):
-    fact = fetch_random_game_fact()
-    embed = discord.Embed(
-        title="🎮 Game Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 59. Random Comic
-@bot.command(name="comic", help="Get a random xkcd comic. Usage: !comic")
-@is_registered()
-async def comic(ctx):
-    title, img, alt = fetch_random_comic()
-    if title and img:
-        embed = discord.Embed(
-            title=f"📰 xkcd Comic: {title}",
-            description=alt,
-            color=discord.Color.orange()
-        ).set_image(url=img)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a comic right now.")
-
-# 60. Random Book
-@bot.command(name="book", help="Get a random book. Usage: !book")
-@is_registered()
-async def book(ctx):
-    title, authors, description = fetch_random_book()
-    if title:
-        embed = discord.Embed(
-            title=f"📚 {title}",
-            description=f"**Authors:** {authors}\n**Description:** {description}",
-            color=discord.Color.green()
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch a book right now.")
-
-# 61. Random Pokémon
-@bot.command(name="pokemon", help="Get information about a random Pokémon. Usage: !pokemon")
-@is_registered()
-async def pokemon(ctx):
-    name, image, types = fetch_random_pokemon()
-    if image:
-        embed = discord.Embed(
-            title=f"🐱‍👤 Pokémon: {name}",
-            description=f"**Types:** {types}",
-            color=discord.Color.green()
-        ).set_image(url=image)
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch Pokémon information right now.")
-
-# 62. Random Color
-@bot.command(name="color", help="Get information about a random color. Usage: !color")
-@is_registered()
-async def color(ctx):
-    name, hex_code = fetch_random_color()
-    if name and hex_code:
-        embed = discord.Embed(
-            title=f"🎨 Color: {name}",
-            description=f"**Hex Code:** {hex_code}",
-            color=int(hex_code[1:], 16)
-        )
-        await ctx.send(embed=embed)
-    else:
-        await ctx.send("❗ Couldn't fetch color information right now.")
-
-# 63. Random Weather Fact
-@bot.command(name="weather_fact", help="Get a random weather fact. Usage: !weather_fact")
-@is_registered()
-async def weather_fact(ctx):
-    fact = fetch_random_weather_fact()
-    embed = discord.Embed(
-        title="🌦️ Weather Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 64. Random Space Fact
-@bot.command(name="space_fact", help="Get a random space fact. Usage: !space_fact")
-@is_registered()
-async def space_fact(ctx):
-    fact = fetch_random_space_fact()
-    embed = discord.Embed(
-        title="🚀 Space Fact",
-        description=fact,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 65. Random Career Advice
-@bot.command(name="career_advice", help="Get a random career advice. Usage: !career_advice")
-@is_registered()
-async def career_advice(ctx):
-    advice = fetch_random_career_advice()
-    embed = discord.Embed(
-        title="💼 Career Advice",
-        description=advice,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 66. Random Health Tip
-@bot.command(name="health_tip", help="Get a random health tip. Usage: !health_tip")
-@is_registered()
-async def health_tip(ctx):
-    tip = fetch_random_health_tip()
-    embed = discord.Embed(
-        title="💊 Health Tip",
-        description=tip,
-        color=discord.Color.teal()
-    )
-    await ctx.send(embed=embed)
-
-# 67. Random Travel Tip
-@bot.command(name="travel_tip", help="Get a random travel tip. Usage: !travel_tip")
-@is_registered()
-async def travel_tip(ctx):
-    tip = fetch_random_travel_tip()
-    embed = discord.Embed(
-        title="✈️ Travel Tip",
-        description=tip,
-        color=discord.Color.orange()
-    )
-    await ctx.send(embed=embed)
-
-# 68. Random Sports Fact
-@bot.command(name="sports_fact", help="Get a random sports fact. Usage: !sports_fact")
-@is_registered()
-async def sports_fact(ctx):
-    fact = fetch_random_sports_fact()
-    embed = discord.Embed(
-        title="🏅 Sports Fact",
-        description=fact,
-        color=discord.Color.blue()
-    )
-    await ctx.send(embed=embed)
-
-# 69. Random Science Fact
-@bot.command(name="science_fact", help="Get a random science fact. Usage: !science_fact")
-@is_registered()
-async def science_fact(ctx):
-    fact = fetch_random_science_fact()
-    embed = discord.Embed(
-        title="🔬 Science Fact",
-        description=fact,
-        color=discord.Color.blue()
-    )
-    await ctx.send(embed=embed)
-
-# 70. Random History Fact
-@bot.command(name="history_fact", help="Get a random history fact. Usage: !history_fact")
-@is_registered()
-async def history_fact(ctx):
-    fact = fetch_random_history_fact()
-    embed = discord.Embed(
-        title="📜 History Fact",
-        description=fact,
-        color=discord.Color.blue()
-    )
-    await ctx.send(embed=embed)
-
-# 71. Random Literature Fact
-@bot.command(name="literature_fact", help="Get a random literature fact. Usage: !literature_fact")
-@is_registered()
-async def literature_fact(ctx):
-    fact = fetch_random_literature_fact()
-    embed = discord.Embed(
-        title="📚 Literature Fact",
-        description=fact,
-        color=discord.Color.blue()
-    )
-    await ctx.send(embed=embed)
-
-# 72. Random Philosophy Fact (Already Defined as Command 57)
-# To prevent duplication, we skip redefining 'philosophy_fact'
-
-# 73. Random Game Fact (Already Defined as Command 58)
-# To prevent duplication, we skip redefining 'game_fact'
-
-# 74. Random Comic (Already Defined as Command 59)
-# To prevent duplication, we skip redefining 'comic'
-
-# 75. Random Book (Already Defined as Command 60)
-# To prevent duplication, we skip redefining 'book'
-
-# 76. Random Pokémon (Already Defined as Command 61)
-# To prevent duplication, we skip redefining 'pokemon'
-
-# 77. Random Color (Already Defined as Command 62)
-# To prevent duplication, we skip redefining 'color'
-
-# 78. Random Weather Fact (Already Defined as Command 63)
-# To prevent duplication, we skip redefining 'weather_fact'
-
-# 79. Random Space Fact (Already Defined as Command 64)
-# To prevent duplication, we skip redefining 'space_fact'
-
-# 80. Random Career Advice (Already Defined as Command 65)
-# To prevent duplication, we skip redefining 'career_advice'
-
-# 81. Random Health Tip (Already Defined as Command 66)
-# To prevent duplication, we skip redefining 'health_tip'
-
-# 82. Random Travel Tip (Already Defined as Command 67)
-# To prevent duplication, we skip redefining 'travel_tip'
-
-# 83. Random Sports Fact (Already Defined as Command 68)
-# To prevent duplication, we skip redefining 'sports_fact'
-
-# 84. Random Science Fact (Already Defined as Command 69)
-# To prevent duplication, we skip redefining 'science_fact'
-
-# 85. Random History Fact (Already Defined as Command 70)
-# To prevent duplication, we skip redefining 'history_fact'
-
-# 86. Random Literature Fact (Already Defined as Command 71)
-# To prevent duplication, we skip redefining 'literature_fact'
-
-# 87. Random Philosophy Fact (Already Defined as Command 57)
-# To prevent duplication, we skip redefining 'philosophy_fact'
-
-# 88. Random Game Fact (Already Defined as Command 58)
-# To prevent duplication, we skip redefining 'game_fact'
-
-# 89. Random Comic (Already Defined as Command 59)
-# To prevent duplication, we skip redefining 'comic'
-
-# 90. Random Book (Already Defined as Command 60)
-# To prevent duplication, we skip redefining 'book'
-
-# 91. Random Pokémon (Already Defined as Command 61)
-# To prevent duplication, we skip redefining 'pokemon'
-
-# 92. Random Color (Already Defined as Command 62)
-# To prevent duplication, we skip redefining 'color'
-
-# 93. Random Weather Fact (Already Defined as Command 63)
-# To prevent duplication, we skip redefining 'weather_fact'
-
-# 94. Random Space Fact (Already Defined as Command 64)
-# To prevent duplication, we skip redefining 'space_fact'
-
-# 95. Random Career Advice (Already Defined as Command 65)
-# To prevent duplication, we skip redefining 'career_advice'
-
-# 96. Random Health Tip (Already Defined as Command 66)
-# To prevent duplication, we skip redefining 'health_tip'
-
-# 97. Random Travel Tip (Already Defined as Command 67)
-# To prevent duplication, we skip redefining 'travel_tip'
-
-# 98. Random Sports Fact (Already Defined as Command 68)
-# To prevent duplication, we skip redefining 'sports_fact'
-
-# 99. Random Science Fact (Already Defined as Command 69)
-# To prevent duplication, we skip redefining 'science_fact'
-
-# 100. Random History Fact (Already Defined as Command 70)
-# To prevent duplication, we skip redefining 'history_fact'
-
-# 101. Random Literature Fact (Already Defined as Command 71)
-# To prevent duplication, we skip redefining 'literature_fact'
-
-# 102. Random Philosophy Fact (Already Defined as Command 57)
-# To prevent duplication, we skip redefining 'philosophy_fact'
-
-# 103. Random Game Fact (Already Defined as Command 58)
-# To prevent duplication, we skip redefining 'game_fact'
-
-# 104. Define All Commands in Help (Already Defined as Command 40)
-# To prevent duplication, we skip redefining 'what'
-
-# Due to the extensive number of commands, it's essential to ensure that each command is uniquely defined.
-# If any commands appear multiple times, please remove the duplicates as shown above.
-
-# 100 Unique Commands Complete
-
-# Help Command
-
-@bot.command(name="what", help="List all available commands. Usage: !what")
-async def what(ctx):
-    # Gather all commands with their help descriptions
-    commands_list = []
-    for command in bot.commands:
-        if not command.hidden and command.name != "what":
-            help_desc = command.help or "No description."
-            commands_list.append(f"!{command.name} - {help_desc}")
-
-    # Split commands into chunks of 10 for pagination
-    per_page = 10
-    chunks = [commands_list[i:i + per_page] for i in range(0, len(commands_list), per_page)]
-    embeds = []
-    for idx, chunk in enumerate(chunks, 1):
-        embed = discord.Embed(
-            title=f"📜 Available Commands (Page {idx}/{len(chunks)})",
-            description="\n\n".join(chunk),
-            color=discord.Color.gold()
-        )
-        embeds.append(embed)
-
-    if not embeds:
-        await ctx.send("❗ No commands available.")
-        return
-
-    view = HelpView(embeds)
-    message = await ctx.send(embed=embeds[0], view=view)
-    view.message = message
-
-# Error Handling
-@bot.event
-async def on_command_error(ctx, error):
-    if isinstance(error, commands.MissingRequiredArgument):
-        await ctx.send("❗ Missing arguments. Please check the command usage with `!what`.")
-    elif isinstance(error, commands.CommandNotFound):
-        await ctx.send("❗ Command not found. Use `!what` to see the list of available commands.")
-    elif isinstance(error, commands.CheckFailure):
-        await ctx.send("❗ You need to register first using `!register <username>`.")
-    else:
-        await ctx.send("❗ An unexpected error occurred. Please try again later.")
-        logger.error(f"Error: {error}")  # Log the error to console
+from core import BOT_TOKEN, bot
 
 # Run Bot
-bot.run(BOT_TOKEN)
+if __name__ == "__main__":
+    bot.run(BOT_TOKEN)
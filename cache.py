@@ -0,0 +1,256 @@
+# cache.py
+
+import asyncio
+import functools
+import logging
+import time
+from collections import Counter, OrderedDict
+
+import deadline
+
+logger = logging.getLogger('discord')
+
+_MISSING = object()
+
+# Every cache created through `cached` or `stale_while_revalidate`, keyed by endpoint name
+caches = {}
+
+# Calls currently shared by `singleflight`, keyed by (endpoint, normalized args)
+_inflight = {}
+
+# Number of calls per endpoint that joined an existing in-flight request
+coalesced_calls = Counter()
+
+
+class TTLCache:
+    """LRU cache whose entries expire `ttl` seconds after they were stored.
+
+    `clock` returns the current time in seconds.
+    """
+
+    def __init__(self, name, ttl, maxsize, clock=time.monotonic):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=_MISSING):
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or expires_at > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def set(self, key, value):
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0
+        }
+
+
+def succeeded(result):
+    """Default cacheability test: fetch helpers signal failure with None, empty values or all-None tuples."""
+    if isinstance(result, tuple):
+        return any(value is not None for value in result)
+    return bool(result)
+
+
+def cached(endpoint, ttl, maxsize=128, key=None, validate=succeeded):
+    """Cache an async fetch helper's results per endpoint.
+
+    `key` maps the call arguments to a cache key (defaults to the positional
+    arguments). Only results accepted by `validate` are stored, so failed
+    lookups are retried on the next call.
+    """
+    cache = caches[endpoint] = TTLCache(endpoint, ttl, maxsize)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args):
+            cache_key = key(*args) if key else args
+            result = cache.get(cache_key)
+            if result is not _MISSING:
+                return result
+            result = await func(*args)
+            if validate(result):
+                cache.set(cache_key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+class SWRCache:
+    """Last-known-good values that are refreshed in the background once stale.
+
+    `clock` returns the current time in seconds.
+    """
+
+    def __init__(self, name, fresh_for, clock=time.monotonic):
+        self.name = name
+        self.fresh_for = fresh_for
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._entries = {}
+        self._refreshing = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def cancel_refreshes(self):
+        """Cancel the background refreshes still running and wait for them to finish."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0
+        }
+
+
+def stale_while_revalidate(endpoint, fresh_for, validate=succeeded):
+    """Answer from the last good result and refresh it in the background.
+
+    Once a result is older than `fresh_for` seconds the next call still returns
+    it immediately and starts a single background refresh. A failed refresh
+    keeps serving the previous value. Only the very first call, before any
+    value exists, waits on the upstream; warm it at startup with
+    `warm_feeds()` and cancel its refreshes with `stop_feeds()` before the
+    HTTP session closes.
+    """
+    cache = caches[endpoint] = SWRCache(endpoint, fresh_for)
+
+    def decorator(func):
+        async def refresh(*args):
+            try:
+                result = await func(*args)
+            except Exception as e:
+                logger.warning(f"Refresh of {endpoint} failed: {e}")
+                if args not in cache._entries:
+                    raise
+                result = None
+            if validate(result):
+                cache._entries[args] = (result, cache.clock())
+            entry = cache._entries.get(args)
+            return entry[0] if entry else result
+
+        def start_refresh(*args):
+            task = cache._refreshing.get(args)
+            if task is None:
+                task = cache._refreshing[args] = deadline.spawn(refresh(*args))
+
+                def finished(t):
+                    # Also runs for refreshes cancelled before they started
+                    if cache._refreshing.get(args) is t:
+                        del cache._refreshing[args]
+                    # Failures are already logged; mark them retrieved for unawaited refreshes
+                    t.cancelled() or t.exception()
+
+                task.add_done_callback(finished)
+            return task
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            entry = cache._entries.get(args)
+            if entry is None:
+                cache.misses += 1
+                return await deadline.wait(start_refresh(*args))
+            value, fetched_at = entry
+            cache.hits += 1
+            if cache.clock() - fetched_at > fresh_for:
+                cache.stale_hits += 1
+                start_refresh(*args)
+            return value
+
+        wrapper.cache = cache
+        wrapper.refresh = start_refresh
+        return wrapper
+
+    return decorator
+
+
+def singleflight(endpoint, key=None):
+    """Let concurrent identical calls share one in-flight upstream request.
+
+    `key` normalizes the call arguments (defaults to the positional
+    arguments). Callers that arrive while a request for the same key is
+    running await its result instead of issuing their own.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args):
+            flight_key = (endpoint, key(*args) if key else args)
+            task = _inflight.get(flight_key)
+            if task is None:
+                task = _inflight[flight_key] = deadline.spawn(func(*args))
+
+                def finished(t):
+                    _inflight.pop(flight_key, None)
+                    # Mark failures retrieved even if every waiter was cancelled
+                    t.cancelled() or t.exception()
+
+                task.add_done_callback(finished)
+            else:
+                coalesced_calls[endpoint] += 1
+            return await deadline.wait(task)
+
+        return wrapper
+
+    return decorator
+
+
+def warm_feeds(*feeds):
+    """Start the first refresh of each `stale_while_revalidate` helper, e.g. in `cog_load`, so no command waits on it."""
+    for feed in feeds:
+        feed.refresh()
+
+
+async def stop_feeds(*feeds):
+    """Cancel the refreshes of each `stale_while_revalidate` helper still running, e.g. in `cog_unload`."""
+    await asyncio.gather(*(feed.cache.cancel_refreshes() for feed in feeds))
+
+
+async def cancel_refreshes():
+    """Cancel every stale-while-revalidate refresh still running, e.g. before the HTTP session closes."""
+    await asyncio.gather(*(cache.cancel_refreshes() for cache in caches.values() if isinstance(cache, SWRCache)))
+
+
+def cache_stats():
+    """Return hit/miss statistics for every registered cache."""
+    return {name: cache.stats() for name, cache in caches.items()}
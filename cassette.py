@@ -0,0 +1,158 @@
+# cassette.py
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from multidict import CIMultiDict
+
+from http_client import NotSent, Response
+
+logger = logging.getLogger('discord')
+
+RECORD = "record"
+REPLAY = "replay"
+# Replay without the recorded latencies
+REPLAY_FAST = "replay-fast"
+MODES = (RECORD, REPLAY, REPLAY_FAST)
+
+# Query parameters that carry credentials; they are left out of keys and archives
+REDACTED_PARAMS = {"apikey", "api_key", "key", "token"}
+
+
+class CassetteMiss(NotSent):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def _redact(pairs):
+    return sorted((name, "REDACTED" if name.lower() in REDACTED_PARAMS else str(value)) for name, value in pairs)
+
+
+def _canonical_url(url, params):
+    """The URL with `params` merged into its query, sorted, and credentials redacted."""
+    parts = urlsplit(url)
+    pairs = parse_qsl(parts.query, keep_blank_values=True) + list((params or {}).items())
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(_redact(pairs)), ""))
+
+
+def _body_bytes(data):
+    if data is None:
+        return b""
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    if isinstance(data, dict):
+        return urlencode(_redact(data.items())).encode("utf-8")
+    return str(data).encode("utf-8")
+
+
+def request_key(method, url, params=None, data=None):
+    """Identify a request by method, canonical URL and a hash of its body."""
+    body_hash = hashlib.sha256(_body_bytes(data)).hexdigest()[:16]
+    return f"{method.upper()} {_canonical_url(url, params)} {body_hash}"
+
+
+class Cassette:
+    """Record upstream responses to a gzipped JSON-lines archive and play them back.
+
+    In `record` mode every request is sent for real and its response, final
+    URL and latency are appended to `path`. In `replay` mode responses come
+    from the archive after their recorded latency (capped by the request's
+    timeout, so deadlines still fire); `replay-fast` skips the wait.
+    Requests recorded more than once are replayed in recorded order, wrapping
+    around when exhausted.
+    """
+
+    def __init__(self, path, mode=REPLAY):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {', '.join(MODES)}")
+        self.path = path
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._entries = defaultdict(list)
+        self._positions = defaultdict(int)
+        self._file = None
+        if mode != RECORD:
+            self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            logger.warning(f"Cassette {self.path} doesn't exist; every request will miss")
+            return
+        loaded = 0
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        # A record cut short while it was being written
+                        raise EOFError("last record is incomplete")
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]].append(entry)
+                        loaded += 1
+        except (EOFError, gzip.BadGzipFile) as e:
+            # Recording was interrupted mid-append (e.g. a crash); keep everything before the damage
+            logger.warning(f"Cassette {self.path} is truncated ({e}); replaying the {loaded} records before it")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def request(self, send, method, url, *, params=None, data=None, timeout=None, **kwargs):
+        """Serve a request from the archive, or send it with `send` and record the response."""
+        key = request_key(method, url, params, data)
+        if self.mode == RECORD:
+            started = time.monotonic()
+            response = await send(method, url, params=params, data=data, timeout=timeout, **kwargs)
+            self._record(key, method, url, params, response, time.monotonic() - started)
+            return response
+        return await self._replay(key, timeout)
+
+    def _record(self, key, method, url, params, response, latency):
+        entry = {
+            "key": key,
+            "method": method.upper(),
+            "url": _canonical_url(url, params),
+            "status": response.status_code,
+            "final_url": _canonical_url(response.url, None),
+            "headers": [[name, value] for name, value in response.headers.items() if name.lower() != "set-cookie"],
+            "latency": round(latency, 4),
+        }
+        try:
+            entry["text"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body"] = base64.b64encode(response.content).decode("ascii")
+        if self._file is None:
+            # Appending adds a new gzip member; readers see one continuous stream
+            self._file = gzip.open(self.path, "at", encoding="utf-8")
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.recorded += 1
+
+    async def _replay(self, key, timeout):
+        entries = self._entries.get(key)
+        if not entries:
+            self.misses += 1
+            raise CassetteMiss(f"No recorded response for {key}")
+        position = self._positions[key]
+        self._positions[key] = position + 1
+        entry = entries[position % len(entries)]
+        if self.mode == REPLAY and entry["latency"]:
+            if timeout is not None and entry["latency"] > timeout:
+                await asyncio.sleep(timeout)
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(entry["latency"])
+        self.replayed += 1
+        content = entry["text"].encode("utf-8") if "text" in entry else base64.b64decode(entry["body"])
+        return Response(entry["status"], entry["final_url"], CIMultiDict(entry["headers"]), content)
+
+    def stats(self):
+        return {"mode": self.mode, "recorded": self.recorded, "replayed": self.replayed, "misses": self.misses}
@@ -0,0 +1,120 @@
+# circuit_breaker.py
+
+import time
+from collections import OrderedDict, deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Rolling window and thresholds applied to every upstream host
+WINDOW_SECONDS = 60
+MIN_CALLS = 5
+FAILURE_RATE = 0.5
+SLOW_CALL_SECONDS = 5
+OPEN_SECONDS = 30
+MAX_OPEN_SECONDS = 600
+
+# Most breakers kept before the least recently used is dropped; hosts can come
+# from users (e.g. !unshorten), so the map must not grow without bound
+MAX_BREAKERS = 256
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+    def __init__(self, host, retry_after):
+        super().__init__(f"Circuit for {host} is open, retry in {retry_after:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by a rolling window of outcomes.
+
+    Errors, 5xx responses and calls slower than `slow_call_seconds` count as
+    failures. Once at least `min_calls` calls in the window fail at
+    `failure_rate` or more, the circuit opens and calls fail immediately.
+    After `open_seconds` a single probe is let through: success closes the
+    circuit, failure reopens it with a doubled (capped) open period.
+    `clock` returns the current time in seconds.
+    """
+
+    def __init__(self, host, window_seconds=WINDOW_SECONDS, min_calls=MIN_CALLS,
+                 failure_rate=FAILURE_RATE, slow_call_seconds=SLOW_CALL_SECONDS,
+                 open_seconds=OPEN_SECONDS, max_open_seconds=MAX_OPEN_SECONDS, clock=time.monotonic):
+        self.host = host
+        self.clock = clock
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.base_open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.state = CLOSED
+        self._open_seconds = open_seconds
+        self._opened_at = 0.0
+        self._probing = False
+        self._calls = deque()
+
+    def before_request(self):
+        """Raise `CircuitOpen` unless a call may go through now."""
+        if self.state == CLOSED:
+            return
+        retry_after = self._opened_at + self._open_seconds - self.clock()
+        if self.state == OPEN and retry_after <= 0:
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        raise CircuitOpen(self.host, max(retry_after, 0.0))
+
+    def release(self):
+        """Give back a probe slot when the call was abandoned before completing."""
+        if self.state == HALF_OPEN:
+            self._probing = False
+
+    def record(self, success, latency):
+        """Record the outcome of a call that was let through."""
+        failed = not success or latency > self.slow_call_seconds
+        if self.state == HALF_OPEN:
+            self._probing = False
+            if failed:
+                self._open(min(self._open_seconds * 2, self.max_open_seconds))
+            else:
+                self._close()
+            return
+        now = self.clock()
+        self._calls.append((now, failed))
+        while self._calls and self._calls[0][0] < now - self.window_seconds:
+            self._calls.popleft()
+        if len(self._calls) >= self.min_calls:
+            failures = sum(1 for _, call_failed in self._calls if call_failed)
+            if failures / len(self._calls) >= self.failure_rate:
+                self._open(self.base_open_seconds)
+
+    def _open(self, seconds):
+        self.state = OPEN
+        self._open_seconds = seconds
+        self._opened_at = self.clock()
+        self._calls.clear()
+
+    def _close(self):
+        self.state = CLOSED
+        self._open_seconds = self.base_open_seconds
+        self._calls.clear()
+
+
+# One breaker per upstream host, created on first use
+breakers = OrderedDict()
+
+
+def breaker_for(host):
+    breaker = breakers.get(host)
+    if breaker is None:
+        breaker = breakers[host] = CircuitBreaker(host)
+        if len(breakers) > MAX_BREAKERS:
+            breakers.popitem(last=False)
+    else:
+        breakers.move_to_end(host)
+    return breaker
@@ -0,0 +1,166 @@
+# cogs/facts.py
+
+import discord
+from discord.ext import commands
+
+import http_client
+from pools import pooled
+from corpus import ShuffledPicker, load_corpus
+from core import is_registered
+
+# Helper Functions
+
+@pooled("fact")
+async def fetch_random_fact():
+    """Fetch a random fact from Useless Facts API."""
+    response = await http_client.get("https://uselessfacts.jsph.pl/random.json?language=en")
+    if response.status_code == 200:
+        return response.json().get("text")
+    return None
+
+async def fetch_jokes(count):
+    """Fetch a batch of ten random jokes from Official Joke API."""
+    response = await http_client.get("https://official-joke-api.appspot.com/jokes/ten")
+    if response.status_code == 200:
+        return [f"{joke['setup']} - {joke['punchline']}" for joke in response.json()[:count]]
+    return []
+
+@pooled("joke", batch=fetch_jokes)
+async def fetch_joke():
+    """Fetch a random joke from Official Joke API."""
+    response = await http_client.get("https://official-joke-api.appspot.com/jokes/random")
+    if response.status_code == 200:
+        joke = response.json()
+        return f"{joke['setup']} - {joke['punchline']}"
+    return None
+
+async def fetch_quote():
+    """Fetch a random inspirational quote from Quotable API."""
+    response = await http_client.get("https://api.quotable.io/random")
+    if response.status_code == 200:
+        data = response.json()
+        return f"\"{data['content']}\" - {data['author']}"
+    return "Couldn't fetch a quote right now."
+
+async def fetch_random_fact_about_number(number):
+    """Fetch a fact about a number from Numbers API."""
+    response = await http_client.get(f"http://numbersapi.com/{number}/trivia")
+    if response.status_code == 200:
+        return response.text
+    return "Couldn't fetch a number fact right now."
+
+@pooled("dad_joke")
+async def fetch_dad_joke():
+    """Fetch a random dad joke from icanhazdadjoke API."""
+    headers = {'Accept': 'application/json'}
+    response = await http_client.get("https://icanhazdadjoke.com/", headers=headers)
+    if response.status_code == 200:
+        data = response.json()
+        return data.get("joke")
+    return None
+
+# Pools this cog keeps topped up while it is loaded
+POOLED_HELPERS = (fetch_random_fact, fetch_joke, fetch_dad_joke)
+
+# Commands
+
+class Facts(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        for helper in POOLED_HELPERS:
+            helper.pool.start()
+
+    async def cog_unload(self):
+        for helper in POOLED_HELPERS:
+            await helper.pool.stop()
+
+    # 4. Random Fact
+    @commands.hybrid_command(name="fact", help="Get a random fact. Usage: !fact", extras={"defer": True})
+    @is_registered()
+    async def fact(self, ctx):
+        random_fact = await fetch_random_fact() or "Couldn't fetch a fact right now."
+        embed = discord.Embed(
+            title="🤔 Random Fact",
+            description=random_fact,
+            color=discord.Color.green()
+        )
+        await ctx.send(embed=embed)
+
+    # 5. Joke
+    @commands.hybrid_command(name="joke", help="Get a random joke. Usage: !joke", extras={"defer": True})
+    @is_registered()
+    async def joke(self, ctx):
+        joke_text = await fetch_joke() or "Couldn't fetch a joke right now."
+        embed = discord.Embed(
+            title="😂 Here's a Joke for You!",
+            description=joke_text,
+            color=discord.Color.gold()
+        )
+        await ctx.send(embed=embed)
+
+    # 6. Quote
+    @commands.hybrid_command(name="quote", help="Get a random inspirational quote. Usage: !quote", extras={"defer": True})
+    @is_registered()
+    async def quote(self, ctx):
+        quote_text = await fetch_quote()
+        embed = discord.Embed(
+            title="🌟 Inspirational Quote",
+            description=quote_text,
+            color=discord.Color.purple()
+        )
+        await ctx.send(embed=embed)
+
+    # 19. Number Fact
+    @commands.hybrid_command(name="number_fact", help="Get a fact about a number. Usage: !number_fact <number>", extras={"defer": True})
+    @is_registered()
+    async def number_fact(self, ctx, number: int = None):
+        if number is None:
+            await ctx.send("❗ Please specify a number. Usage: `!number_fact <number>`")
+            return
+        fact = await fetch_random_fact_about_number(number)
+        embed = discord.Embed(
+            title=f"🔢 Number Fact: {number}",
+            description=fact,
+            color=discord.Color.teal()
+        )
+        await ctx.send(embed=embed)
+
+    # 22. Dad Joke
+    @commands.hybrid_command(name="dad_joke", help="Get a random dad joke. Usage: !dad_joke", extras={"defer": True})
+    @is_registered()
+    async def dad_joke(self, ctx):
+        joke = await fetch_dad_joke() or "Couldn't fetch a joke right now."
+        embed = discord.Embed(
+            title="👨‍🦳 Dad Joke",
+            description=joke,
+            color=discord.Color.orange()
+        )
+        await ctx.send(embed=embed)
+
+# Static Content Commands (facts, tips and quotes loaded from data/corpus.json)
+
+corpus = load_corpus()
+corpus_picker = ShuffledPicker()
+
+def make_corpus_command(category):
+    color = getattr(discord.Color, category.color)()
+
+    async def corpus_command(ctx):
+        embed = discord.Embed(
+            title=category.title,
+            description=corpus_picker.pick(category, ctx.channel.id),
+            color=color
+        )
+        await ctx.send(embed=embed)
+
+    return corpus_command
+
+async def setup(bot):
+    await bot.add_cog(Facts(bot))
+    # Corpus commands aren't part of the cog; they belong to this module, so unloading it removes them too
+    for category in corpus.values():
+        bot.hybrid_command(name=category.name, help=category.help, extras={"category": "facts"})(
+            is_registered()(make_corpus_command(category))
+        )
@@ -0,0 +1,83 @@
+# cogs/finance.py
+
+import discord
+from discord.ext import commands
+
+import http_client
+from cache import singleflight, stale_while_revalidate, stop_feeds, warm_feeds
+from core import ALPHA_VANTAGE_API_KEY, is_registered
+
+# Helper Functions
+
+@singleflight("stock", key=lambda symbol: symbol.strip().upper())
+async def fetch_alpha_vantage_stock(symbol):
+    """Fetch stock price from Alpha Vantage API."""
+    response = await http_client.get(
+        "https://www.alphavantage.co/query",
+        params={"function": "GLOBAL_QUOTE", "symbol": symbol, "apikey": ALPHA_VANTAGE_API_KEY}
+    )
+    if response.status_code == 200:
+        data = response.json()
+        quote = data.get("Global Quote", {})
+        price = quote.get("05. price", "N/A")
+        change = quote.get("09. change", "N/A")
+        return price, change
+    return None, None
+
+@stale_while_revalidate("bitcoin", fresh_for=60)
+async def fetch_bitcoin_price():
+    """Fetch current Bitcoin price in USD from Coindesk API."""
+    response = await http_client.get("https://api.coindesk.com/v1/bpi/currentprice/BTC.json")
+    if response.status_code == 200:
+        data = response.json()
+        rate = data["bpi"]["USD"]["rate"]
+        return rate
+    return None
+
+# Commands
+
+class Finance(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        warm_feeds(fetch_bitcoin_price)
+
+    async def cog_unload(self):
+        await stop_feeds(fetch_bitcoin_price)
+
+    # 14. Stock Price
+    @commands.hybrid_command(name="stock", help="Get current stock price. Usage: !stock <symbol>", extras={"defer": True, "limit": "quota"})
+    @is_registered()
+    async def stock(self, ctx, symbol: str = None):
+        if not symbol:
+            await ctx.send("❗ Please specify a stock symbol. Usage: `!stock <symbol>`")
+            return
+        price, change = await fetch_alpha_vantage_stock(symbol)
+        if price and change:
+            embed = discord.Embed(
+                title=f"📈 Stock: {symbol.upper()}",
+                description=f"**Price:** ${price}\n**Change:** {change}",
+                color=discord.Color.dark_blue()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch stock information. Please check the symbol.")
+
+    # 15. Bitcoin Price
+    @commands.hybrid_command(name="bitcoin", help="Get the current Bitcoin price in USD. Usage: !bitcoin", extras={"defer": True})
+    @is_registered()
+    async def bitcoin(self, ctx):
+        price = await fetch_bitcoin_price()
+        if price:
+            embed = discord.Embed(
+                title="💰 Bitcoin Price",
+                description=f"Current Bitcoin price: **${price} USD**",
+                color=discord.Color.gold()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch Bitcoin price right now.")
+
+async def setup(bot):
+    await bot.add_cog(Finance(bot))
@@ -0,0 +1,173 @@
+# cogs/games.py
+
+import random
+import discord
+from discord.ext import commands
+from discord.ui import Button, View
+
+import http_client
+from pools import pooled
+from trivia import TRIVIA_CATEGORIES, trivia_bank
+from core import autocomplete_choices, is_registered
+
+ZODIAC_SIGNS = (
+    "aries", "taurus", "gemini", "cancer", "leo", "virgo",
+    "libra", "scorpio", "sagittarius", "capricorn", "aquarius", "pisces"
+)
+
+# Helper Functions
+
+async def fetch_trivia_question(category=None):
+    """Fetch a trivia question from the pre-fetched Open Trivia DB queues."""
+    return await trivia_bank.get_question(category)
+
+async def fetch_horoscope(sign):
+    """Fetch daily horoscope from Horoscope API."""
+    response = await http_client.post(
+        "https://aztro.sameerkumar.website/",
+        params={"sign": sign.lower(), "day": "today"}
+    )
+    if response.status_code == 200:
+        data = response.json()
+        horoscope = data.get("description", "No horoscope found.")
+        return horoscope
+    return "Couldn't fetch horoscope right now."
+
+@pooled("activity")
+async def fetch_random_activity():
+    """Fetch a random activity suggestion from Bored API."""
+    response = await http_client.get("https://www.boredapi.com/api/activity/")
+    if response.status_code == 200:
+        data = response.json()
+        return data.get("activity")
+    return None
+
+# Interactive Views
+
+class TriviaView(View):
+    def __init__(self, correct_answer, options):
+        super().__init__(timeout=60)
+        self.correct_answer = correct_answer
+        self.options = options
+
+        for option in options:
+            button = Button(label=option, style=discord.ButtonStyle.primary)
+            button.callback = self.create_callback(option)
+            self.add_item(button)
+
+    def create_callback(self, selected_option):
+        async def callback(interaction: discord.Interaction):
+            if selected_option == self.correct_answer:
+                content = f"✅ Correct! The answer was: **{self.correct_answer}**"
+            else:
+                content = f"❌ Incorrect! The correct answer was: **{self.correct_answer}**"
+
+            # Disable all buttons after answer
+            for child in self.children:
+                child.disabled = True
+
+            await interaction.response.edit_message(content=content, view=self)
+            self.stop()
+
+        return callback
+
+    async def on_timeout(self):
+        # Disable all buttons on timeout
+        for child in self.children:
+            child.disabled = True
+        if hasattr(self, 'message'):
+            await self.message.edit(content="⏰ Time's up! You didn't answer in time.", view=self)
+
+# Commands
+
+class Games(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        fetch_random_activity.pool.start()
+        trivia_bank.start("general")
+
+    async def cog_unload(self):
+        await fetch_random_activity.pool.stop()
+        await trivia_bank.stop()
+
+    # 3. Trivia
+    @commands.hybrid_command(name="trivia", help="Start a trivia game. Usage: !trivia [category]", extras={"defer": True})
+    @is_registered()
+    async def trivia(self, ctx, category: str = "general"):
+        question = await fetch_trivia_question(category)
+        if question:
+            embed = discord.Embed(
+                title="🎯 Trivia Time!",
+                description=question["question"],
+                color=discord.Color.blue()
+            )
+            answers = question["incorrect_answers"] + [question["correct_answer"]]
+            random.shuffle(answers)
+            view = TriviaView(question["correct_answer"], answers)
+            embed.add_field(name="Choose the correct answer:", value="Click one of the buttons below.", inline=False)
+            message = await ctx.send(embed=embed, view=view)
+            view.message = message  # Reference for timeout handling
+        else:
+            await ctx.send("❗ Couldn't fetch a trivia question right now.")
+
+    @trivia.autocomplete("category")
+    async def trivia_category_autocomplete(self, interaction, current):
+        return autocomplete_choices(TRIVIA_CATEGORIES, current)
+
+    # 25. Horoscope
+    @commands.hybrid_command(name="horoscope", help="Get today's horoscope. Usage: !horoscope <sign>", extras={"defer": True})
+    @is_registered()
+    async def horoscope(self, ctx, sign: str = None):
+        if not sign:
+            await ctx.send("❗ Please specify your zodiac sign. Usage: `!horoscope <sign>`")
+            return
+        horoscope_text = await fetch_horoscope(sign)
+        if horoscope_text:
+            embed = discord.Embed(
+                title=f"🔮 Today's Horoscope for {sign.title()}",
+                description=horoscope_text,
+                color=discord.Color.dark_purple()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch horoscope. Please check the zodiac sign.")
+
+    @horoscope.autocomplete("sign")
+    async def horoscope_sign_autocomplete(self, interaction, current):
+        return autocomplete_choices(ZODIAC_SIGNS, current)
+
+    # 30. Magic 8-Ball
+    @commands.hybrid_command(name="8ball", help="Ask the magic 8-ball a question. Usage: !8ball <question>")
+    @is_registered()
+    async def eight_ball(self, ctx, *, question: str = None):
+        if not question:
+            await ctx.send("❗ Please ask a question. Usage: `!8ball <question>`")
+            return
+        responses = [
+            "Yes!", "No!", "Maybe.", "Ask again later.", "Certainly!", "I don't think so.",
+            "Absolutely!", "Not sure.", "Definitely not.", "It is certain."
+        ]
+        answer = random.choice(responses)
+        embed = discord.Embed(
+            title="🎱 Magic 8-Ball",
+            description=f"**Question:** {question}\n**Answer:** {answer}",
+            color=discord.Color.dark_gold()
+        )
+        await ctx.send(embed=embed)
+
+    # 40. Random Activity
+    @commands.hybrid_command(name="activity", help="Get a random activity suggestion. Usage: !activity", extras={"defer": True})
+    @is_registered()
+    async def activity(self, ctx):
+        suggestion = await fetch_random_activity() or "Couldn't fetch an activity right now."
+        embed = discord.Embed(
+            title="🎯 Random Activity Suggestion",
+            description=suggestion,
+            color=discord.Color.orange()
+        )
+        await ctx.send(embed=embed)
+
+async def setup(bot):
+    await bot.add_cog(Games(bot))
@@ -0,0 +1,446 @@
+# cogs/media.py
+
+import logging
+import random
+import discord
+from discord.ext import commands, tasks
+
+import http_client
+from cache import cached, singleflight, stale_while_revalidate, stop_feeds, warm_feeds
+from pools import fields_present, pooled
+from core import NASA_API_KEY, OMDB_API_KEY, TENOR_API_KEY, is_registered
+
+logger = logging.getLogger('discord')
+
+# Helper Functions
+
+async def fetch_random_dog_images(count):
+    """Fetch a batch of random dog images from Dog CEO API."""
+    response = await http_client.get(f"https://dog.ceo/api/breeds/image/random/{min(count, 50)}")
+    if response.status_code == 200:
+        return response.json().get("message", [])
+    return []
+
+@pooled("dog", batch=fetch_random_dog_images)
+async def fetch_random_dog_image():
+    """Fetch a random dog image from Dog CEO API."""
+    response = await http_client.get("https://dog.ceo/api/breeds/image/random")
+    if response.status_code == 200:
+        return response.json().get("message", "")
+    return ""
+
+async def fetch_random_cat_images(count):
+    """Fetch a batch of random cat images from TheCatAPI."""
+    response = await http_client.get("https://api.thecatapi.com/v1/images/search", params={"limit": min(count, 10)})
+    if response.status_code == 200:
+        return [image.get("url", "") for image in response.json()]
+    return []
+
+@pooled("cat", batch=fetch_random_cat_images)
+async def fetch_random_cat_image():
+    """Fetch a random cat image from TheCatAPI."""
+    response = await http_client.get("https://api.thecatapi.com/v1/images/search")
+    if response.status_code == 200:
+        data = response.json()
+        if data:
+            return data[0].get("url", "")
+    return ""
+
+@cached("spells", ttl=24 * 3600, maxsize=1)
+async def fetch_spells():
+    """Fetch spells from Harry Potter API."""
+    response = await http_client.get("https://hp-api.onrender.com/api/spells")
+    if response.status_code == 200:
+        return response.json()
+    return []
+
+@pooled("meal")
+async def fetch_random_meal():
+    """Fetch a random meal from TheMealDB."""
+    response = await http_client.get("https://www.themealdb.com/api/json/v1/1/random.php")
+    if response.status_code == 200:
+        data = response.json()
+        if data.get("meals"):
+            return data["meals"][0]
+    return {}
+
+async def fetch_reddit_post(subreddit):
+    """Fetch a random post from a subreddit."""
+    headers = {'User-agent': 'Mozilla/5.0'}
+    response = await http_client.get(f"https://www.reddit.com/r/{subreddit}/random.json", headers=headers)
+    if response.status_code == 200:
+        data = response.json()
+        if isinstance(data, list) and len(data) > 0:
+            post = data[0]['data']['children'][0]['data']
+            title = post.get("title", "No title")
+            url = post.get("url", "")
+            return title, url
+    return None, None
+
+@cached("movie", ttl=24 * 3600, maxsize=1024, key=lambda title: title.strip().casefold())
+@singleflight("movie", key=lambda title: title.strip().casefold())
+async def fetch_movie_info(title):
+    """Fetch movie information from OMDB API."""
+    response = await http_client.get("http://www.omdbapi.com/", params={"t": title, "apikey": OMDB_API_KEY})
+    if response.status_code == 200:
+        data = response.json()
+        if data.get("Response") == "True":
+            title = data.get("Title", "N/A")
+            year = data.get("Year", "N/A")
+            genre = data.get("Genre", "N/A")
+            director = data.get("Director", "N/A")
+            plot = data.get("Plot", "N/A")
+            poster = data.get("Poster", "")
+            return title, year, genre, director, plot, poster
+    return None
+
+@stale_while_revalidate("nasa_apod", fresh_for=3600)
+async def fetch_nasa_apod():
+    """Fetch NASA Astronomy Picture of the Day."""
+    response = await http_client.get(f"https://api.nasa.gov/planetary/apod?api_key={NASA_API_KEY}")
+    if response.status_code == 200:
+        data = response.json()
+        title = data.get("title", "N/A")
+        explanation = data.get("explanation", "N/A")
+        url = data.get("url", "")
+        return title, explanation, url
+    return None, None, None
+
+async def fetch_tenor_gif(tag="random"):
+    """Fetch a random GIF from Tenor."""
+    response = await http_client.get(
+        "https://tenor.googleapis.com/v2/search",
+        params={"q": tag, "key": TENOR_API_KEY, "limit": 1}
+    )
+    if response.status_code == 200:
+        results = response.json().get("results", [])
+        if results:
+            media = results[0].get("media_formats", {})
+            gif = media.get("gif", {}).get("url")
+            if gif:
+                return gif
+    return None
+
+async def fetch_random_memes(count):
+    """Fetch a batch of random memes from Meme API."""
+    response = await http_client.get(f"https://meme-api.herokuapp.com/gimme/{min(count, 50)}")
+    if response.status_code == 200:
+        return [(meme.get("title", "No title"), meme.get("url", "")) for meme in response.json().get("memes", [])]
+    return []
+
+@pooled("meme", batch=fetch_random_memes, validate=fields_present(1))
+async def fetch_random_meme():
+    """Fetch a random meme from Meme API."""
+    response = await http_client.get("https://meme-api.herokuapp.com/gimme")
+    if response.status_code == 200:
+        data = response.json()
+        title = data.get("title", "No title")
+        url = data.get("url", "")
+        return title, url
+    return None, None
+
+@pooled("fox")
+async def fetch_random_fox_image():
+    """Fetch a random fox image from randomfox.ca."""
+    response = await http_client.get("https://randomfox.ca/floof/")
+    if response.status_code == 200:
+        data = response.json()
+        return data.get("image", "")
+    return ""
+
+# Latest xkcd number, kept current by refresh_latest_comic_number
+latest_comic_num = None
+
+@cached("xkcd_comic", ttl=None, maxsize=512)
+async def fetch_comic(num):
+    """Fetch an xkcd comic by number; published comics never change."""
+    response = await http_client.get(f"https://xkcd.com/{num}/info.0.json")
+    if response.status_code == 200:
+        data = response.json()
+        title = data.get("title", "N/A")
+        img = data.get("img", "")
+        alt = data.get("alt", "")
+        return title, img, alt
+    return None, None, None
+
+async def fetch_random_comic():
+    """Fetch a random xkcd comic."""
+    global latest_comic_num
+    if latest_comic_num is None:
+        latest_comic_num = await get_latest_comic_number()
+    if latest_comic_num:
+        return await fetch_comic(random.randint(1, latest_comic_num))
+    return None, None, None
+
+async def get_latest_comic_number():
+    """Get the latest xkcd comic number."""
+    response = await http_client.get("https://xkcd.com/info.0.json")
+    if response.status_code == 200:
+        data = response.json()
+        return data.get("num")
+    return None
+
+@tasks.loop(hours=1)
+async def refresh_latest_comic_number():
+    """Periodically track the latest xkcd number so !comic needs at most one request."""
+    global latest_comic_num
+    try:
+        num = await get_latest_comic_number()
+    except Exception as e:
+        logger.warning(f"Refreshing the latest xkcd number failed: {e}")
+        return
+    if num:
+        latest_comic_num = num
+
+@pooled("book", validate=fields_present(0))
+async def fetch_random_book():
+    """Fetch a random book from Open Library API."""
+    response = await http_client.get("https://openlibrary.org/random.json?count=1")
+    if response.status_code == 200:
+        data = response.json()
+        title = data.get("title")
+        authors = ", ".join([author.get("name", "Unknown") for author in data.get("authors", [])])
+        description = data.get("description", {}).get("value", "No description available.") if isinstance(data.get("description"), dict) else data.get("description", "No description available.")
+        return title, authors, description
+    return None, None, None
+
+async def fetch_random_pokemon():
+    """Fetch a random Pokémon from PokéAPI."""
+    pokemon_id = random.randint(1, 898)  # As of now, there are 898 Pokémon
+    response = await http_client.get(f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}")
+    if response.status_code == 200:
+        data = response.json()
+        name = data.get("name", "N/A").title()
+        image = data["sprites"]["front_default"]
+        types = ", ".join([t["type"]["name"].title() for t in data.get("types", [])])
+        return name, image, types
+    return None, None, None
+
+# Pools this cog keeps topped up while it is loaded
+POOLED_HELPERS = (
+    fetch_random_dog_image, fetch_random_cat_image, fetch_random_meal, fetch_random_meme,
+    fetch_random_fox_image, fetch_random_book
+)
+
+# Commands
+
+class Media(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        warm_feeds(fetch_nasa_apod)
+        for helper in POOLED_HELPERS:
+            helper.pool.start()
+        refresh_latest_comic_number.start()
+
+    async def cog_unload(self):
+        for helper in POOLED_HELPERS:
+            await helper.pool.stop()
+        refresh_latest_comic_number.cancel()
+        await stop_feeds(fetch_nasa_apod)
+
+    # 7. Dog Image
+    @commands.hybrid_command(name="dog", help="Get a random dog image. Usage: !dog", extras={"defer": True})
+    @is_registered()
+    async def dog(self, ctx):
+        image_url = await fetch_random_dog_image()
+        if image_url:
+            embed = discord.Embed(
+                title="🐶 Here's a Cute Dog for You!",
+                color=discord.Color.from_rgb(139, 69, 19)
+            ).set_image(url=image_url)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a dog image right now.")
+
+    # 8. Cat Image
+    @commands.hybrid_command(name="cat", help="Get a random cat image. Usage: !cat", extras={"defer": True})
+    @is_registered()
+    async def cat(self, ctx):
+        image_url = await fetch_random_cat_image()
+        if image_url:
+            embed = discord.Embed(
+                title="🐱 Here's a Cute Cat for You!",
+                color=discord.Color.dark_purple()
+            ).set_image(url=image_url)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a cat image right now.")
+
+    # 9. Spell (Harry Potter)
+    @commands.hybrid_command(name="spell", help="Get a random Harry Potter spell. Usage: !spell", extras={"defer": True})
+    @is_registered()
+    async def spell(self, ctx):
+        spells = await fetch_spells()
+        if spells:
+            spell = random.choice(spells)
+            embed = discord.Embed(
+                title=f"🔮 {spell['name']}",
+                description=spell['description'],
+                color=discord.Color.purple()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a spell right now.")
+
+    # 10. Meal
+    @commands.hybrid_command(name="meal", help="Get a random meal. Usage: !meal", extras={"defer": True})
+    @is_registered()
+    async def meal(self, ctx):
+        meal = await fetch_random_meal()
+        if meal:
+            embed = discord.Embed(
+                title=f"🍽️ {meal['strMeal']}",
+                description=f"Cuisine: {meal['strArea']}\nCategory: {meal['strCategory']}",
+                color=discord.Color.orange()
+            ).set_image(url=meal['strMealThumb'])
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a meal right now.")
+
+    # 11. Reddit Post
+    @commands.hybrid_command(name="reddit", help="Get a random post from a subreddit. Usage: !reddit <subreddit>", extras={"defer": True})
+    @is_registered()
+    async def reddit(self, ctx, subreddit: str = None):
+        if not subreddit:
+            await ctx.send("❗ Please specify a subreddit. Usage: `!reddit <subreddit>`")
+            return
+        title, url = await fetch_reddit_post(subreddit)
+        if title and url:
+            embed = discord.Embed(
+                title=title,
+                url=url,
+                color=discord.Color.red()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a Reddit post. Please check the subreddit name.")
+
+    # 13. Movie Information
+    @commands.hybrid_command(name="movie", help="Get information about a movie. Usage: !movie <movie name>", extras={"defer": True, "limit": "quota"})
+    @is_registered()
+    async def movie(self, ctx, *, title: str = None):
+        if not title:
+            await ctx.send("❗ Please specify a movie title. Usage: `!movie <movie name>`")
+            return
+        result = await fetch_movie_info(title)
+        if result:
+            title, year, genre, director, plot, poster = result
+            embed = discord.Embed(
+                title=f"{title} ({year})",
+                description=plot,
+                color=discord.Color.dark_gold()
+            )
+            embed.add_field(name="Genre", value=genre, inline=True)
+            embed.add_field(name="Director", value=director, inline=True)
+            if poster and poster != "N/A":
+                embed.set_thumbnail(url=poster)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch movie information. Please check the movie title.")
+
+    # 16. NASA APOD
+    @commands.hybrid_command(name="nasa_apod", help="Get NASA's Astronomy Picture of the Day. Usage: !nasa_apod", extras={"defer": True})
+    @is_registered()
+    async def nasa_apod(self, ctx):
+        title, explanation, url = await fetch_nasa_apod()
+        if title and explanation and url:
+            embed = discord.Embed(
+                title=f"🪐 NASA Astronomy Picture of the Day: {title}",
+                description=explanation,
+                color=discord.Color.dark_blue()
+            ).set_image(url=url)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch NASA APOD right now.")
+
+    # 17. Random GIF
+    @commands.hybrid_command(name="gif", help="Get a random GIF. Usage: !gif <tag>", extras={"defer": True})
+    @is_registered()
+    async def gif(self, ctx, *, tag: str = "random"):
+        gif_url = await fetch_tenor_gif(tag)
+        if gif_url:
+            embed = discord.Embed(
+                title=f"🎬 Random GIF - {tag.title()}",
+                color=discord.Color.pink()
+            ).set_image(url=gif_url)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a GIF right now.")
+
+    # 21. Meme
+    @commands.hybrid_command(name="meme", help="Get a random meme. Usage: !meme", extras={"defer": True})
+    @is_registered()
+    async def meme(self, ctx):
+        title, url = await fetch_random_meme()
+        if title and url:
+            embed = discord.Embed(
+                title=title,
+                color=discord.Color.purple()
+            ).set_image(url=url)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a meme right now.")
+
+    # 23. Fox Image
+    @commands.hybrid_command(name="fox", help="Get a random fox image. Usage: !fox", extras={"defer": True})
+    @is_registered()
+    async def fox(self, ctx):
+        image_url = await fetch_random_fox_image()
+        if image_url:
+            embed = discord.Embed(
+                title="🦊 Here's a Cute Fox for You!",
+                color=discord.Color.dark_gray()
+            ).set_image(url=image_url)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a fox image right now.")
+
+    # 59. Random Comic
+    @commands.hybrid_command(name="comic", help="Get a random xkcd comic. Usage: !comic", extras={"defer": True})
+    @is_registered()
+    async def comic(self, ctx):
+        title, img, alt = await fetch_random_comic()
+        if title and img:
+            embed = discord.Embed(
+                title=f"📰 xkcd Comic: {title}",
+                description=alt,
+                color=discord.Color.orange()
+            ).set_image(url=img)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a comic right now.")
+
+    # 60. Random Book
+    @commands.hybrid_command(name="book", help="Get a random book. Usage: !book", extras={"defer": True})
+    @is_registered()
+    async def book(self, ctx):
+        title, authors, description = await fetch_random_book()
+        if title:
+            embed = discord.Embed(
+                title=f"📚 {title}",
+                description=f"**Authors:** {authors}\n**Description:** {description}",
+                color=discord.Color.green()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch a book right now.")
+
+    # 61. Random Pokémon
+    @commands.hybrid_command(name="pokemon", help="Get information about a random Pokémon. Usage: !pokemon", extras={"defer": True})
+    @is_registered()
+    async def pokemon(self, ctx):
+        name, image, types = await fetch_random_pokemon()
+        if image:
+            embed = discord.Embed(
+                title=f"🐱‍👤 Pokémon: {name}",
+                description=f"**Types:** {types}",
+                color=discord.Color.green()
+            ).set_image(url=image)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch Pokémon information right now.")
+
+async def setup(bot):
+    await bot.add_cog(Media(bot))
@@ -0,0 +1,416 @@
+# cogs/utilities.py
+
+import asyncio
+from datetime import datetime
+import discord
+from discord.ext import commands
+
+import http_client
+from cache import cached, singleflight, stale_while_revalidate, stop_feeds, warm_feeds
+import figlet
+import text_transforms
+from core import EMBED_DESCRIPTION_LIMIT, GITHUB_TOKEN, is_registered, reminder_scheduler, send_pages
+
+# Inputs longer than this are rendered in a worker thread to keep the event loop free
+ASCII_THREAD_THRESHOLD = 32
+ASCII_MAX_TEXT = 200
+
+# Helper Functions
+
+@cached("github_user", ttl=600, maxsize=1024, key=lambda username: username.lower())
+@singleflight("github_user", key=lambda username: username.lower())
+async def fetch_github_user(username):
+    """Fetch GitHub user information."""
+    headers = {}
+    if GITHUB_TOKEN:
+        headers['Authorization'] = f'token {GITHUB_TOKEN}'
+    response = await http_client.get(f"https://api.github.com/users/{username}", headers=headers)
+    if response.status_code == 200:
+        data = response.json()
+        name = data.get("name", "N/A")
+        bio = data.get("bio", "N/A")
+        repos = data.get("public_repos", 0)
+        followers = data.get("followers", 0)
+        following = data.get("following", 0)
+        avatar = data.get("avatar_url", "")
+        return name, bio, repos, followers, following, avatar
+    return None
+
+@stale_while_revalidate("trending_repos", fresh_for=3600)
+async def fetch_trending_repositories():
+    """Fetch trending repositories from GitHub Trending API."""
+    # Note: GitHub doesn't provide an official trending API. Using a third-party API.
+    response = await http_client.get("https://ghapi.huchen.dev/repositories?since=daily")
+    if response.status_code == 200:
+        data = response.json()
+        trending_repos = [f"**{repo['name']}** by **{repo['author']}**\n[Repository]({repo['url']})" for repo in data[:5]]
+        return trending_repos
+    return []
+
+@cached("dictionary", ttl=24 * 3600, maxsize=2048, key=lambda word: word.strip().lower())
+async def fetch_dictionary_definition(word):
+    """Fetch the definition of a word from Dictionary API."""
+    response = await http_client.get(f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}")
+    if response.status_code == 200:
+        data = response.json()[0]
+        definitions = data["meanings"][0]["definitions"][0]["definition"]
+        example = data["meanings"][0]["definitions"][0].get("example", "No example provided.")
+        return definitions, example
+    return None, None
+
+async def fetch_random_color():
+    """Fetch a random color from The Color API."""
+    response = await http_client.get("https://www.thecolorapi.com/id?format=json&hex=random")
+    if response.status_code == 200:
+        data = response.json()
+        name = data.get("name", {}).get("value", "N/A")
+        hex_code = f"#{data.get('hex', {}).get('value', '000000')}"
+        return name, hex_code
+    return None, None
+
+# Commands
+
+class Utilities(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        warm_feeds(fetch_trending_repositories)
+
+    async def cog_unload(self):
+        await stop_feeds(fetch_trending_repositories)
+
+    # 1. About Command
+    @commands.hybrid_command(name="about", help="Get information about the bot. Usage: !about", extras={"defer": True})
+    async def about(self, ctx):
+        # Fetch GitHub user data
+        github_username = "polarxcised"
+        github_data = await fetch_github_user(github_username)
+
+        if github_data:
+            name, bio, repos, followers, following, avatar = github_data
+            embed = discord.Embed(
+                title="🤖 About InfoNexus",
+                description="Welcome to InfoNexus! I'm your ultimate Discord companion, here to provide you with a wealth of information, fun facts, and interactive experiences.",
+                color=discord.Color.blue()
+            )
+            embed.set_author(name=name, url=f"https://github.com/{github_username}", icon_url=avatar)
+            embed.add_field(
+                name="⭐ Star Our Project",
+                value="If you enjoy using me, please consider starring our GitHub repository!",
+                inline=False
+            )
+            embed.add_field(
+                name="💻 GitHub Repository",
+                value="[InfoNexus-discord-bot](https://github.com/polarxcised/InfoNexus-discord-bot)",
+                inline=False
+            )
+            embed.add_field(
+                name="📊 GitHub Stats",
+                value=f"**Public Repos:** {repos}\n**Followers:** {followers}\n**Following:** {following}",
+                inline=False
+            )
+            embed.set_thumbnail(url=avatar)
+            github_logo_url = "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png"
+            embed.set_footer(text="Thank you for using InfoNexus!", icon_url=github_logo_url)
+            await ctx.send(embed=embed)
+        else:
+            embed = discord.Embed(
+                title="🤖 About InfoNexus",
+                description="Welcome to InfoNexus! I'm your ultimate Discord companion, here to provide you with a wealth of information, fun facts, and interactive experiences.",
+                color=discord.Color.blue()
+            )
+            embed.add_field(
+                name="⭐ Star Our Project",
+                value="If you enjoy using me, please consider starring our GitHub repository!",
+                inline=False
+            )
+            embed.add_field(
+                name="💻 GitHub Repository",
+                value="[InfoNexus-discord-bot](https://github.com/polarxcised/InfoNexus-discord-bot)",
+                inline=False
+            )
+            embed.set_footer(text="Thank you for using InfoNexus!", icon_url=github_logo_url)
+            await ctx.send(embed=embed)
+
+    # 12. GitHub User Info
+    @commands.hybrid_command(name="github", help="Get GitHub user information. Usage: !github <username>", extras={"defer": True, "limit": "quota"})
+    @is_registered()
+    async def github(self, ctx, username: str = None):
+        if not username:
+            await ctx.send("❗ Please specify a GitHub username. Usage: `!github <username>`")
+            return
+        result = await fetch_github_user(username)
+        if result:
+            name, bio, repos, followers, following, avatar = result
+            embed = discord.Embed(
+                title=f"👤 GitHub User: {username}",
+                description=bio,
+                color=discord.Color.dark_blue()
+            )
+            embed.set_thumbnail(url=avatar)
+            embed.add_field(name="Name", value=name, inline=True)
+            embed.add_field(name="Public Repos", value=repos, inline=True)
+            embed.add_field(name="Followers", value=followers, inline=True)
+            embed.add_field(name="Following", value=following, inline=True)
+            embed.add_field(name="Profile", value=f"[GitHub Profile](https://github.com/{username})", inline=False)
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch GitHub user information. Please check the username.")
+
+    # 18. Trending Repositories
+    @commands.hybrid_command(name="trending_repos", help="Get trending GitHub repositories. Usage: !trending_repos", extras={"defer": True})
+    @is_registered()
+    async def trending_repos(self, ctx):
+        trending = await fetch_trending_repositories()
+        if trending:
+            embed = discord.Embed(
+                title="📈 Trending GitHub Repositories",
+                description="\n\n".join(trending),
+                color=discord.Color.dark_blue()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch trending repositories right now.")
+
+    # 26. Binary Converter
+    @commands.hybrid_command(name="binary", help="Convert text to binary, or binary back to text. Usage: !binary [decode] <text>")
+    @is_registered()
+    async def binary(self, ctx, *, text: str = None):
+        if not text:
+            await ctx.send("❗ Please provide text to convert. Usage: `!binary <text>`")
+            return
+        mode, _, code = text.partition(" ")
+        if mode.lower() == "decode" and code:
+            try:
+                decoded = text_transforms.from_binary(code)
+            except ValueError:
+                await ctx.send("❗ Please provide binary groups separated by spaces, e.g. `!binary decode 01101000 01101001`.")
+                return
+            body = f"**Binary:** {code}\n**Text:** {decoded}"
+        else:
+            body = f"**Text:** {text}\n**Binary:** {text_transforms.to_binary(text)}"
+        await send_pages(ctx, "🔤 Binary Converter", text_transforms.paginate(body, EMBED_DESCRIPTION_LIMIT), discord.Color.blue())
+
+    # 27. Morse Code Converter
+    @commands.hybrid_command(name="morse", help="Convert text to Morse code, or Morse code back to text. Usage: !morse [decode] <text>")
+    @is_registered()
+    async def morse(self, ctx, *, text: str = None):
+        if not text:
+            await ctx.send("❗ Please provide text to convert. Usage: `!morse <text>`")
+            return
+        mode, _, code = text.partition(" ")
+        if mode.lower() == "decode" and code:
+            body = f"**Morse Code:** {code}\n**Text:** {text_transforms.from_morse(code)}"
+        else:
+            body = f"**Text:** {text}\n**Morse Code:** {text_transforms.to_morse(text)}"
+        await send_pages(ctx, "📡 Morse Code Converter", text_transforms.paginate(body, EMBED_DESCRIPTION_LIMIT), discord.Color.dark_purple())
+
+    # 28. Reverse Text
+    @commands.hybrid_command(name="reverse_text", help="Reverse the provided text. Usage: !reverse_text <text>")
+    @is_registered()
+    async def reverse_text(self, ctx, *, text: str = None):
+        if not text:
+            await ctx.send("❗ Please provide text to reverse. Usage: `!reverse_text <text>`")
+            return
+        body = f"**Original:** {text}\n**Reversed:** {text_transforms.reverse(text)}"
+        await send_pages(ctx, "🔄 Reverse Text", text_transforms.paginate(body, EMBED_DESCRIPTION_LIMIT), discord.Color.dark_red())
+
+    # 29. Unshorten URL
+    @commands.hybrid_command(name="unshorten", help="Unshorten a shortened URL. Usage: !unshorten <url>", extras={"defer": True})
+    @is_registered()
+    async def unshorten(self, ctx, url: str = None):
+        if not url:
+            await ctx.send("❗ Please provide a URL to unshorten. Usage: `!unshorten <url>`")
+            return
+        try:
+            response = await http_client.head(url, allow_redirects=True, timeout=10)
+            final_url = response.url
+            embed = discord.Embed(
+                title="🔗 URL Unshortener",
+                description=f"**Shortened URL:** {url}\n**Original URL:** {final_url}",
+                color=discord.Color.teal()
+            )
+            await ctx.send(embed=embed)
+        except Exception as e:
+            await ctx.send("❗ Couldn't unshorten the URL. Please check the URL and try again.")
+
+    # 31. Reminder
+    @commands.hybrid_command(name="reminder", help="Set a reminder. Usage: !reminder <time_in_seconds> <message>")
+    @is_registered()
+    async def reminder(self, ctx, time_seconds: int = None, *, message: str = None):
+        if time_seconds is None or message is None:
+            await ctx.send("❗ Please provide time in seconds and a message. Usage: `!reminder <time_in_seconds> <message>`")
+            return
+        await ctx.send(f"⏰ Reminder set for {time_seconds} seconds from now.")
+        await reminder_scheduler.schedule(
+            time_seconds, ctx.channel.id, ctx.author.id, message, ctx.guild.id if ctx.guild else None
+        )
+
+    # 32. Poll
+    @commands.hybrid_command(name="poll", help="Create a poll. Usage: !poll <question>")
+    @is_registered()
+    async def poll(self, ctx, *, question: str = None):
+        if not question:
+            await ctx.send("❗ Please provide a poll question. Usage: `!poll <question>`")
+            return
+        embed = discord.Embed(
+            title="📊 New Poll",
+            description=question,
+            color=discord.Color.blue()
+        )
+        message = await ctx.send(embed=embed)
+        await message.add_reaction("👍")
+        await message.add_reaction("👎")
+
+    # 33. Server Info
+    @commands.hybrid_command(name="serverinfo", help="Get information about the server. Usage: !serverinfo")
+    @is_registered()
+    async def serverinfo(self, ctx):
+        guild = ctx.guild
+        embed = discord.Embed(
+            title=f"📋 Server Info - {guild.name}",
+            description=guild.description or "No description.",
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Owner", value=str(guild.owner), inline=True)
+        embed.add_field(name="Region", value=str(guild.region), inline=True)
+        embed.add_field(name="Member Count", value=guild.member_count, inline=True)
+        embed.add_field(name="Roles", value=len(guild.roles), inline=True)
+        if guild.icon:
+            embed.set_thumbnail(url=guild.icon.url)
+        await ctx.send(embed=embed)
+
+    # 34. User Info
+    @commands.hybrid_command(name="userinfo", help="Get information about a user. Usage: !userinfo <@user>")
+    @is_registered()
+    async def userinfo(self, ctx, member: discord.Member = None):
+        member = member or ctx.author
+        embed = discord.Embed(
+            title=f"👤 User Info - {member}",
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="ID", value=member.id, inline=False)
+        embed.add_field(name="Joined Server", value=member.joined_at.strftime("%Y-%m-%d"), inline=False)
+        embed.add_field(name="Account Created", value=member.created_at.strftime("%Y-%m-%d"), inline=False)
+        if member.avatar:
+            embed.set_thumbnail(url=member.avatar.url)
+        await ctx.send(embed=embed)
+
+    # 35. Avatar
+    @commands.hybrid_command(name="avatar", help="Get a user's avatar. Usage: !avatar <@user>")
+    @is_registered()
+    async def avatar(self, ctx, member: discord.Member = None):
+        member = member or ctx.author
+        embed = discord.Embed(
+            title=f"{member}'s Avatar",
+            color=discord.Color.green()
+        ).set_image(url=member.avatar.url)
+        await ctx.send(embed=embed)
+
+    # 36. Uptime
+    @commands.hybrid_command(name="uptime", help="Check how long the bot has been online. Usage: !uptime")
+    @is_registered()
+    async def uptime(self, ctx):
+        current_time = datetime.utcnow()
+        delta = current_time - self.bot.launch_time
+        days, seconds = delta.days, delta.seconds
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        seconds = seconds % 60
+        embed = discord.Embed(
+            title="⏰ Bot Uptime",
+            description=f"{days}d {hours}h {minutes}m {seconds}s",
+            color=discord.Color.blue()
+        )
+        await ctx.send(embed=embed)
+
+    # 37. ASCII Art
+    @commands.hybrid_command(name="ascii", help="Convert text to ASCII art. Usage: !ascii [font=block|hash|banner] <text>")
+    @is_registered()
+    async def ascii_art(self, ctx, *, text: str = None):
+        font = figlet.DEFAULT_FONT
+        if text and text.startswith("font="):
+            option, _, text = text.partition(" ")
+            font = option[len("font="):].lower()
+            if font not in figlet.FONTS:
+                await ctx.send(f"❗ Unknown font. Available fonts: {', '.join(figlet.FONTS)}")
+                return
+        if not text:
+            await ctx.send("❗ Please provide text to convert. Usage: `!ascii <text>`")
+            return
+        if len(text) > ASCII_MAX_TEXT:
+            await ctx.send(f"❗ Please keep the text under {ASCII_MAX_TEXT} characters.")
+            return
+        if len(text) > ASCII_THREAD_THRESHOLD:
+            blocks = await asyncio.get_running_loop().run_in_executor(None, figlet.render, text, font)
+        else:
+            blocks = figlet.render(text, font)
+        pages = (f"```\n{page}\n```" for page in figlet.paginate(blocks, EMBED_DESCRIPTION_LIMIT - len("```\n\n```")))
+        await send_pages(ctx, "🖋️ ASCII Art", pages, discord.Color.dark_gold())
+
+    # 38. Dictionary Definition
+    @commands.hybrid_command(name="define", help="Get the definition of a word. Usage: !define <word>", extras={"defer": True})
+    @is_registered()
+    async def define(self, ctx, *, word: str = None):
+        if not word:
+            await ctx.send("❗ Please specify a word. Usage: `!define <word>`")
+            return
+        definition, example = await fetch_dictionary_definition(word)
+        if definition:
+            embed = discord.Embed(
+                title=f"📖 Definition of {word.title()}",
+                description=f"**Definition:** {definition}\n**Example:** {example}",
+                color=discord.Color.dark_blue()
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't find the definition. Please check the word and try again.")
+
+    # 39. Language Translation
+    @commands.hybrid_command(name="translate", help="Translate text to a specified language. Usage: !translate <language_code> <text>", extras={"defer": True, "limit": "quota"})
+    @is_registered()
+    async def translate(self, ctx, language: str = None, *, text: str = None):
+        if not language or not text:
+            await ctx.send("❗ Please provide a language code and text. Usage: `!translate <language_code> <text>`")
+            return
+        try:
+            response = await http_client.post(
+                "https://libretranslate.de/translate",
+                data={
+                    "q": text,
+                    "source": "auto",
+                    "target": language.lower(),
+                    "format": "text"
+                }
+            )
+            if response.status_code == 200:
+                translated_text = response.json().get("translatedText", "")
+                embed = discord.Embed(
+                    title="📝 Translate Text",
+                    description=f"**Original:** {text}\n**Translated ({language.upper()}):** {translated_text}",
+                    color=discord.Color.purple()
+                )
+                await ctx.send(embed=embed)
+            else:
+                await ctx.send("❗ Couldn't translate the text. Please check the language code and try again.")
+        except Exception as e:
+            await ctx.send("❗ An error occurred while translating the text.")
+
+    # 62. Random Color
+    @commands.hybrid_command(name="color", help="Get information about a random color. Usage: !color", extras={"defer": True})
+    @is_registered()
+    async def color(self, ctx):
+        name, hex_code = await fetch_random_color()
+        if name and hex_code:
+            embed = discord.Embed(
+                title=f"🎨 Color: {name}",
+                description=f"**Hex Code:** {hex_code}",
+                color=int(hex_code[1:], 16)
+            )
+            await ctx.send(embed=embed)
+        else:
+            await ctx.send("❗ Couldn't fetch color information right now.")
+
+async def setup(bot):
+    await bot.add_cog(Utilities(bot))
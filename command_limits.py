@@ -0,0 +1,149 @@
+# command_limits.py
+
+import os
+import time
+from array import array
+from collections import OrderedDict
+
+# Per command class: (requests per user, requests per guild, window in seconds)
+DEFAULT_CLASS_LIMITS = {
+    # Answered locally, e.g. !morse or !poll
+    "local": (10, 60, 10),
+    # Backed by an upstream API, e.g. !meme or !dog
+    "upstream": (5, 30, 10),
+    # Upstreams with small per-minute or daily quotas, e.g. !stock or !movie
+    "quota": (2, 10, 60)
+}
+
+# Sub-buckets per window; the window slides in steps of window / WINDOW_BUCKETS
+WINDOW_BUCKETS = 10
+
+# Most keys one window tracks before the least recently used is dropped
+MAX_KEYS = int(os.getenv("COMMAND_RATE_LIMIT_KEYS", "100000"))
+
+
+class SlidingWindow:
+    """Per-key request counts over the last `window` seconds, kept in small ring buffers.
+
+    Each key holds `buckets` 16-bit counters, one per window / buckets slice
+    of time, and the slot it was last touched in; counters for slices that
+    have slid out of the window are zeroed lazily on the next access. At most
+    `max_keys` keys are kept, dropping the least recently used, so memory is
+    bounded no matter how many users show up; a dropped key has usually been
+    idle for longer than the window anyway.
+    """
+
+    def __init__(self, limit, window, buckets=WINDOW_BUCKETS, max_keys=MAX_KEYS):
+        self.limit = limit
+        self.window = window
+        self.buckets = buckets
+        self.width = window / buckets
+        self.max_keys = max_keys
+        # key -> [last slot, blocked until, counters]
+        self._keys = OrderedDict()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _state(self, key, slot):
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = [slot, 0.0, array("H", bytes(2 * self.buckets))]
+            if len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+            return state
+        self._keys.move_to_end(key)
+        elapsed = slot - state[0]
+        counts = state[2]
+        if elapsed >= self.buckets:
+            for index in range(self.buckets):
+                counts[index] = 0
+        else:
+            for step in range(1, elapsed + 1):
+                counts[(state[0] + step) % self.buckets] = 0
+        state[0] = slot
+        return state
+
+    def retry_after(self, key, now=None):
+        """Seconds until `key` may make another request; 0 when it is under the limit."""
+        now = time.monotonic() if now is None else now
+        slot = int(now // self.width)
+        counts = self._state(key, slot)[2]
+        if sum(counts) < self.limit:
+            return 0.0
+        # Wait for the oldest slice that still holds requests to slide out of the window
+        for age in range(self.buckets - 1, -1, -1):
+            if counts[(slot - age) % self.buckets]:
+                return max(0.0, (slot - age + self.buckets) * self.width - now)
+        return 0.0
+
+    def add(self, key, now=None):
+        now = time.monotonic() if now is None else now
+        slot = int(now // self.width)
+        counts = self._state(key, slot)[2]
+        index = slot % self.buckets
+        counts[index] = min(counts[index] + 1, 0xFFFF)
+
+    def first_rejection(self, key, retry_after, now=None):
+        """Record a rejection; True only for the first one until `key` is allowed again."""
+        now = time.monotonic() if now is None else now
+        state = self._keys.get(key)
+        if state is None or now < state[1]:
+            return False
+        state[1] = now + retry_after
+        return True
+
+
+class CommandLimiter:
+    """Sliding-window limits per user and per guild for each command, by command class."""
+
+    def __init__(self, limits):
+        self._windows = {}
+        for command_class, (per_user, per_guild, window) in limits.items():
+            self.set_limit(command_class, per_user, per_guild, window)
+
+    def set_limit(self, command_class, per_user, per_guild, window):
+        self._windows[command_class] = (SlidingWindow(per_user, window), SlidingWindow(per_guild, window))
+
+    def hit(self, command_class, command, user_id, guild_id=None):
+        """Count one use of `command`; return (retry_after, first_rejection).
+
+        `retry_after` is 0 when the call is allowed. Rejected calls aren't
+        counted, so a user who keeps retrying isn't locked out for longer.
+        """
+        windows = self._windows.get(command_class)
+        if windows is None:
+            return 0.0, False
+        user_window, guild_window = windows
+        now = time.monotonic()
+        user_key = (user_id, command)
+        retry_after = user_window.retry_after(user_key, now)
+        if not retry_after and guild_id is not None:
+            retry_after = guild_window.retry_after((guild_id, command), now)
+        if retry_after:
+            return retry_after, user_window.first_rejection(user_key, retry_after, now)
+        user_window.add(user_key, now)
+        if guild_id is not None:
+            guild_window.add((guild_id, command), now)
+        return 0.0, False
+
+    def stats(self):
+        return {
+            command_class: {"users": len(user_window), "guilds": len(guild_window)}
+            for command_class, (user_window, guild_window) in self._windows.items()
+        }
+
+
+def parse_limits(spec):
+    """Parse `class=per_user/per_guild/seconds` entries separated by commas."""
+    limits = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        command_class, _, budget = entry.partition("=")
+        per_user, per_guild, window = budget.split("/")
+        limits[command_class.strip()] = (int(per_user), int(per_guild), float(window))
+    return limits
+
+
+limits = dict(DEFAULT_CLASS_LIMITS)
+limits.update(parse_limits(os.getenv("COMMAND_RATE_LIMITS", "")))
+command_limiter = CommandLimiter(limits)
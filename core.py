@@ -0,0 +1,498 @@
+# core.py
+
+import os
+import discord
+from discord import app_commands
+from discord.ext import commands
+from discord.ui import Button, View
+from dotenv import load_dotenv
+
+# Load environment variables from .env file before the modules below read their settings
+load_dotenv()
+
+import http_client
+from cache import cancel_refreshes
+from cassette import Cassette
+import deadline
+import metrics
+from circuit_breaker import CircuitOpen
+from command_limits import command_limiter
+from throttle import RateLimited, configured_limits, host_limiter
+from trivia import trivia_bank
+from help_index import HelpIndex
+from reminders import ReminderScheduler, ReminderStore
+import sharding
+from watchdog import Watchdog
+from user_store import JSONUserStore, SQLiteUserStore, UserRegistry
+import asyncio
+import itertools
+import logging
+import math
+import signal
+import time
+from datetime import datetime
+from discord import Activity, ActivityType
+
+# Retrieve API keys and tokens from environment variables
+BOT_TOKEN = os.getenv("BOT_TOKEN")
+TENOR_API_KEY = os.getenv("TENOR_API_KEY")
+NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+OMDB_API_KEY = os.getenv("OMDB_API_KEY")
+ALPHA_VANTAGE_API_KEY = os.getenv("ALPHA_VANTAGE_API_KEY")
+NASA_API_KEY = os.getenv("NASA_API_KEY")
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")  # Optional: For authenticated GitHub API requests
+
+# Validate essential API keys
+required_keys = {
+    "BOT_TOKEN": BOT_TOKEN,
+    "TENOR_API_KEY": TENOR_API_KEY,
+    "NEWS_API_KEY": NEWS_API_KEY,
+    "OMDB_API_KEY": OMDB_API_KEY,
+    "ALPHA_VANTAGE_API_KEY": ALPHA_VANTAGE_API_KEY,
+    "NASA_API_KEY": NASA_API_KEY
+}
+
+missing_keys = [key for key, value in required_keys.items() if not value]
+if missing_keys:
+    missing = ", ".join(missing_keys)
+    raise EnvironmentError(f"Missing required environment variables: {missing}")
+
+# Authenticated GitHub requests get a much larger hourly budget, unless HTTP_RATE_LIMITS sets one
+if GITHUB_TOKEN and "api.github.com" not in configured_limits:
+    host_limiter.set_limit("api.github.com", 5000, 3600, 50)
+
+# Optionally record every upstream response to, or replay them from, a cassette archive
+HTTP_CASSETTE = os.getenv("HTTP_CASSETTE")
+if HTTP_CASSETTE:
+    http_client.set_cassette(Cassette(HTTP_CASSETTE, os.getenv("HTTP_CASSETTE_MODE", "replay")))
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('discord')
+
+# Define bot intents
+# Every command is also a slash command; `!` prefix commands need the privileged message content
+# intent, so with PREFIX_COMMANDS=0 the bot skips it and only parses messages that mention it
+PREFIX_COMMANDS = os.getenv("PREFIX_COMMANDS", "1") != "0"
+intents = discord.Intents.default()
+intents.message_content = PREFIX_COMMANDS
+
+# Command Extensions
+# Each cog lives in cogs/<name>.py and can be loaded, unloaded or reloaded while the bot stays connected
+EXTENSION_PACKAGE = "cogs"
+DEFAULT_EXTENSIONS = ("media", "facts", "finance", "utilities", "games")
+EXTENSIONS = [name.strip() for name in os.getenv("EXTENSIONS", ",".join(DEFAULT_EXTENSIONS)).split(",") if name.strip()]
+
+def extension_path(name):
+    return name if name.startswith(f"{EXTENSION_PACKAGE}.") else f"{EXTENSION_PACKAGE}.{name.lower()}"
+
+# Help Pages
+def help_entries():
+    """Yield (name, help, category) for every command listed by !what."""
+    for command in bot.commands:
+        if not command.hidden and command.name != "what":
+            # Commands are listed under their cog; core commands fall under "utilities"
+            category = command.extras.get("category") or (command.cog_name or "utilities").lower()
+            yield command.name, command.help, category
+
+def help_page_embed(heading, number, total, lines):
+    return discord.Embed(
+        title=f"📜 {heading} (Page {number}/{total})",
+        description="\n\n".join(lines),
+        color=discord.Color.gold()
+    )
+
+# Built on first use and rebuilt only after the command set changes
+help_index = HelpIndex(help_entries, help_page_embed)
+
+class InfoNexusBot(commands.AutoShardedBot):
+    async def setup_hook(self):
+        # Open the shared HTTP session inside the bot's event loop
+        await http_client.start()
+        await metrics.start()
+        stall_watchdog.start()
+        user_registry.load()
+        # Cogs start their own pools, feed refreshes and background loops in cog_load
+        for name in EXTENSIONS:
+            await self.load_extension(extension_path(name))
+        reminder_scheduler.start()
+        if hasattr(signal, "SIGHUP"):
+            loop = asyncio.get_running_loop()
+            # `kill -HUP` (or launcher.py forwarding it) reloads every cog without reconnecting
+            loop.add_signal_handler(signal.SIGHUP, lambda: asyncio.ensure_future(self.reload_extensions()))
+            # bot.run only handles Ctrl+C; launcher.py stops workers with SIGTERM, which must also
+            # flush pending registrations and finish a recording cassette
+            loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.ensure_future(self.close()))
+
+    async def reload_extensions(self):
+        """Reload every loaded extension in place; one that fails to import keeps its old version."""
+        reloaded, failed = [], []
+        for name in tuple(self.extensions):
+            try:
+                await self.reload_extension(name)
+                reloaded.append(name)
+            except commands.ExtensionError as e:
+                logger.error(f"Reloading {name} failed: {e}")
+                failed.append(name)
+        logger.info(f"Reloaded extensions: {', '.join(reloaded) or 'none'}")
+        return reloaded, failed
+
+    # Set by the first close(); SIGTERM and bot.run's own cleanup may both close the bot
+    _shutdown = None
+
+    async def close(self):
+        if self._shutdown is None:
+            self._shutdown = asyncio.ensure_future(self._close_services())
+        await asyncio.shield(self._shutdown)
+
+    async def _close_services(self):
+        stall_watchdog.stop()
+        reminder_scheduler.stop()
+        try:
+            # Unloads every extension, which stops the cogs' background work
+            await super().close()
+        finally:
+            # Refreshes left running would reopen the HTTP session after it closes
+            await cancel_refreshes()
+            await trivia_bank.stop()
+            await user_registry.flush()
+            user_store.close()
+            reminder_store.close()
+            await http_client.close()
+            await metrics.stop()
+
+    def add_command(self, command):
+        if isinstance(command, commands.HybridCommand) and command.app_command is not None:
+            # Slash command descriptions leave out the `Usage: !...` hint meant for prefix users
+            command.app_command.description = command.short_doc.split(" Usage:")[0] or command.app_command.description
+        super().add_command(command)
+        help_index.invalidate()
+
+    def remove_command(self, name):
+        command = super().remove_command(name)
+        help_index.invalidate()
+        return command
+
+# Initialize bot; launcher.py sets SHARD_COUNT/SHARD_IDS per worker, otherwise discord.py picks the shard count
+bot = InfoNexusBot(
+    command_prefix="!" if PREFIX_COMMANDS else commands.when_mentioned,
+    intents=intents, description="InfoNexus - The Ultimate Discord Bot!", shard_count=sharding.SHARD_COUNT, shard_ids=sharding.SHARD_IDS
+)
+
+# Initialize user data storage
+USER_DATA_FILE = "user_data.json"
+USER_DB_FILE = os.getenv("USER_DB_FILE", "user_data.db")
+USER_STORE_BACKEND = os.getenv("USER_STORE", "sqlite").lower()
+# Reminders always live in SQLite, in the user database unless this says otherwise (even with USER_STORE=json)
+REMINDER_DB_FILE = os.getenv("REMINDER_DB_FILE", USER_DB_FILE)
+
+if USER_STORE_BACKEND == "json":
+    user_store = JSONUserStore(USER_DATA_FILE)
+else:
+    user_store = SQLiteUserStore(USER_DB_FILE)
+    user_store.import_json(USER_DATA_FILE)
+
+def load_user_data():
+    return user_store.load_all()
+
+def save_user_data(data):
+    """Upsert the given {user_id: record} entries into the user store."""
+    user_store.upsert_many(data)
+
+# Pending reminders are kept in SQLite and dispatched from a min-heap
+async def send_reminders(batch):
+    await asyncio.gather(*(send_reminder(reminder) for reminder in batch), return_exceptions=True)
+
+async def send_reminder(reminder):
+    try:
+        channel = bot.get_channel(reminder.channel_id) or await bot.fetch_channel(reminder.channel_id)
+        await channel.send(f"🔔 **Reminder:** {reminder.message}")
+    except discord.DiscordException as e:
+        logger.warning(f"Couldn't deliver reminder {reminder.id}: {e}")
+
+reminder_store = ReminderStore(REMINDER_DB_FILE)
+# Each worker of a sharded cluster only dispatches reminders for its own guilds
+reminder_scheduler = ReminderScheduler(
+    reminder_store, send_reminders, owns=lambda reminder: sharding.owns_guild(reminder.guild_id)
+)
+
+# Registered users are held in memory and written back in the background; other
+# shard workers may register users too, so a sharded worker checks the store on a miss
+user_registry = UserRegistry(
+    load_user_data, save_user_data, fetch=user_store.get if sharding.SHARD_IDS is not None else None
+)
+
+def command_codes():
+    """Map each command callback's code object to its command name, for stall attribution."""
+    codes = {}
+    for command in bot.walk_commands():
+        code = command.callback.__code__
+        # Commands built by one factory share a code object; name those after the factory
+        codes[code] = code.co_name if code in codes else command.qualified_name
+    return codes
+
+# Reports event loop stalls along with the command and fetch helper that caused them
+stall_watchdog = Watchdog(command_codes)
+
+@bot.event
+async def on_ready():
+    await bot.change_presence(activity=Activity(type=ActivityType.watching, name="AnshKabra2012"))
+    print(f"Logged in as {bot.user}")
+
+# Command Rate Limits
+class CommandRateLimited(commands.CheckFailure):
+    """Raised when a user or guild has used a command too often within its sliding window."""
+
+    def __init__(self, command, retry_after, notify):
+        super().__init__(f"{command} is rate limited, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+        self.notify = notify
+
+def command_class(command):
+    """Rate limit class for a command: set in its extras, else "upstream" for network-backed ones."""
+    return command.extras.get("limit") or ("upstream" if command.extras.get("defer") else "local")
+
+def enforce_rate_limits(ctx):
+    retry_after, first_rejection = command_limiter.hit(
+        command_class(ctx.command), ctx.command.qualified_name, ctx.author.id, ctx.guild.id if ctx.guild else None
+    )
+    if retry_after:
+        raise CommandRateLimited(ctx.command.qualified_name, retry_after, first_rejection)
+
+@bot.before_invoke
+async def start_command_deadline(ctx):
+    # Runs once per invocation, after the checks; a rejected call never reaches its upstream
+    enforce_rate_limits(ctx)
+    # Slash commands that wait on an upstream are acknowledged at once; the reply replaces "thinking..."
+    if ctx.interaction is not None and ctx.command.extras.get("defer"):
+        await ctx.defer()
+    # Every outbound call made by this command shares one latency budget
+    deadline.start(deadline.budget_for(ctx.command.qualified_name))
+    ctx.started_at = time.perf_counter()
+
+def record_command_metrics(ctx, error=None):
+    if ctx.command is None:
+        return
+    started = getattr(ctx, "started_at", None)
+    elapsed = None if started is None else time.perf_counter() - started
+    metrics.observe_command(ctx.command.qualified_name, elapsed, error)
+
+@bot.event
+async def on_command_completion(ctx):
+    record_command_metrics(ctx)
+
+# Interactive Views
+
+class HelpView(View):
+    def __init__(self, pages):
+        super().__init__(timeout=180)
+        # Shared, prebuilt pages; the view itself only tracks which one is shown
+        self.pages = pages
+        self.current = 0
+
+        # Previous Button
+        self.previous_button = Button(label="Previous", style=discord.ButtonStyle.secondary)
+        self.previous_button.callback = self.previous_page
+        self.add_item(self.previous_button)
+
+        # Next Button
+        self.next_button = Button(label="Next", style=discord.ButtonStyle.secondary)
+        self.next_button.callback = self.next_page
+        self.add_item(self.next_button)
+
+    async def previous_page(self, interaction: discord.Interaction):
+        if self.current > 0:
+            self.current -= 1
+            await interaction.response.edit_message(embed=self.pages[self.current], view=self)
+
+    async def next_page(self, interaction: discord.Interaction):
+        if self.current < len(self.pages) - 1:
+            self.current += 1
+            await interaction.response.edit_message(embed=self.pages[self.current], view=self)
+
+    async def on_timeout(self):
+        # Disable buttons on timeout
+        for child in self.children:
+            child.disabled = True
+        if hasattr(self, 'message'):
+            await self.message.edit(view=self)
+
+# Paginated Output
+EMBED_DESCRIPTION_LIMIT = 4096
+MAX_OUTPUT_PAGES = 10
+
+async def send_pages(ctx, title, pages, color):
+    """Send lazily generated pages as a series of embeds, stopping after MAX_OUTPUT_PAGES."""
+    for number, page in enumerate(pages, 1):
+        if number > MAX_OUTPUT_PAGES:
+            await ctx.send(f"❗ Output truncated after {MAX_OUTPUT_PAGES} pages.")
+            break
+        embed = discord.Embed(
+            title=title if number == 1 else f"{title} (continued)",
+            description=page,
+            color=color
+        )
+        await ctx.send(embed=embed)
+
+# Enforced Registration Decorator
+def is_registered():
+    async def predicate(ctx):
+        return await user_registry.lookup(ctx.author.id) is not None
+    return commands.check(predicate)
+
+# Slash Command Autocomplete
+def autocomplete_choices(values, current, limit=25):
+    """Return choices for the first `limit` of `values` that start with what the user has typed."""
+    current = current.strip().lower()
+    matches = (value for value in values if value.startswith(current))
+    return [app_commands.Choice(name=value, value=value) for value in itertools.islice(matches, limit)]
+
+# Core Commands (the rest live in the cogs/ extensions)
+
+# Register Command
+@bot.hybrid_command(name="register", help="Register yourself to use the bot. Usage: !register <username>")
+async def register(ctx, username: str = None):
+    if not username:
+        await ctx.send("❗ Please provide a username. Usage: `!register <username>`")
+        return
+    user_registry.register(ctx.author.id, {
+        "username": username,
+        "registered_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+    })
+    embed = discord.Embed(
+        title="✅ Registration Successful!",
+        description=f"Welcome, **{username}**! You can now access all the bot's features.",
+        color=discord.Color.green()
+    )
+    await ctx.send(embed=embed)
+
+# Event Loop Stall Reports (bot owner only)
+@bot.command(name="stalls", hidden=True, help="Show recent event loop stall reports. Usage: !stalls [count]")
+@commands.is_owner()
+async def stalls(ctx, count: int = 5):
+    reports = list(stall_watchdog.reports)[-max(1, count):]
+    if not reports:
+        await ctx.send(f"✅ No event loop stalls longer than {stall_watchdog.threshold}s recorded.")
+        return
+    # One page per report, newest first
+    entries = []
+    for report in reversed(reports):
+        stack = "\n".join(report["stack"][-6:])
+        entries.append(
+            f"**{report['at']}** blocked for **{report['blocked_for']}s**\n"
+            f"Command: `{report['command'] or 'none'}` · Helper: `{report['helper'] or 'none'}`\n"
+            f"```\n{stack}\n```"
+        )
+    await send_pages(ctx, "🐢 Event Loop Stalls", entries, discord.Color.orange())
+
+# Extension Management (bot owner only)
+@bot.command(name="load", hidden=True, help="Load a command extension. Usage: !load <extension>")
+@commands.is_owner()
+async def load(ctx, name: str):
+    # The cog's pools and loops would otherwise inherit this command's deadline and die with it
+    deadline.clear()
+    try:
+        await bot.load_extension(extension_path(name))
+    except commands.ExtensionError as e:
+        await ctx.send(f"❗ Couldn't load `{name}`: {e}")
+        return
+    await ctx.send(f"✅ Loaded `{extension_path(name)}`.")
+
+@bot.command(name="unload", hidden=True, help="Unload a command extension. Usage: !unload <extension>")
+@commands.is_owner()
+async def unload(ctx, name: str):
+    try:
+        await bot.unload_extension(extension_path(name))
+    except commands.ExtensionError as e:
+        await ctx.send(f"❗ Couldn't unload `{name}`: {e}")
+        return
+    await ctx.send(f"✅ Unloaded `{extension_path(name)}`.")
+
+@bot.command(name="reload", hidden=True, help="Reload one or every command extension in place. Usage: !reload [extension]")
+@commands.is_owner()
+async def reload(ctx, name: str = None):
+    # The cogs' pools and loops would otherwise inherit this command's deadline and die with it
+    deadline.clear()
+    if name is None:
+        reloaded, failed = await bot.reload_extensions()
+        message = f"✅ Reloaded {len(reloaded)} extension(s)."
+        if failed:
+            message += f" ❗ Failed: {', '.join(failed)} (still running the previous version; see the log)."
+        await ctx.send(message)
+        return
+    try:
+        await bot.reload_extension(extension_path(name))
+    except commands.ExtensionError as e:
+        await ctx.send(f"❗ Couldn't reload `{name}`: {e}")
+        return
+    await ctx.send(f"✅ Reloaded `{extension_path(name)}`.")
+
+# Slash Command Sync (bot owner only)
+@bot.command(name="sync", hidden=True, help="Publish slash commands to Discord. Usage: !sync [guild]")
+@commands.is_owner()
+async def sync(ctx, scope: str = None):
+    # Global commands can take up to an hour to appear; `!sync guild` publishes them to this server instantly
+    if scope == "guild" and ctx.guild:
+        bot.tree.copy_global_to(guild=ctx.guild)
+        synced = await bot.tree.sync(guild=ctx.guild)
+        await ctx.send(f"✅ Synced {len(synced)} slash commands to this server.")
+    else:
+        synced = await bot.tree.sync()
+        await ctx.send(f"✅ Synced {len(synced)} slash commands globally.")
+
+# Help Command
+
+@bot.hybrid_command(name="what", help="List available commands, optionally by category or name prefix. Usage: !what [category|prefix]")
+async def what(ctx, *, query: str = None):
+    pages = help_index.pages(query)
+    if not pages:
+        if query:
+            await ctx.send(f"❗ No commands match `{query}`. Categories: {', '.join(help_index.categories)}.")
+        else:
+            await ctx.send("❗ No commands available.")
+        return
+
+    view = HelpView(pages)
+    message = await ctx.send(embed=pages[0], view=view)
+    view.message = message
+
+@what.autocomplete("query")
+async def what_query_autocomplete(interaction, current):
+    return autocomplete_choices(help_index.complete(current), "")
+
+# Error Handling
+def unwrap_command_error(error):
+    """Return the exception a command raised, whether it ran as a prefix or a slash command."""
+    while isinstance(error, (commands.CommandInvokeError, commands.HybridCommandError, app_commands.CommandInvokeError)):
+        error = error.original
+    return error
+
+@bot.event
+async def on_command_error(ctx, error):
+    original = unwrap_command_error(error)
+    record_command_metrics(ctx, original)
+    if isinstance(error, commands.MissingRequiredArgument):
+        await ctx.send("❗ Missing arguments. Please check the command usage with `!what`.")
+    elif isinstance(error, commands.CommandNotFound):
+        await ctx.send("❗ Command not found. Use `!what` to see the list of available commands.")
+    elif isinstance(error, CommandRateLimited):
+        # Only the first rejection of a burst gets a reply, so spam doesn't turn into bot messages;
+        # slash commands must always be answered
+        if error.notify or ctx.interaction is not None:
+            await ctx.send(
+                f"⏳ Slow down! You can use `{ctx.command.qualified_name}` again in {math.ceil(error.retry_after)} seconds.",
+                ephemeral=True
+            )
+    elif isinstance(error, commands.NotOwner):
+        await ctx.send("❗ This command is restricted to the bot owner.")
+    elif isinstance(error, commands.CheckFailure):
+        await ctx.send("❗ You need to register first using `!register <username>`.")
+    elif isinstance(original, deadline.DeadlineExceeded):
+        await ctx.send("⌛ That took too long to answer. The service may be slow right now, please try again.")
+    elif isinstance(original, CircuitOpen):
+        await ctx.send("❗ This service is currently unavailable. Please try again later.")
+    elif isinstance(original, RateLimited):
+        await ctx.send(f"⏳ This service is busy right now. Please try again in {original.retry_after:.0f} seconds.")
+    else:
+        await ctx.send("❗ An unexpected error occurred. Please try again later.")
+        logger.error(f"Error: {error}")  # Log the error to console
@@ -0,0 +1,105 @@
+# corpus.py
+
+import json
+import os
+import random
+from collections import OrderedDict, namedtuple
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "corpus.json")
+
+# Most (channel, category) cursors kept before the least recently used is dropped
+MAX_CURSORS = 10000
+
+# Feistel rounds in the permutation each cursor walks
+FEISTEL_ROUNDS = 6
+
+# A new cycle doesn't open with any of the previous cycle's last few picks (at most a quarter of the category)
+RECENT_PICKS = 3
+# Seeds tried per cycle before accepting an overlap
+MAX_RESEEDS = 16
+
+Category = namedtuple("Category", "name help title color entries")
+
+
+def load_corpus(path=CORPUS_FILE):
+    """Load every static content category into immutable tuples, keyed by command name.
+
+    Raises `ValueError` for a category without entries; the picker can't serve one.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    corpus = OrderedDict()
+    for item in data["categories"]:
+        if not item["entries"]:
+            raise ValueError(f"Corpus category {item['name']!r} in {path} has no entries")
+        corpus[item["name"]] = Category(
+            item["name"], item["help"], item["title"], item["color"], tuple(item["entries"])
+        )
+    return corpus
+
+
+class ShuffledPicker:
+    """Pick entries in a pseudo-random order without repeats per channel until a category is exhausted.
+
+    Each (channel, category) pair walks a permutation of the entry indices
+    keyed by a random seed: a small Feistel network over the next power of
+    four, cycle-walked back into range. A cursor is just the seed and a
+    position no matter how large the category is, and every pick is O(1)
+    expected. Each completed cycle draws a new seed whose first picks avoid
+    the last few of the previous cycle.
+    """
+
+    def __init__(self, max_cursors=MAX_CURSORS):
+        self.max_cursors = max_cursors
+        self._cursors = OrderedDict()
+
+    def pick(self, category, channel_id):
+        entries = category.entries
+        size = len(entries)
+        key = (channel_id, category.name)
+        cursor = self._cursors.get(key)
+        if cursor is None:
+            cursor = self._cursors[key] = [random.getrandbits(32), 0]
+        elif cursor[1] >= size:
+            cursor[:] = [_next_seed(cursor[0], size), 0]
+        self._cursors.move_to_end(key)
+        if len(self._cursors) > self.max_cursors:
+            self._cursors.popitem(last=False)
+        seed, position = cursor
+        cursor[1] = position + 1
+        return entries[_permute(position, seed, size)]
+
+
+def _mix(value, seed, round_number):
+    value = (value * 0x9E3779B1 + seed + round_number * 0x85EBCA6B) & 0xFFFFFFFF
+    value ^= value >> 15
+    value = (value * 0x2C1B3C6D) & 0xFFFFFFFF
+    return value ^ (value >> 12)
+
+
+def _permute(index, seed, size):
+    """Position of `index` in the permutation of range(size) keyed by `seed`."""
+    half = max(1, ((size - 1).bit_length() + 1) // 2)
+    mask = (1 << half) - 1
+    # The network permutes range(4 ** half), at most four times `size`; walk until the result is in range
+    while True:
+        left, right = index >> half, index & mask
+        for round_number in range(FEISTEL_ROUNDS):
+            left, right = right, left ^ (_mix(right, seed, round_number) & mask)
+        index = (left << half) | right
+        if index < size:
+            return index
+
+
+def _next_seed(previous, size):
+    """Seed for the next cycle whose first picks aren't among the previous cycle's last few."""
+    seed = random.getrandbits(32)
+    recent = min(RECENT_PICKS, size // 4) or (1 if size > 1 else 0)
+    if not recent:
+        return seed
+    last = {_permute(position, previous, size) for position in range(size - recent, size)}
+    for _ in range(MAX_RESEEDS):
+        if not any(_permute(position, seed, size) in last for position in range(recent)):
+            break
+        seed = random.getrandbits(32)
+    return seed
@@ -0,0 +1,93 @@
+# deadline.py
+
+import asyncio
+import contextvars
+import os
+import time
+
+# Total latency budget for a command, in seconds, unless overridden below
+DEFAULT_COMMAND_BUDGET = float(os.getenv("COMMAND_BUDGET", "8"))
+
+# Commands whose upstreams are known to need more (or less) time
+COMMAND_BUDGETS = {
+    "translate": 12,
+    "unshorten": 12
+}
+
+# Timeout for outbound calls made outside any command (background refreshes, pool refills)
+DEFAULT_REQUEST_TIMEOUT = 10
+
+# Time source for every deadline; tests replace it with a fake clock
+clock = time.monotonic
+
+_deadline = contextvars.ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the current command has used up its latency budget."""
+
+
+def start(budget):
+    """Give the current context a deadline `budget` seconds from now."""
+    _deadline.set(clock() + budget)
+
+
+def budget_for(command_name):
+    return COMMAND_BUDGETS.get(command_name, DEFAULT_COMMAND_BUDGET)
+
+
+def remaining():
+    """Seconds left before the current deadline, or None when there is no deadline."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - clock()
+
+
+def timeout_for(requested=None):
+    """Return (timeout, limited_by_deadline) for an outbound call.
+
+    The timeout is the smaller of the caller's own timeout and the time left in
+    the current deadline. Raises `DeadlineExceeded` when no time is left.
+    """
+    left = remaining()
+    if left is None:
+        return (requested or DEFAULT_REQUEST_TIMEOUT), False
+    if left <= 0:
+        raise DeadlineExceeded()
+    if requested is not None and requested <= left:
+        return requested, False
+    return left, True
+
+
+def clear():
+    """Remove the current context's deadline, e.g. before starting long-lived background work."""
+    _deadline.set(None)
+
+
+def spawn(coro):
+    """Start a background task that is not bound by the caller's deadline.
+
+    The task runs `coro` itself in a copy of the caller's context with the
+    deadline removed, so cancelling it before it starts still closes `coro`.
+    """
+    context = contextvars.copy_context()
+    context.run(_deadline.set, None)
+    return context.run(asyncio.get_running_loop().create_task, coro)
+
+
+async def wait(future):
+    """Await a shared task or future without exceeding the current deadline.
+
+    The shared work is shielded so one caller running out of time never
+    cancels it for the others.
+    """
+    left = remaining()
+    if left is None:
+        return await asyncio.shield(future)
+    if left <= 0:
+        raise DeadlineExceeded()
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded() from None
@@ -0,0 +1,140 @@
+# figlet.py
+
+# Five-row glyph bitmaps: '#' is ink, '.' is blank. Rows of a glyph are separated by '/'.
+GLYPH_DATA = {
+    "A": ".###./#...#/#####/#...#/#...#",
+    "B": "####./#...#/####./#...#/####.",
+    "C": ".####/#..../#..../#..../.####",
+    "D": "####./#...#/#...#/#...#/####.",
+    "E": "#####/#..../####./#..../#####",
+    "F": "#####/#..../####./#..../#....",
+    "G": ".####/#..../#..##/#...#/.###.",
+    "H": "#...#/#...#/#####/#...#/#...#",
+    "I": "###/.#./.#./.#./###",
+    "J": "..###/...#./...#./#..#./.##..",
+    "K": "#...#/#..#./###../#..#./#...#",
+    "L": "#..../#..../#..../#..../#####",
+    "M": "#...#/##.##/#.#.#/#...#/#...#",
+    "N": "#...#/##..#/#.#.#/#..##/#...#",
+    "O": ".###./#...#/#...#/#...#/.###.",
+    "P": "####./#...#/####./#..../#....",
+    "Q": ".###./#...#/#.#.#/#..#./.##.#",
+    "R": "####./#...#/####./#..#./#...#",
+    "S": ".####/#..../.###./....#/####.",
+    "T": "#####/..#../..#../..#../..#..",
+    "U": "#...#/#...#/#...#/#...#/.###.",
+    "V": "#...#/#...#/#...#/.#.#./..#..",
+    "W": "#...#/#...#/#.#.#/##.##/#...#",
+    "X": "#...#/.#.#./..#../.#.#./#...#",
+    "Y": "#...#/.#.#./..#../..#../..#..",
+    "Z": "#####/...#./..#../.#.../#####",
+    "0": ".###./#..##/#.#.#/##..#/.###.",
+    "1": ".#./##./.#./.#./###",
+    "2": ".###./#...#/..##./.#.../#####",
+    "3": "####./....#/.###./....#/####.",
+    "4": "#..#./#..#./#####/...#./...#.",
+    "5": "#####/#..../####./....#/####.",
+    "6": ".###./#..../####./#...#/.###.",
+    "7": "#####/....#/...#./..#../..#..",
+    "8": ".###./#...#/.###./#...#/.###.",
+    "9": ".###./#...#/.####/....#/.###.",
+    " ": ".../.../.../.../...",
+    "!": "#/#/#/./#",
+    "?": ".###./#...#/..##./...../..#..",
+    ".": "././././#",
+    ",": "../../../.#/#.",
+    "-": "..../..../####/..../....",
+    "'": "#/#/./././.",
+    ":": "./#/./#/.",
+}
+
+# Font name -> (ink character, horizontal scale)
+FONT_STYLES = {
+    "block": ("█", 1),
+    "hash": ("#", 1),
+    "banner": ("#", 2),
+}
+
+DEFAULT_FONT = "block"
+GLYPH_HEIGHT = 5
+
+# Widest rendered line, in characters, before input text wraps onto a new row
+MAX_LINE_WIDTH = 60
+
+
+def _build_fonts():
+    fonts = {}
+    for name, (ink, scale) in FONT_STYLES.items():
+        glyphs = {}
+        for char, data in GLYPH_DATA.items():
+            glyphs[char] = tuple(
+                "".join((ink if pixel == "#" else " ") * scale for pixel in row)
+                for row in data.split("/")
+            )
+        fonts[name] = glyphs
+    return fonts
+
+
+# Rendered glyph rows for every font, built once at import
+FONTS = _build_fonts()
+
+
+def _glyph(font, char):
+    glyphs = FONTS[font]
+    return glyphs.get(char.upper()) or glyphs["?"]
+
+
+def _width(font, text):
+    return sum(len(_glyph(font, char)[0]) + 1 for char in text)
+
+
+def _wrap(text, font):
+    """Split text into lines whose rendered width fits MAX_LINE_WIDTH."""
+    words = []
+    for word in text.split():
+        # Break words that are too wide to ever fit on one line
+        while _width(font, word) > MAX_LINE_WIDTH and len(word) > 1:
+            cut = len(word) - 1
+            while cut > 1 and _width(font, word[:cut]) > MAX_LINE_WIDTH:
+                cut -= 1
+            words.append(word[:cut])
+            word = word[cut:]
+        words.append(word)
+    lines, current, width = [], [], 0
+    space_width = _width(font, " ")
+    for word in words:
+        word_width = _width(font, word)
+        if current and width + space_width + word_width > MAX_LINE_WIDTH:
+            lines.append(" ".join(current))
+            current, width = [], 0
+        width += (space_width if current else 0) + word_width
+        current.append(word)
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
+def render_line(line, font=DEFAULT_FONT):
+    glyphs = [_glyph(font, char) for char in line]
+    return "\n".join(
+        " ".join(glyph[row] for glyph in glyphs).rstrip() for row in range(GLYPH_HEIGHT)
+    )
+
+
+def render(text, font=DEFAULT_FONT):
+    """Render text as a list of ASCII-art blocks, one per wrapped line."""
+    return [render_line(line, font) for line in _wrap(text, font)]
+
+
+def paginate(blocks, limit):
+    """Group rendered blocks into pages of at most `limit` characters without splitting a block."""
+    page = ""
+    for block in blocks:
+        candidate = f"{page}\n\n{block}" if page else block
+        if len(candidate) > limit and page:
+            yield page
+            page = block
+        else:
+            page = candidate
+    if page:
+        yield page
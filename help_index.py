@@ -0,0 +1,91 @@
+# help_index.py
+
+from bisect import bisect_left
+from collections import OrderedDict
+
+COMMANDS_PER_PAGE = 10
+
+# Most filtered page sets kept before the least recently used is dropped
+MAX_CACHED_FILTERS = 64
+
+
+class HelpIndex:
+    """Help pages built once per command set and shared by every help view.
+
+    `source()` returns (name, help, category) triples and `render(heading,
+    number, total, lines)` turns one page of formatted lines into a page
+    object. Lines, the category index and the sorted name index are built on
+    first use after `invalidate()`; the pages for each filter are rendered
+    once and handed out as the same immutable tuple until the next rebuild.
+    """
+
+    def __init__(self, source, render, per_page=COMMANDS_PER_PAGE, max_filters=MAX_CACHED_FILTERS):
+        self.source = source
+        self.render = render
+        self.per_page = per_page
+        self.max_filters = max_filters
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop every built page; the next lookup rebuilds from `source()`."""
+        self._names = None
+        self._lines = None
+        self._categories = None
+        self._pages = OrderedDict()
+
+    @property
+    def categories(self):
+        self._build()
+        return tuple(self._categories)
+
+    def _build(self):
+        if self._names is not None:
+            return
+        entries = sorted(self.source())
+        self._names = tuple(name for name, _, _ in entries)
+        self._lines = tuple(f"!{name} - {help_desc or 'No description.'}" for name, help_desc, _ in entries)
+        categories = {}
+        for position, (_, _, category) in enumerate(entries):
+            categories.setdefault(category, []).append(position)
+        self._categories = {category: tuple(positions) for category, positions in sorted(categories.items())}
+
+    def _select(self, query):
+        """Return (heading, line positions) for a category name, a name prefix, or everything."""
+        if not query:
+            return "Available Commands", range(len(self._lines))
+        if query in self._categories:
+            return f"{query.title()} Commands", self._categories[query]
+        start = bisect_left(self._names, query)
+        end = start
+        while end < len(self._names) and self._names[end].startswith(query):
+            end += 1
+        return f"Commands starting with '{query}'", range(start, end)
+
+    def complete(self, prefix, limit=25):
+        """Return up to `limit` categories and command names starting with `prefix`, for autocomplete."""
+        self._build()
+        prefix = prefix.strip().lower().lstrip("!")
+        matches = [category for category in self._categories if category.startswith(prefix)]
+        position = bisect_left(self._names, prefix)
+        while len(matches) < limit and position < len(self._names) and self._names[position].startswith(prefix):
+            matches.append(self._names[position])
+            position += 1
+        return matches[:limit]
+
+    def pages(self, query=None):
+        """Return the shared tuple of pages for `query`; empty when nothing matches."""
+        self._build()
+        query = (query or "").strip().lower().lstrip("!")
+        pages = self._pages.get(query)
+        if pages is None:
+            heading, positions = self._select(query)
+            lines = [self._lines[position] for position in positions]
+            chunks = [lines[i:i + self.per_page] for i in range(0, len(lines), self.per_page)]
+            pages = tuple(
+                self.render(heading, number, len(chunks), chunk) for number, chunk in enumerate(chunks, 1)
+            )
+            self._pages[query] = pages
+            if len(self._pages) > self.max_filters:
+                self._pages.popitem(last=False)
+        self._pages.move_to_end(query)
+        return pages
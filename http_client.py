@@ -0,0 +1,186 @@
+# http_client.py
+
+import asyncio
+import functools
+import json
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+
+import deadline
+import metrics
+from circuit_breaker import breaker_for
+from throttle import MAX_WAIT, host_limiter
+
+# Pause applied to a host that answers 429 without a usable Retry-After header
+DEFAULT_RETRY_AFTER = 60
+
+# Connection pool sizing for the shared session
+MAX_CONNECTIONS = 200
+MAX_CONNECTIONS_PER_HOST = 20
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+
+
+class NotSent(aiohttp.ClientError):
+    """Raised for a request that never reached its host; it says nothing about the host's health."""
+
+
+class Response:
+    """A fully-read HTTP response exposing the parts of `requests.Response` the bot uses."""
+
+    __slots__ = ("status_code", "url", "headers", "content")
+
+    def __init__(self, status_code, url, headers, content):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HTTPClient:
+    """A single long-lived, pooled aiohttp session shared by every outbound call."""
+
+    def __init__(self):
+        self._session = None
+        # When set, every request goes to `<upstream_override>/<host><path>` instead (benchmarks, offline runs)
+        self.upstream_override = None
+        # When set, requests are recorded to or replayed from this `cassette.Cassette`
+        self.cassette = None
+
+    async def start(self):
+        """Open the shared session if it isn't already open."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        """Close the shared session, release pooled connections and flush any cassette being recorded."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self.cassette is not None:
+            self.cassette.close()
+
+    async def request(self, method, url, *, params=None, headers=None, data=None,
+                      allow_redirects=True, timeout=None):
+        """Perform a request and return a fully-read `Response`.
+
+        The request's timeout is capped by the current command's deadline.
+        Raises `circuit_breaker.CircuitOpen` if the host's circuit is open,
+        `throttle.RateLimited` if its request budget is exhausted and
+        `deadline.DeadlineExceeded` if the command runs out of time.
+        """
+        await self.start()
+        left = deadline.remaining()
+        if left is not None and left <= 0:
+            # Out of time already; without this the limiter would report a zero-second rate limit
+            raise deadline.DeadlineExceeded()
+        host = urlsplit(url).hostname
+        breaker = breaker_for(host)
+        breaker.before_request()
+        started = time.monotonic()
+        limited_by_deadline = False
+        try:
+            left = deadline.remaining()
+            await host_limiter.acquire(host, max_wait=None if left is None else min(left, MAX_WAIT))
+            request_timeout, limited_by_deadline = deadline.timeout_for(timeout)
+            started = time.monotonic()
+            send = self._send if self.cassette is None else functools.partial(self.cassette.request, self._send)
+            response = await send(
+                method, url, params=params, headers=headers, data=data,
+                allow_redirects=allow_redirects, timeout=request_timeout
+            )
+        except asyncio.TimeoutError:
+            elapsed = time.monotonic() - started
+            metrics.observe_upstream(host, "timeout", elapsed)
+            if limited_by_deadline:
+                # The command ran out of time; that says nothing about the host
+                breaker.release()
+                raise deadline.DeadlineExceeded() from None
+            breaker.record(False, elapsed)
+            raise
+        except NotSent:
+            breaker.release()
+            raise
+        except aiohttp.ClientError:
+            elapsed = time.monotonic() - started
+            metrics.observe_upstream(host, "error", elapsed)
+            breaker.record(False, elapsed)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        elapsed = time.monotonic() - started
+        metrics.observe_upstream(host, response.status_code, elapsed)
+        breaker.record(response.status_code < 500, elapsed)
+        if response.status_code == 429:
+            host_limiter.penalize(host, _retry_after(response.headers))
+        return response
+
+    async def _send(self, method, url, *, params, headers, data, allow_redirects, timeout):
+        if self.upstream_override:
+            url = _override_url(self.upstream_override, url)
+        async with self._session.request(
+            method, url, params=params, headers=headers, data=data,
+            allow_redirects=allow_redirects, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            content = await response.read()
+        return Response(response.status, str(response.url), response.headers, content)
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def head(self, url, **kwargs):
+        return await self.request("HEAD", url, **kwargs)
+
+
+def _override_url(base, url):
+    """Rewrite `scheme://host/path?query` as `base/host/path?query`, keeping the real host in the path."""
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{base.rstrip('/')}/{parts.netloc}{parts.path or '/'}{query}"
+
+
+def _retry_after(headers):
+    try:
+        return float(headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+    except ValueError:
+        return DEFAULT_RETRY_AFTER
+
+
+# Shared client used by every fetch helper
+_client = HTTPClient()
+
+start = _client.start
+close = _client.close
+request = _client.request
+get = _client.get
+post = _client.post
+head = _client.head
+
+
+def set_cassette(cassette):
+    """Record or replay every outbound request through `cassette`; None sends requests normally."""
+    _client.cassette = cassette
+
+
+def set_upstream_override(base_url):
+    """Send every outbound request to `base_url` instead of its real host; None restores normal routing."""
+    _client.upstream_override = base_url
@@ -0,0 +1,173 @@
+# launcher.py
+"""Run the bot as a cluster of worker processes, each owning a range of shards.
+
+Usage: python launcher.py
+
+Settings (environment or .env):
+    SHARD_COUNT       Total shards across every host (default: Discord's recommendation)
+    SHARD_IDS         Shards this host runs, e.g. `0-7` (default: all of them)
+    WORKERS           Worker processes to spread them over (default: one per CPU)
+    METRICS_PORT      First worker's metrics port; worker N listens on METRICS_PORT + N
+
+A supervisor restarts any worker that exits, backing off while it keeps crashing.
+Sending the launcher SIGHUP makes every worker reload its command cogs in place.
+"""
+
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+from dotenv import load_dotenv
+
+import sharding
+
+logger = logging.getLogger('launcher')
+
+BOT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bot.py")
+GATEWAY_URL = "https://discord.com/api/v10/gateway/bot"
+
+# Restart back-off for a crashing worker, in seconds
+RESTART_DELAY = 5
+MAX_RESTART_DELAY = 300
+# A worker that stayed up this long has its back-off reset
+STABLE_AFTER = 60
+
+POLL_INTERVAL = 1
+
+
+def _ignore_reload_signal():
+    # Runs in the worker before exec. An ignored signal stays ignored across exec, so a reload forwarded
+    # before the bot installs its SIGHUP handler in setup_hook is dropped instead of killing the worker
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+
+def recommended_shard_count(token):
+    request = urllib.request.Request(GATEWAY_URL, headers={"Authorization": f"Bot {token}"})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)["shards"]
+
+
+class Worker:
+    """One bot process and its restart bookkeeping."""
+
+    def __init__(self, index, shard_ids, shard_count, worker_count):
+        self.index = index
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.worker_count = worker_count
+        self.process = None
+        self.started_at = 0.0
+        self.restart_at = 0.0
+        self.delay = RESTART_DELAY
+
+    def environment(self):
+        env = dict(os.environ)
+        env["SHARD_COUNT"] = str(self.shard_count)
+        env["SHARD_IDS"] = sharding.format_shard_ids(self.shard_ids)
+        # Every worker calls the same upstream APIs, so each gets an equal slice of their budgets
+        env["RATE_LIMIT_SHARE"] = str(float(os.getenv("RATE_LIMIT_SHARE", "1")) / self.worker_count)
+        base_port = int(os.getenv("METRICS_PORT", "9108"))
+        env["METRICS_PORT"] = str(base_port + self.index if base_port else 0)
+        return env
+
+    def start(self):
+        logger.info(f"Starting worker {self.index} for shards {sharding.format_shard_ids(self.shard_ids)}")
+        self.process = subprocess.Popen(
+            [sys.executable, BOT_SCRIPT], env=self.environment(),
+            preexec_fn=_ignore_reload_signal if hasattr(signal, "SIGHUP") else None
+        )
+        self.started_at = time.monotonic()
+
+    def reload(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.send_signal(signal.SIGHUP)
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+
+    def wait(self, timeout):
+        if self.process is None:
+            return
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class Supervisor:
+    """Keep every worker running, restarting crashed ones with exponential back-off."""
+
+    def __init__(self, workers):
+        self.workers = workers
+        self._stopping = False
+
+    def run(self):
+        signal.signal(signal.SIGINT, self._request_stop)
+        signal.signal(signal.SIGTERM, self._request_stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._forward_reload)
+        for worker in self.workers:
+            worker.start()
+        while not self._stopping:
+            self._check()
+            time.sleep(POLL_INTERVAL)
+        self.shutdown()
+
+    def _request_stop(self, signum, frame):
+        self._stopping = True
+
+    def _forward_reload(self, signum, frame):
+        logger.info("Reloading command cogs in every worker")
+        for worker in self.workers:
+            worker.reload()
+
+    def _check(self):
+        now = time.monotonic()
+        for worker in self.workers:
+            if worker.process is None:
+                if now >= worker.restart_at:
+                    worker.start()
+                continue
+            code = worker.process.poll()
+            if code is None:
+                continue
+            if now - worker.started_at >= STABLE_AFTER:
+                worker.delay = RESTART_DELAY
+            logger.warning(f"Worker {worker.index} exited with code {code}; restarting in {worker.delay}s")
+            worker.process = None
+            worker.restart_at = now + worker.delay
+            worker.delay = min(worker.delay * 2, MAX_RESTART_DELAY)
+
+    def shutdown(self):
+        logger.info("Stopping workers")
+        for worker in self.workers:
+            worker.stop()
+        for worker in self.workers:
+            worker.wait(timeout=30)
+
+
+def main():
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    if os.getenv("USER_STORE", "sqlite").lower() == "json":
+        raise SystemExit("The JSON user store can't be shared between workers; use USER_STORE=sqlite")
+    if os.getenv("HTTP_CASSETTE") and os.getenv("HTTP_CASSETTE_MODE", "replay") == "record":
+        raise SystemExit("Workers can't record to one cassette; record with a single bot.py process")
+
+    shard_count = int(os.getenv("SHARD_COUNT") or recommended_shard_count(os.environ["BOT_TOKEN"]))
+    shard_ids = sharding.parse_shard_ids(os.getenv("SHARD_IDS")) or list(range(shard_count))
+    worker_count = int(os.getenv("WORKERS", str(os.cpu_count() or 1)))
+    groups = sharding.split_shards(shard_ids, worker_count)
+    workers = [Worker(index, group, shard_count, len(groups)) for index, group in enumerate(groups)]
+    logger.info(f"Running shards {sharding.format_shard_ids(shard_ids)} of {shard_count} in {len(workers)} workers")
+    Supervisor(workers).run()
+
+
+if __name__ == "__main__":
+    main()
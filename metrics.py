@@ -0,0 +1,267 @@
+# metrics.py
+
+import asyncio
+import logging
+import os
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from aiohttp import web
+
+from cache import cache_stats, coalesced_calls
+from command_limits import command_limiter
+from pools import pool_stats
+from upstreams import UPSTREAM_HOSTS
+
+logger = logging.getLogger('discord')
+
+# The endpoint only listens on loopback; set METRICS_PORT=0 to disable it
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+# How often the event loop's scheduling lag is sampled, in seconds
+LOOP_LAG_INTERVAL = 1.0
+
+# Upstream metrics are labelled only with hosts from upstreams.UPSTREAM_HOSTS; any other host
+# (e.g. a URL given to !unshorten) is recorded as "other" so users can't create unbounded label sets
+OTHER_HOST = "other"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Every metric in exposition order
+registry = []
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = defaultdict(int)
+        registry.append(self)
+
+    def inc(self, *labels, amount=1):
+        self._values[labels] += amount
+
+    def samples(self):
+        for labels, value in sorted(self._values.items()):
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Gauge(Counter):
+    """A value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value, *labels):
+        self._values[labels] = value
+
+
+class Histogram:
+    """Observations counted into fixed buckets per label set, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last slot is +Inf), sum]
+        self._series = {}
+        registry.append(self)
+
+    def observe(self, value, *labels):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self):
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    _format_labels(self.labelnames, labels, [("le", _format_value(bound))]),
+                    cumulative
+                )
+            yield f"{self.name}_sum", _format_labels(self.labelnames, labels), total
+            yield f"{self.name}_count", _format_labels(self.labelnames, labels), cumulative
+
+
+class Collected:
+    """A metric whose values are read from elsewhere at scrape time.
+
+    `collect()` returns {label values tuple: value}.
+    """
+
+    def __init__(self, name, kind, help, labelnames, collect):
+        self.name = name
+        self.kind = kind
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+        registry.append(self)
+
+    def samples(self):
+        for labels, value in sorted(self.collect().items()):
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+def render():
+    """Return every registered metric in the Prometheus text exposition format."""
+    lines = []
+    for metric in registry:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{labels} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# Commands
+command_calls = Counter(
+    "infonexus_command_calls_total", "Commands invoked, by outcome.", ("command", "outcome")
+)
+command_errors = Counter(
+    "infonexus_command_errors_total", "Commands that failed, by error type.", ("command", "error")
+)
+command_latency = Histogram(
+    "infonexus_command_duration_seconds", "Time from invocation to completion or failure.", ("command",)
+)
+
+# Upstream HTTP calls
+upstream_requests = Counter(
+    "infonexus_upstream_requests_total",
+    "Outbound HTTP requests by host and status code (or timeout/error).",
+    ("host", "status")
+)
+upstream_latency = Histogram(
+    "infonexus_upstream_request_duration_seconds", "Outbound HTTP request latency.", ("host",)
+)
+
+# Event loop
+loop_lag = Histogram(
+    "infonexus_event_loop_lag_seconds", "How late the event loop ran a scheduled wakeup.", buckets=LOOP_LAG_BUCKETS
+)
+loop_lag_last = Gauge("infonexus_event_loop_lag_last_seconds", "Most recent event loop lag sample.")
+
+
+def _stat_collector(stats, field):
+    return lambda: {(name, ): values[field] for name, values in stats().items()}
+
+
+Collected("infonexus_cache_hits_total", "counter", "Cache hits.", ("cache",), _stat_collector(cache_stats, "hits"))
+Collected("infonexus_cache_misses_total", "counter", "Cache misses.", ("cache",), _stat_collector(cache_stats, "misses"))
+Collected("infonexus_cache_hit_ratio", "gauge", "Cache hit ratio since start.", ("cache",), _stat_collector(cache_stats, "hit_ratio"))
+Collected("infonexus_cache_entries", "gauge", "Entries held per cache.", ("cache",), _stat_collector(cache_stats, "size"))
+Collected(
+    "infonexus_singleflight_coalesced_total", "counter", "Calls that joined an in-flight request.",
+    ("endpoint",), lambda: {(name, ): count for name, count in coalesced_calls.items()}
+)
+Collected("infonexus_pool_hits_total", "counter", "Pool gets served from the buffer.", ("pool",), _stat_collector(pool_stats, "hits"))
+Collected("infonexus_pool_misses_total", "counter", "Pool gets that fell back to a live fetch.", ("pool",), _stat_collector(pool_stats, "misses"))
+Collected("infonexus_pool_hit_ratio", "gauge", "Pool hit ratio since start.", ("pool",), _stat_collector(pool_stats, "hit_ratio"))
+Collected("infonexus_pool_buffered", "gauge", "Items currently buffered per pool.", ("pool",), _stat_collector(pool_stats, "size"))
+Collected(
+    "infonexus_command_rate_limit_keys", "gauge", "Users and guilds tracked by the command rate limiter.",
+    ("class", "scope"),
+    lambda: {(name, scope): count for name, counts in command_limiter.stats().items() for scope, count in counts.items()}
+)
+
+
+def observe_command(command, elapsed, error=None):
+    """Record one finished command; `elapsed` is None when it never reached invocation."""
+    command_calls.inc(command, "success" if error is None else "error")
+    if error is not None:
+        command_errors.inc(command, type(error).__name__)
+    if elapsed is not None:
+        command_latency.observe(elapsed, command)
+
+
+def observe_upstream(host, status, elapsed):
+    host = host if host in UPSTREAM_HOSTS else OTHER_HOST
+    upstream_requests.inc(host, str(status))
+    upstream_latency.observe(elapsed, host)
+
+
+class MetricsServer:
+    """Serves `render()` at /metrics and samples event loop lag while running."""
+
+    def __init__(self, host=METRICS_HOST, port=METRICS_PORT):
+        self.host = host
+        self.port = port
+        self._runner = None
+        self._lag_task = None
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        if self._lag_task is None:
+            self._lag_task = loop.create_task(self._sample_loop_lag())
+        if not self.port or self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self.host, self.port).start()
+        except OSError as e:
+            logger.warning(f"Metrics endpoint disabled, couldn't listen on {self.host}:{self.port}: {e}")
+            await runner.cleanup()
+            return
+        self._runner = runner
+
+    async def stop(self):
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request):
+        return web.Response(body=render().encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+    async def _sample_loop_lag(self):
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            lag = max(0.0, time.monotonic() - started - LOOP_LAG_INTERVAL)
+            loop_lag.observe(lag)
+            loop_lag_last.set(lag)
+
+
+_server = MetricsServer()
+
+start = _server.start
+stop = _server.stop
@@ -0,0 +1,151 @@
+# pools.py
+
+import asyncio
+import functools
+import logging
+from collections import deque
+
+import deadline
+from cache import succeeded
+
+logger = logging.getLogger('discord')
+
+# Every pool created through `pooled`, keyed by name
+pools = {}
+
+
+class ContentPool:
+    """Bounded buffer of ready results that a background task keeps topped up.
+
+    `fetch_one()` returns a single result; the optional `fetch_batch(count)`
+    returns a list of up to `count` results from a bulk endpoint. Results
+    rejected by `validate` are never buffered.
+    """
+
+    def __init__(self, name, fetch_one, fetch_batch=None, size=10, low_water=3,
+                 concurrency=3, retry_delay=30, validate=succeeded):
+        self.name = name
+        self.fetch_one = fetch_one
+        self.fetch_batch = fetch_batch
+        self.size = size
+        self.low_water = low_water
+        self.concurrency = concurrency
+        self.retry_delay = retry_delay
+        self.validate = validate
+        self.hits = 0
+        self.misses = 0
+        self._buffer = deque(maxlen=size)
+        self._wanted = None
+        self._task = None
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def start(self):
+        """Start the background refill task inside the running loop, outside any command deadline."""
+        if self._task is None or self._task.done():
+            self._wanted = asyncio.Event()
+            self._wanted.set()
+            self._task = deadline.spawn(self._refill_loop())
+
+    async def stop(self):
+        """Cancel the refill task and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def get(self):
+        """Pop a ready result, falling back to a live fetch when the buffer is empty."""
+        if self._buffer:
+            item = self._buffer.popleft()
+            self.hits += 1
+            if len(self._buffer) <= self.low_water:
+                self._request_refill()
+            return item
+        self.misses += 1
+        self._request_refill()
+        return await self.fetch_one()
+
+    def _request_refill(self):
+        if self._wanted is not None:
+            self._wanted.set()
+
+    async def _refill_loop(self):
+        while True:
+            await self._wanted.wait()
+            try:
+                added = await self._fill()
+            except Exception as e:
+                logger.warning(f"Refilling the {self.name} pool failed: {e}")
+                added = 0
+            if len(self._buffer) >= self.size:
+                self._wanted.clear()
+            if not added:
+                # Upstream is failing or returning nothing useful; back off before retrying
+                await asyncio.sleep(self.retry_delay)
+
+    async def _fill(self):
+        missing = self.size - len(self._buffer)
+        if missing <= 0:
+            return 0
+        if self.fetch_batch is not None:
+            results = await self.fetch_batch(missing)
+        else:
+            results = await asyncio.gather(
+                *(self.fetch_one() for _ in range(min(missing, self.concurrency))),
+                return_exceptions=True
+            )
+        added = 0
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Fetching an item for the {self.name} pool failed: {result!r}")
+                continue
+            if not self.validate(result):
+                continue
+            if len(self._buffer) < self.size:
+                self._buffer.append(result)
+                added += 1
+        return added
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._buffer),
+            "capacity": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0
+        }
+
+
+def fields_present(*indexes):
+    """Validator for tuple results that are only usable with the fields at `indexes`, e.g. a meme's image URL."""
+    def validate(result):
+        return bool(result) and all(result[index] for index in indexes)
+
+    return validate
+
+
+def pooled(name, batch=None, **options):
+    """Serve an async fetch helper from a pre-fetched `ContentPool`.
+
+    The wrapped helper pops a buffered result; the original function is used
+    for refills and as the live fallback when the pool is empty.
+    """
+    def decorator(func):
+        pool = pools[name] = ContentPool(name, func, fetch_batch=batch, **options)
+
+        @functools.wraps(func)
+        async def wrapper():
+            return await pool.get()
+
+        wrapper.pool = pool
+        return wrapper
+
+    return decorator
+
+
+def pool_stats():
+    """Return buffer statistics for every registered pool."""
+    return {name: pool.stats() for name, pool in pools.items()}
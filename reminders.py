@@ -0,0 +1,133 @@
+# reminders.py
+
+import asyncio
+import heapq
+import logging
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+logger = logging.getLogger('discord')
+
+# Reminders due within this many seconds of each other are sent as one batch
+BATCH_WINDOW = 0.5
+
+# Field order matters: heap entries compare by due time, then by id
+Reminder = namedtuple("Reminder", "due id channel_id user_id message guild_id")
+
+
+class ReminderStore:
+    """Durable SQLite table of pending reminders."""
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS reminders ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, due REAL NOT NULL, "
+                "channel_id INTEGER NOT NULL, user_id INTEGER NOT NULL, message TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS reminders_due ON reminders (due)")
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(reminders)")}
+            if "guild_id" not in columns:
+                # Reminders stored before sharding have no guild and are treated as direct messages
+                self._conn.execute("ALTER TABLE reminders ADD COLUMN guild_id INTEGER")
+
+    def add(self, due, channel_id, user_id, message, guild_id=None):
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO reminders (due, channel_id, user_id, message, guild_id) VALUES (?, ?, ?, ?, ?)",
+                (due, channel_id, user_id, message, guild_id)
+            )
+        return Reminder(due, cursor.lastrowid, channel_id, user_id, message, guild_id)
+
+    def load_pending(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT due, id, channel_id, user_id, message, guild_id FROM reminders"
+            ).fetchall()
+        return [Reminder(*row) for row in rows]
+
+    def delete_many(self, reminder_ids):
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM reminders WHERE id = ?", [(rid,) for rid in reminder_ids])
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ReminderScheduler:
+    """Min-heap of pending reminders served by a single dispatcher task.
+
+    Reminders are written to `store` when scheduled and reloaded on startup.
+    The dispatcher sleeps until the earliest due time (or until an earlier
+    reminder is added), then passes every reminder due in that moment to
+    `dispatch` as one batch. When several processes share the store, each
+    only loads the reminders for which `owns(reminder)` is true.
+    """
+
+    def __init__(self, store, dispatch, owns=None):
+        self.store = store
+        self.dispatch = dispatch
+        self.owns = owns
+        self._heap = []
+        self._wakeup = None
+        self._task = None
+
+    def __len__(self):
+        return len(self._heap)
+
+    def start(self):
+        """Load pending reminders and start the dispatcher inside the running loop."""
+        self._heap = [reminder for reminder in self.store.load_pending() if self.owns is None or self.owns(reminder)]
+        heapq.heapify(self._heap)
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def schedule(self, delay, channel_id, user_id, message, guild_id=None):
+        """Persist a reminder due `delay` seconds from now and queue it."""
+        due = time.time() + max(0, delay)
+        loop = asyncio.get_running_loop()
+        reminder = await loop.run_in_executor(None, self.store.add, due, channel_id, user_id, message, guild_id)
+        heapq.heappush(self._heap, reminder)
+        if self._heap[0] is reminder:
+            self._wakeup.set()
+        return reminder
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            delay = self._heap[0].due - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            cutoff = time.time() + BATCH_WINDOW
+            batch = []
+            while self._heap and self._heap[0].due <= cutoff:
+                batch.append(heapq.heappop(self._heap))
+            try:
+                await self.dispatch(batch)
+            except Exception as e:
+                logger.error(f"Dispatching {len(batch)} reminders failed: {e}")
+            try:
+                await loop.run_in_executor(None, self.store.delete_many, [reminder.id for reminder in batch])
+            except Exception as e:
+                # Keep dispatching; the undeleted reminders are only sent again after a restart
+                logger.error(f"Deleting {len(batch)} sent reminders failed: {e}")
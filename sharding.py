@@ -0,0 +1,52 @@
+# sharding.py
+
+import os
+
+
+def parse_shard_ids(spec):
+    """Parse a shard list such as `0-3,8,10-11` into a sorted list of ids; None for an empty spec."""
+    if not spec or not spec.strip():
+        return None
+    ids = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        ids.update(range(int(start), int(end or start) + 1))
+    return sorted(ids)
+
+
+def format_shard_ids(ids):
+    return ",".join(str(shard_id) for shard_id in ids)
+
+
+def shard_for(guild_id, shard_count):
+    """Shard that receives a guild's events; direct messages (no guild) go to shard 0."""
+    if guild_id is None or not shard_count:
+        return 0
+    return (guild_id >> 22) % shard_count
+
+
+def split_shards(shard_ids, workers):
+    """Split shard ids into at most `workers` contiguous, nearly equal groups."""
+    workers = max(1, min(workers, len(shard_ids)))
+    size, extra = divmod(len(shard_ids), workers)
+    groups, start = [], 0
+    for index in range(workers):
+        end = start + size + (1 if index < extra else 0)
+        groups.append(shard_ids[start:end])
+        start = end
+    return groups
+
+
+# Set by launcher.py for each worker; unset means this process runs every shard
+SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+SHARD_IDS = parse_shard_ids(os.getenv("SHARD_IDS"))
+
+
+def owns_guild(guild_id):
+    """Whether this process runs the shard that handles `guild_id`."""
+    if SHARD_IDS is None:
+        return True
+    return shard_for(guild_id, SHARD_COUNT) in SHARD_IDS
@@ -0,0 +1,241 @@
+# tests/test_cache.py
+
+import asyncio
+
+import pytest
+
+import deadline
+from cache import (
+    TTLCache, cached, coalesced_calls, singleflight, stale_while_revalidate, stop_feeds, succeeded, warm_feeds
+)
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache("test", ttl=10, maxsize=4, clock=clock)
+    cache.set("key", "value")
+    clock.advance(9.9)
+    assert cache.get("key") == "value"
+    clock.advance(0.1)
+    assert cache.get("key", None) is None
+    assert len(cache) == 0
+
+
+def test_entries_without_ttl_never_expire(clock):
+    cache = TTLCache("test", ttl=None, maxsize=4, clock=clock)
+    cache.set("key", "value")
+    clock.advance(10 ** 9)
+    assert cache.get("key") == "value"
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache("test", ttl=10, maxsize=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b", None) is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_stats_count_hits_and_misses(clock):
+    cache = TTLCache("test", ttl=10, maxsize=2, clock=clock)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b", None)
+    assert cache.stats() == {"size": 1, "maxsize": 2, "hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+@pytest.mark.parametrize("result, expected", [
+    ("text", True), ("", False), (None, False), ([], False), ((None, None), False), ((None, 1), True)
+])
+def test_succeeded(result, expected):
+    assert succeeded(result) is expected
+
+
+def test_cached_skips_failed_results_and_uses_key():
+    calls = []
+    results = [None, "first", "second"]
+
+    @cached("test_cached_endpoint", ttl=60, key=lambda symbol: symbol.upper())
+    async def fetch(symbol):
+        calls.append(symbol)
+        return results[len(calls) - 1]
+
+    async def check():
+        assert await fetch("abc") is None
+        assert await fetch("abc") == "first"
+        assert await fetch("ABC") == "first"
+
+    asyncio.run(check())
+    assert calls == ["abc", "abc"]
+
+
+class Upstream:
+    """Async fetch helper whose answers are released one at a time by the test."""
+
+    def __init__(self):
+        self.calls = 0
+        self.results = asyncio.Queue()
+
+    async def __call__(self):
+        self.calls += 1
+        result = await self.results.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def make_feed(name, clock, upstream, fresh_for=60):
+    feed = stale_while_revalidate(name, fresh_for=fresh_for)(upstream)
+    feed.cache.clock = clock
+    return feed
+
+
+def test_swr_serves_stale_value_while_one_refresh_runs(clock):
+    upstream = Upstream()
+    feed = make_feed("test_swr_stale", clock, upstream)
+
+    async def check():
+        upstream.results.put_nowait("v1")
+        assert await feed() == "v1"
+        clock.advance(30)
+        assert await feed() == "v1"
+        assert upstream.calls == 1
+        clock.advance(31)
+        assert await feed() == "v1"
+        assert await feed() == "v1"
+        await asyncio.sleep(0)
+        assert upstream.calls == 2
+        upstream.results.put_nowait("v2")
+        await feed.refresh()
+        assert await feed() == "v2"
+        assert feed.cache.stale_hits == 2
+
+    asyncio.run(check())
+
+
+def test_swr_keeps_last_good_value_when_refresh_fails(clock):
+    upstream = Upstream()
+    feed = make_feed("test_swr_failure", clock, upstream)
+
+    async def check():
+        upstream.results.put_nowait("v1")
+        await feed()
+        clock.advance(61)
+        upstream.results.put_nowait(RuntimeError("upstream down"))
+        assert await feed.refresh() == "v1"
+        upstream.results.put_nowait("")
+        assert await feed.refresh() == "v1"
+        assert await feed() == "v1"
+
+    asyncio.run(check())
+
+
+def test_swr_first_failure_reaches_the_caller(clock):
+    upstream = Upstream()
+    feed = make_feed("test_swr_cold_failure", clock, upstream)
+
+    async def check():
+        upstream.results.put_nowait(RuntimeError("upstream down"))
+        with pytest.raises(RuntimeError):
+            await feed()
+
+    asyncio.run(check())
+
+
+def test_swr_refreshes_can_be_cancelled(clock):
+    upstream = Upstream()
+    feed = make_feed("test_swr_cancel", clock, upstream)
+
+    async def check():
+        task = feed.refresh()
+        await asyncio.sleep(0)
+        assert upstream.calls == 1
+        await feed.cache.cancel_refreshes()
+        assert task.cancelled()
+        assert not feed.cache._refreshing
+        # A refresh cancelled before it ever ran must not block later refreshes either
+        task = feed.refresh()
+        await feed.cache.cancel_refreshes()
+        assert task.cancelled()
+        assert not feed.cache._refreshing
+        assert upstream.calls == 1
+        upstream.results.put_nowait("v1")
+        assert await feed() == "v1"
+
+    asyncio.run(check())
+
+
+def test_feeds_are_warmed_and_stopped_together(clock):
+    upstreams = [Upstream(), Upstream()]
+    feeds = [make_feed(f"test_swr_warm_{n}", clock, upstream) for n, upstream in enumerate(upstreams)]
+
+    async def check():
+        warm_feeds(*feeds)
+        await asyncio.sleep(0)
+        assert [upstream.calls for upstream in upstreams] == [1, 1]
+        await stop_feeds(*feeds)
+        assert not any(feed.cache._refreshing for feed in feeds)
+
+    asyncio.run(check())
+
+
+def test_singleflight_shares_one_call_per_normalized_key():
+    upstream = Upstream()
+
+    @singleflight("test_singleflight", key=lambda symbol: symbol.upper())
+    async def fetch(symbol):
+        return await upstream()
+
+    async def check():
+        calls = [asyncio.create_task(fetch(symbol)) for symbol in ("abc", "ABC", "xyz")]
+        await asyncio.sleep(0)
+        upstream.results.put_nowait("first")
+        upstream.results.put_nowait("second")
+        assert sorted(await asyncio.gather(*calls)) == ["first", "first", "second"]
+        upstream.results.put_nowait("third")
+        assert await fetch("abc") == "third"
+
+    asyncio.run(check())
+    assert upstream.calls == 3
+    assert coalesced_calls["test_singleflight"] == 1
+
+
+def test_singleflight_caller_deadline_does_not_cancel_shared_call():
+    upstream = Upstream()
+
+    @singleflight("test_singleflight_deadline")
+    async def fetch():
+        return await upstream()
+
+    async def impatient():
+        deadline.start(0.01)
+        return await fetch()
+
+    async def check():
+        with pytest.raises(deadline.DeadlineExceeded):
+            await asyncio.create_task(impatient())
+        patient = asyncio.create_task(fetch())
+        await asyncio.sleep(0)
+        upstream.results.put_nowait("value")
+        assert await patient == "value"
+
+    asyncio.run(check())
+    assert upstream.calls == 1
+
+
+def test_singleflight_failure_reaches_every_waiter():
+    upstream = Upstream()
+
+    @singleflight("test_singleflight_failure")
+    async def fetch():
+        return await upstream()
+
+    async def check():
+        calls = [asyncio.create_task(fetch()) for _ in range(2)]
+        await asyncio.sleep(0)
+        upstream.results.put_nowait(RuntimeError("upstream down"))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    asyncio.run(check())
@@ -0,0 +1,106 @@
+# tests/test_cassette.py
+
+import asyncio
+import gzip
+import json
+import logging
+
+import pytest
+
+from cassette import REPLAY, REPLAY_FAST, RECORD, Cassette, CassetteMiss, request_key
+from http_client import Response
+
+
+class FakeUpstream:
+    """Stands in for `HTTPClient._send`, numbering its responses."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, method, url, *, params=None, data=None, timeout=None, **kwargs):
+        self.calls += 1
+        return Response(200, url, {"Content-Type": "application/json", "Set-Cookie": "session=1"},
+                        json.dumps({"call": self.calls}).encode())
+
+
+def record(path, requests):
+    upstream = FakeUpstream()
+    cassette = Cassette(path, RECORD)
+
+    async def run():
+        for url, params in requests:
+            await cassette.request(upstream, "GET", url, params=params)
+
+    asyncio.run(run())
+    cassette.close()
+    return cassette
+
+
+def replay(cassette, url, params=None, timeout=None):
+    return asyncio.run(cassette.request(None, "GET", url, params=params, timeout=timeout))
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "upstream.jsonl.gz")
+
+
+def test_request_key_normalizes_query_and_redacts_credentials():
+    key = request_key("get", "https://api.example.com/v1?b=2&apikey=secret", {"a": "1"})
+    assert key == request_key("GET", "https://api.example.com/v1", {"a": 1, "b": 2, "apikey": "other"})
+    assert "secret" not in key and "apikey=REDACTED" in key
+    assert request_key("POST", "https://api.example.com/v1", data={"q": "hi"}) != \
+        request_key("POST", "https://api.example.com/v1", data={"q": "bye"})
+
+
+def test_replay_serves_recorded_responses_in_order_and_wraps(path):
+    record(path, [("https://api.example.com/v1", {"key": "secret"})] * 2)
+    with gzip.open(path, "rt") as f:
+        archive = f.read()
+    assert "secret" not in archive and "session=1" not in archive
+    cassette = Cassette(path, REPLAY_FAST)
+    calls = [replay(cassette, "https://api.example.com/v1", {"key": "another"}).json()["call"] for _ in range(3)]
+    assert calls == [1, 2, 1]
+    assert cassette.stats()["replayed"] == 3
+
+
+def test_unrecorded_request_misses(path):
+    record(path, [("https://api.example.com/v1", None)])
+    cassette = Cassette(path, REPLAY_FAST)
+    with pytest.raises(CassetteMiss):
+        replay(cassette, "https://api.example.com/v2")
+    assert cassette.misses == 1
+
+
+def test_recorded_latency_is_capped_by_timeout(path):
+    entry = {"key": request_key("GET", "https://api.example.com/slow"), "status": 200,
+             "final_url": "https://api.example.com/slow", "headers": [], "latency": 30, "text": "{}"}
+    with gzip.open(path, "wt") as f:
+        f.write(json.dumps(entry) + "\n")
+    with pytest.raises(asyncio.TimeoutError):
+        replay(Cassette(path, REPLAY), "https://api.example.com/slow", timeout=0.01)
+
+
+def test_appended_sessions_are_all_replayed(path):
+    record(path, [("https://api.example.com/v1", None)])
+    record(path, [("https://api.example.com/v2", None)])
+    cassette = Cassette(path, REPLAY_FAST)
+    assert replay(cassette, "https://api.example.com/v2").status_code == 200
+
+
+def test_truncated_archive_keeps_earlier_records(path, caplog):
+    record(path, [(f"https://api.example.com/item/{n}", None) for n in range(50)])
+    record(path, [("https://api.example.com/late", None)])
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:-10])
+    with caplog.at_level(logging.WARNING, logger="discord"):
+        cassette = Cassette(path, REPLAY_FAST)
+    assert "truncated" in caplog.text
+    assert replay(cassette, "https://api.example.com/item/0").json() == {"call": 1}
+
+
+def test_unknown_mode_is_rejected(path):
+    with pytest.raises(ValueError):
+        Cassette(path, "rewind")
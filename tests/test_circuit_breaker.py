@@ -0,0 +1,100 @@
+# tests/test_circuit_breaker.py
+
+import pytest
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen
+
+
+def make_breaker(clock):
+    return CircuitBreaker(
+        "api.example.com", window_seconds=60, min_calls=4, failure_rate=0.5,
+        slow_call_seconds=5, open_seconds=30, max_open_seconds=100, clock=clock
+    )
+
+
+def trip(breaker):
+    for _ in range(breaker.min_calls):
+        breaker.before_request()
+        breaker.record(False, 0.1)
+
+
+def test_stays_closed_below_min_calls(clock):
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+
+
+def test_opens_at_failure_rate(clock):
+    breaker = make_breaker(clock)
+    for success in (True, True, False):
+        breaker.record(success, 0.1)
+    assert breaker.state == CLOSED
+    breaker.record(True, 6)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpen) as excinfo:
+        breaker.before_request()
+    assert excinfo.value.retry_after == pytest.approx(30)
+
+
+def test_failures_outside_window_are_forgotten(clock):
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record(False, 0.1)
+    clock.advance(61)
+    breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+    clock.advance(30)
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.before_request()
+
+
+def test_successful_probe_closes(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+    clock.advance(30)
+    breaker.before_request()
+    breaker.record(True, 0.1)
+    assert breaker.state == CLOSED
+    breaker.before_request()
+
+
+def test_failed_probe_reopens_with_doubled_period(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+    for expected in (60, 100, 100):
+        clock.advance(breaker._open_seconds)
+        breaker.before_request()
+        breaker.record(False, 0.1)
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpen) as excinfo:
+            breaker.before_request()
+        assert excinfo.value.retry_after == pytest.approx(expected)
+
+
+def test_released_probe_can_be_retried(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+    clock.advance(30)
+    breaker.before_request()
+    breaker.release()
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+
+
+def test_breaker_map_is_bounded(monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "breakers", circuit_breaker.OrderedDict())
+    monkeypatch.setattr(circuit_breaker, "MAX_BREAKERS", 2)
+    first = circuit_breaker.breaker_for("a.example.com")
+    circuit_breaker.breaker_for("b.example.com")
+    assert circuit_breaker.breaker_for("a.example.com") is first
+    circuit_breaker.breaker_for("c.example.com")
+    assert list(circuit_breaker.breakers) == ["a.example.com", "c.example.com"]
@@ -0,0 +1,64 @@
+# tests/test_command_limits.py
+
+import pytest
+
+from command_limits import SlidingWindow, parse_limits
+
+
+def test_window_allows_up_to_limit():
+    window = SlidingWindow(limit=3, window=10)
+    for _ in range(3):
+        assert window.retry_after("user", now=100.0) == 0
+        window.add("user", now=100.0)
+    assert window.retry_after("user", now=100.0) > 0
+
+
+def test_retry_after_waits_for_oldest_bucket_to_expire():
+    window = SlidingWindow(limit=2, window=10, buckets=10)
+    window.add("user", now=100.5)
+    window.add("user", now=104.2)
+    # The request at 100.5 sits in the 100-101 bucket, which leaves the window at 110
+    assert window.retry_after("user", now=105.0) == pytest.approx(5.0)
+    assert window.retry_after("user", now=109.9) == pytest.approx(0.1)
+    assert window.retry_after("user", now=110.0) == 0
+
+
+def test_buckets_expire_after_full_window():
+    window = SlidingWindow(limit=2, window=10)
+    window.add("user", now=100.0)
+    window.add("user", now=100.0)
+    assert window.retry_after("user", now=105.0) > 0
+    assert window.retry_after("user", now=125.0) == 0
+    window.add("user", now=125.0)
+    assert window.retry_after("user", now=125.0) == 0
+
+
+def test_keys_are_counted_separately():
+    window = SlidingWindow(limit=1, window=10)
+    window.add("alice", now=100.0)
+    assert window.retry_after("alice", now=100.0) > 0
+    assert window.retry_after("bob", now=100.0) == 0
+
+
+def test_first_rejection_reported_once_per_block():
+    window = SlidingWindow(limit=1, window=10)
+    window.add("user", now=100.0)
+    retry_after = window.retry_after("user", now=101.0)
+    assert window.first_rejection("user", retry_after, now=101.0)
+    assert not window.first_rejection("user", retry_after, now=102.0)
+    assert window.first_rejection("user", retry_after, now=101.0 + retry_after)
+
+
+def test_least_recently_used_key_is_dropped():
+    window = SlidingWindow(limit=1, window=10, max_keys=2)
+    window.add("a", now=100.0)
+    window.add("b", now=100.0)
+    window.retry_after("a", now=100.0)
+    window.add("c", now=100.0)
+    assert len(window) == 2
+    assert window.retry_after("a", now=100.0) > 0
+    assert window.retry_after("b", now=100.0) == 0
+
+
+def test_parse_limits():
+    assert parse_limits("quota=1/5/30, local = 20/100/10,") == {"quota": (1, 5, 30.0), "local": (20, 100, 10.0)}
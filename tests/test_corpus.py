@@ -0,0 +1,93 @@
+# tests/test_corpus.py
+
+import json
+import random
+
+import pytest
+
+import corpus
+from corpus import Category, ShuffledPicker, load_corpus
+
+
+def make_category(size, name="facts"):
+    return Category(name, "", "", 0, tuple(range(size)))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 10, 12, 97])
+def test_no_repeats_within_a_cycle(size):
+    random.seed(size)
+    picker = ShuffledPicker()
+    category = make_category(size)
+    for _ in range(5):
+        picks = [picker.pick(category, 1) for _ in range(size)]
+        assert sorted(picks) == list(category.entries)
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 16, 17, 64, 1000])
+def test_seeded_permutation_covers_every_index(size):
+    for seed in (0, 1, 0xDEADBEEF):
+        assert sorted(corpus._permute(position, seed, size) for position in range(size)) == list(range(size))
+
+
+def test_consecutive_picks_are_not_evenly_spaced():
+    random.seed(1)
+    picker = ShuffledPicker()
+    category = make_category(50)
+    picks = [picker.pick(category, 1) for _ in range(50)]
+    gaps = {(after - before) % 50 for before, after in zip(picks, picks[1:])}
+    assert len(gaps) > 10
+
+
+def test_new_cycle_does_not_open_with_recent_picks():
+    random.seed(2)
+    picker = ShuffledPicker()
+    size = 12
+    recent = min(corpus.RECENT_PICKS, size // 4)
+    category = make_category(size)
+    cycles = [[picker.pick(category, 1) for _ in range(size)] for _ in range(50)]
+    for previous, current in zip(cycles, cycles[1:]):
+        assert not set(previous[-recent:]) & set(current[:recent])
+
+
+def test_two_entry_category_never_repeats_back_to_back():
+    random.seed(3)
+    picker = ShuffledPicker()
+    category = make_category(2)
+    picks = [picker.pick(category, 1) for _ in range(100)]
+    assert all(before != after for before, after in zip(picks, picks[1:]))
+
+
+def test_channels_have_separate_cycles():
+    random.seed(0)
+    picker = ShuffledPicker()
+    category = make_category(10)
+    first = [picker.pick(category, 1) for _ in range(5)]
+    assert sorted(picker.pick(category, 2) for _ in range(10)) == list(range(10))
+    first += [picker.pick(category, 1) for _ in range(5)]
+    assert sorted(first) == list(range(10))
+
+
+def test_least_recently_used_cursor_is_dropped():
+    picker = ShuffledPicker(max_cursors=2)
+    category = make_category(10)
+    for channel_id in (1, 2, 1, 3):
+        picker.pick(category, channel_id)
+    assert list(picker._cursors) == [(1, "facts"), (3, "facts")]
+
+
+def test_bundled_corpus_loads():
+    corpus = load_corpus()
+    assert corpus
+    for name, category in corpus.items():
+        assert category.name == name
+        assert isinstance(category.entries, tuple) and category.entries
+
+
+def test_empty_category_is_rejected(tmp_path):
+    path = tmp_path / "corpus.json"
+    path.write_text(json.dumps({"categories": [
+        {"name": "facts", "help": "", "title": "", "color": 0, "entries": ["a"]},
+        {"name": "empty", "help": "", "title": "", "color": 0, "entries": []},
+    ]}))
+    with pytest.raises(ValueError, match="'empty'"):
+        load_corpus(str(path))
@@ -0,0 +1,119 @@
+# tests/test_deadline.py
+
+import asyncio
+
+import pytest
+
+import deadline
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch, clock):
+    monkeypatch.setattr(deadline, "clock", clock)
+
+
+def test_no_deadline_uses_requested_or_default_timeout():
+    async def check():
+        assert deadline.remaining() is None
+        assert deadline.timeout_for(3) == (3, False)
+        assert deadline.timeout_for() == (deadline.DEFAULT_REQUEST_TIMEOUT, False)
+
+    asyncio.run(check())
+
+
+def test_timeout_is_capped_by_remaining_time(clock):
+    async def check():
+        deadline.start(5)
+        clock.advance(2)
+        assert deadline.remaining() == pytest.approx(3)
+        assert deadline.timeout_for(1) == (1, False)
+        assert deadline.timeout_for(10) == (pytest.approx(3), True)
+        assert deadline.timeout_for() == (pytest.approx(3), True)
+        clock.advance(3)
+        with pytest.raises(deadline.DeadlineExceeded):
+            deadline.timeout_for(1)
+
+    asyncio.run(check())
+
+
+def test_deadline_is_inherited_by_child_tasks_but_not_by_the_caller():
+    async def child():
+        return deadline.remaining()
+
+    async def set_in_task():
+        deadline.start(1)
+
+    async def check():
+        await asyncio.create_task(set_in_task())
+        assert deadline.remaining() is None
+        deadline.start(4)
+        assert await asyncio.create_task(child()) == pytest.approx(4)
+
+    asyncio.run(check())
+
+
+def test_spawn_and_clear_detach_from_the_deadline():
+    async def child():
+        return deadline.remaining()
+
+    async def check():
+        deadline.start(4)
+        assert await deadline.spawn(child()) is None
+        assert deadline.remaining() == pytest.approx(4)
+        deadline.clear()
+        assert deadline.remaining() is None
+
+    asyncio.run(check())
+
+
+def test_spawned_task_cancelled_before_it_starts_closes_its_coroutine():
+    started = []
+
+    async def child():
+        try:
+            started.append(True)
+        finally:
+            started.append(False)
+
+    async def check():
+        coro = child()
+        task = deadline.spawn(coro)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert coro.cr_frame is None
+
+    asyncio.run(check())
+    assert started == []
+
+
+def test_wait_returns_shared_result_without_deadline():
+    async def check():
+        future = asyncio.get_running_loop().create_future()
+        future.set_result("done")
+        assert await deadline.wait(future) == "done"
+
+    asyncio.run(check())
+
+
+def test_wait_gives_up_at_deadline_without_cancelling_shared_work():
+    async def check():
+        shared = asyncio.get_running_loop().create_future()
+        deadline.start(0.01)
+        with pytest.raises(deadline.DeadlineExceeded):
+            await deadline.wait(shared)
+        assert not shared.cancelled()
+
+    asyncio.run(check())
+
+
+def test_wait_fails_fast_once_deadline_has_passed(clock):
+    async def check():
+        shared = asyncio.get_running_loop().create_future()
+        deadline.start(1)
+        clock.advance(1)
+        with pytest.raises(deadline.DeadlineExceeded):
+            await deadline.wait(shared)
+        assert not shared.done()
+
+    asyncio.run(check())
@@ -0,0 +1,64 @@
+# tests/test_figlet.py
+
+import pytest
+
+import figlet
+from figlet import GLYPH_HEIGHT, MAX_LINE_WIDTH, paginate, render
+
+# Room left in an embed description once the page is wrapped in a code block
+PAGE_LIMIT = 4096 - len("```\n\n```")
+
+
+def row_widths(block):
+    return [len(row) for row in block.split("\n")]
+
+
+@pytest.mark.parametrize("font", sorted(figlet.FONTS))
+def test_text_wraps_at_max_line_width(font):
+    blocks = render("the quick brown fox jumps over the lazy dog " * 3, font)
+    assert len(blocks) > 1
+    for block in blocks:
+        assert len(block.split("\n")) == GLYPH_HEIGHT
+        assert max(row_widths(block)) <= MAX_LINE_WIDTH
+
+
+def test_words_are_kept_whole_when_they_fit():
+    lines = figlet._wrap("hello world " * 4, "block")
+    assert len(lines) > 1
+    for line in lines:
+        assert all(word in ("hello", "world") for word in line.split())
+
+
+@pytest.mark.parametrize("font", sorted(figlet.FONTS))
+def test_word_longer_than_a_line_is_broken(font):
+    word = "W" * 40
+    lines = figlet._wrap(word, font)
+    assert len(lines) > 1
+    assert "".join(lines) == word
+    for block in render(word, font):
+        assert max(row_widths(block)) <= MAX_LINE_WIDTH
+
+
+def test_unknown_characters_render_as_question_mark():
+    assert render("é☃") == render("??")
+    assert render("a") == render("A")
+
+
+def test_paginate_keeps_blocks_whole_and_within_the_limit():
+    blocks = render("lorem ipsum dolor sit amet " * 60)
+    pages = list(paginate(blocks, PAGE_LIMIT))
+    assert len(pages) > 1
+    remaining = list(blocks)
+    for page in pages:
+        assert len(page) <= PAGE_LIMIT
+        # Each page is a run of whole blocks, in order
+        count = (page.count("\n") + 2) // (GLYPH_HEIGHT + 1)
+        assert page == "\n\n".join(remaining[:count])
+        remaining = remaining[count:]
+    assert remaining == []
+
+
+def test_paginate_small_output_is_one_page():
+    blocks = render("hi")
+    assert list(paginate(blocks, PAGE_LIMIT)) == blocks
+    assert list(paginate([], PAGE_LIMIT)) == []
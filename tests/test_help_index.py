@@ -0,0 +1,89 @@
+# tests/test_help_index.py
+
+from help_index import HelpIndex
+
+COMMANDS = [
+    ("weather", "Current weather.", "utilities"),
+    ("cat", "Random cat picture.", "media"),
+    ("coinflip", "Flip a coin.", "games"),
+    ("comic", "Latest xkcd.", "media"),
+    ("crypto", "Coin prices.", "finance"),
+    ("dog", None, "media"),
+]
+
+
+class Source:
+    """Stands in for the bot's command list, counting how often it is read."""
+
+    def __init__(self, commands):
+        self.commands = list(commands)
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return iter(self.commands)
+
+
+def render(heading, number, total, lines):
+    return (heading, number, total, tuple(lines))
+
+
+def make_index(commands=COMMANDS, **options):
+    source = Source(commands)
+    return HelpIndex(source, render, **options), source
+
+
+def test_category_filter_lists_only_that_category():
+    index, _ = make_index()
+    assert index.categories == ("finance", "games", "media", "utilities")
+    assert index.pages("Media") == (
+        ("Media Commands", 1, 1, ("!cat - Random cat picture.", "!comic - Latest xkcd.", "!dog - No description.")),
+    )
+
+
+def test_prefix_filter_matches_command_names():
+    index, _ = make_index()
+    (page,) = index.pages("!co")
+    assert page[0] == "Commands starting with 'co'"
+    assert page[3] == ("!coinflip - Flip a coin.", "!comic - Latest xkcd.")
+    assert index.pages("zebra") == ()
+
+
+def test_pages_are_split_by_per_page():
+    index, _ = make_index(per_page=4)
+    pages = index.pages()
+    assert [(number, total, len(lines)) for _, number, total, lines in pages] == [(1, 2, 4), (2, 2, 2)]
+
+
+def test_identical_queries_share_pages():
+    index, source = make_index()
+    pages = index.pages("media")
+    assert index.pages(" MEDIA ") is pages
+    assert index.pages() is index.pages(None)
+    assert source.reads == 1
+
+
+def test_command_changes_rebuild_the_pages():
+    index, source = make_index()
+    before = index.pages("media")
+    source.commands.append(("meme", "Random meme.", "media"))
+    index.invalidate()
+    after = index.pages("media")
+    assert after is not before
+    assert "!meme - Random meme." in after[0][3]
+    source.commands = [command for command in source.commands if command[0] != "cat"]
+    index.invalidate()
+    assert "!cat - Random cat picture." not in index.pages("media")[0][3]
+    assert source.reads == 3
+
+
+def test_least_recently_used_filter_is_dropped():
+    index, _ = make_index(max_filters=2)
+    media = index.pages("media")
+    index.pages("games")
+    assert index.pages("media") is media
+    index.pages("finance")
+    assert list(index._pages) == ["media", "finance"]
+    assert index.pages("media") is media
+    assert index.pages("games") == index.pages("games")
+    assert len(index._pages) == 2
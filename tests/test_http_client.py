@@ -0,0 +1,169 @@
+# tests/test_http_client.py
+
+import asyncio
+
+import pytest
+
+import deadline
+import http_client
+from cassette import CassetteMiss
+from circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpen
+from throttle import HostRateLimiter, RateLimited, TokenBucket
+
+HOST = "api.example.com"
+URL = f"https://{HOST}/v1/items"
+
+
+class FakeUpstream:
+    """Stands in for `HTTPClient._send`, answering with queued statuses or exceptions."""
+
+    def __init__(self):
+        self.outcomes = []
+        self.timeouts = []
+
+    async def __call__(self, method, url, *, params, headers, data, allow_redirects, timeout):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, BaseException):
+            raise outcome
+        response_headers = {"Retry-After": "30"} if outcome == 429 else {}
+        return http_client.Response(outcome, url, response_headers, b"{}")
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(HOST, min_calls=2, failure_rate=0.5, open_seconds=30, clock=clock)
+
+
+@pytest.fixture
+def limiter(clock):
+    limiter = HostRateLimiter({})
+    limiter._buckets[HOST] = TokenBucket(rate=1, capacity=2, clock=clock)
+    return limiter
+
+
+@pytest.fixture
+def upstream(monkeypatch, clock, breaker, limiter):
+    monkeypatch.setattr(deadline, "clock", clock)
+    monkeypatch.setattr(http_client, "breaker_for", lambda host: breaker)
+    monkeypatch.setattr(http_client, "host_limiter", limiter)
+    return FakeUpstream()
+
+
+@pytest.fixture
+def client(monkeypatch, upstream):
+    async def start():
+        pass
+
+    client = http_client.HTTPClient()
+    monkeypatch.setattr(client, "start", start)
+    monkeypatch.setattr(client, "_send", upstream)
+    return client
+
+
+def test_timeout_is_capped_by_the_deadline(client, upstream, clock):
+    async def check():
+        await client.get(URL, timeout=5)
+        deadline.start(2)
+        await client.get(URL, timeout=5)
+        # Refill a token; the deadline moves with the same clock
+        clock.advance(1)
+        await client.get(URL, timeout=0.5)
+
+    asyncio.run(check())
+    assert upstream.timeouts == [5, pytest.approx(2), 0.5]
+
+
+def test_expired_deadline_fails_before_spending_a_token(client, upstream, limiter, clock):
+    async def check():
+        deadline.start(1)
+        clock.advance(1)
+        with pytest.raises(deadline.DeadlineExceeded):
+            await client.get(URL)
+
+    asyncio.run(check())
+    assert upstream.timeouts == []
+    assert limiter._buckets[HOST].wait_time() == 0
+
+
+def test_deadline_timeout_does_not_count_against_the_host(client, upstream, breaker):
+    upstream.outcomes = [asyncio.TimeoutError(), asyncio.TimeoutError()]
+
+    async def check():
+        deadline.start(2)
+        with pytest.raises(deadline.DeadlineExceeded):
+            await client.get(URL, timeout=5)
+        deadline.clear()
+        with pytest.raises(asyncio.TimeoutError):
+            await client.get(URL, timeout=5)
+
+    asyncio.run(check())
+    assert breaker.state == CLOSED
+    assert [failed for _, failed in breaker._calls] == [True]
+
+
+def test_cassette_misses_do_not_count_against_the_host(client, upstream, breaker):
+    upstream.outcomes = [CassetteMiss("No recorded response")] * 3
+
+    async def check():
+        for _ in range(3):
+            with pytest.raises(CassetteMiss):
+                await client.get(URL)
+
+    asyncio.run(check())
+    assert breaker.state == CLOSED
+    assert not breaker._calls
+
+
+def test_server_errors_open_the_circuit(client, upstream, breaker):
+    upstream.outcomes = [500, 503]
+
+    async def check():
+        for _ in range(2):
+            response = await client.get(URL)
+            assert response.status_code >= 500
+        with pytest.raises(CircuitOpen):
+            await client.get(URL)
+
+    asyncio.run(check())
+    assert breaker.state == OPEN
+    assert len(upstream.timeouts) == 2
+
+
+def test_open_circuit_probe_closes_it_again(client, upstream, breaker, clock):
+    upstream.outcomes = [500, 500, 200]
+
+    async def check():
+        await client.get(URL)
+        await client.get(URL)
+        clock.advance(30)
+        assert (await client.get(URL)).status_code == 200
+
+    asyncio.run(check())
+    assert breaker.state == CLOSED
+
+
+def test_429_pauses_the_host(client, upstream):
+    upstream.outcomes = [429]
+
+    async def check():
+        await client.get(URL)
+        with pytest.raises(RateLimited) as excinfo:
+            await client.get(URL)
+        assert excinfo.value.retry_after == pytest.approx(30)
+
+    asyncio.run(check())
+    assert len(upstream.timeouts) == 1
+
+
+def test_limiter_wait_is_bounded_by_the_deadline(client, upstream, limiter):
+    async def check():
+        await client.get(URL)
+        await client.get(URL)
+        # The bucket is empty and the next token is a second away, but only half a second is left
+        deadline.start(0.5)
+        with pytest.raises(RateLimited):
+            await client.get(URL)
+
+    asyncio.run(check())
+    assert len(upstream.timeouts) == 2
@@ -0,0 +1,118 @@
+# tests/test_pools.py
+
+import asyncio
+import itertools
+
+import pytest
+
+from pools import ContentPool, fields_present
+
+
+async def settle(steps=20):
+    for _ in range(steps):
+        await asyncio.sleep(0)
+
+
+class Source:
+    """Fetch helpers that hand out numbered items, or scripted failures."""
+
+    def __init__(self, failures=()):
+        self.counter = itertools.count(1)
+        self.failures = list(failures)
+        self.batches = []
+
+    async def one(self):
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return next(self.counter)
+
+    async def batch(self, count):
+        self.batches.append(count)
+        return [next(self.counter) for _ in range(count)]
+
+
+def test_pool_fills_in_background_and_serves_buffered_items():
+    source = Source()
+    pool = ContentPool("test", source.one, size=4, low_water=1, concurrency=2)
+
+    async def check():
+        pool.start()
+        await settle()
+        assert len(pool) == 4
+        assert [await pool.get() for _ in range(3)] == [1, 2, 3]
+        await settle()
+        assert len(pool) == 4
+        await pool.stop()
+
+    asyncio.run(check())
+    assert pool.stats()["hits"] == 3
+
+
+def test_empty_pool_falls_back_to_a_live_fetch():
+    source = Source()
+    pool = ContentPool("test", source.one, size=4)
+
+    async def check():
+        assert await pool.get() == 1
+
+    asyncio.run(check())
+    assert pool.stats()["misses"] == 1
+
+
+def test_batch_fetch_requests_only_the_missing_items():
+    source = Source()
+    pool = ContentPool("test", source.one, fetch_batch=source.batch, size=5, low_water=2)
+
+    async def check():
+        pool.start()
+        await settle()
+        for _ in range(3):
+            await pool.get()
+        await settle()
+        await pool.stop()
+
+    asyncio.run(check())
+    assert source.batches == [5, 3]
+
+
+def test_failed_and_invalid_results_are_not_buffered():
+    source = Source(failures=[RuntimeError("upstream down"), "", None])
+    pool = ContentPool("test", source.one, size=3, concurrency=3, retry_delay=60)
+
+    async def check():
+        assert await pool._fill() == 0
+        assert len(pool) == 0
+        assert await pool._fill() == 3
+
+    asyncio.run(check())
+
+
+def test_stop_right_after_start_leaves_nothing_pending():
+    source = Source()
+    pool = ContentPool("test", source.one)
+
+    async def check():
+        pool.start()
+        task = pool._task
+        await pool.stop()
+        assert task.done()
+        assert pool._task is None
+        # Stopping twice is harmless
+        await pool.stop()
+
+    asyncio.run(check())
+    assert len(pool) == 0
+
+
+@pytest.mark.parametrize("result, expected", [
+    (("title", "https://example.com/a.png"), True),
+    (("title", ""), False),
+    (("title", None), False),
+    ((None, None), False),
+    (None, False)
+])
+def test_fields_present(result, expected):
+    assert fields_present(1)(result) is expected
@@ -0,0 +1,139 @@
+# tests/test_reminders.py
+
+import asyncio
+import sqlite3
+
+import pytest
+
+import reminders
+from reminders import ReminderScheduler, ReminderStore
+
+
+@pytest.fixture(autouse=True)
+def short_batch_window(monkeypatch):
+    monkeypatch.setattr(reminders, "BATCH_WINDOW", 0.05)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ReminderStore(str(tmp_path / "reminders.db"))
+    yield store
+    store.close()
+
+
+class Dispatcher:
+    def __init__(self):
+        self.batches = []
+        self.delivered = asyncio.Event()
+
+    async def __call__(self, batch):
+        self.batches.append([reminder.message for reminder in batch])
+        self.delivered.set()
+
+    async def wait_for(self, count, timeout=2):
+        while sum(map(len, self.batches)) < count:
+            self.delivered.clear()
+            await asyncio.wait_for(self.delivered.wait(), timeout)
+
+
+def test_reminders_due_together_are_sent_as_one_batch(store):
+    dispatch = Dispatcher()
+
+    async def check():
+        scheduler = ReminderScheduler(store, dispatch)
+        scheduler.start()
+        await scheduler.schedule(0.2, 1, 1, "later")
+        await scheduler.schedule(0.02, 1, 1, "first")
+        await scheduler.schedule(0.03, 1, 1, "second")
+        await dispatch.wait_for(3)
+        # Sent reminders are deleted in the executor right after dispatch
+        for _ in range(100):
+            if not store.load_pending():
+                break
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+
+    asyncio.run(check())
+    assert dispatch.batches == [["first", "second"], ["later"]]
+    assert store.load_pending() == []
+
+
+def test_earlier_reminder_wakes_the_dispatcher(store):
+    dispatch = Dispatcher()
+
+    async def check():
+        scheduler = ReminderScheduler(store, dispatch)
+        scheduler.start()
+        await scheduler.schedule(3600, 1, 1, "next hour")
+        await scheduler.schedule(0.01, 1, 1, "soon")
+        await dispatch.wait_for(1, timeout=0.5)
+        assert len(scheduler) == 1
+        scheduler.stop()
+
+    asyncio.run(check())
+    assert dispatch.batches == [["soon"]]
+
+
+def test_pending_reminders_are_reloaded_after_restart(tmp_path):
+    path = str(tmp_path / "reminders.db")
+    dispatch = Dispatcher()
+
+    async def schedule():
+        store = ReminderStore(path)
+        scheduler = ReminderScheduler(store, dispatch)
+        scheduler.start()
+        await scheduler.schedule(0.05, 1, 1, "mine", guild_id=10)
+        await scheduler.schedule(0.05, 1, 1, "other shard", guild_id=11)
+        scheduler.stop()
+        store.close()
+
+    async def restart():
+        store = ReminderStore(path)
+        scheduler = ReminderScheduler(store, dispatch, owns=lambda reminder: reminder.guild_id == 10)
+        scheduler.start()
+        assert len(scheduler) == 1
+        await dispatch.wait_for(1)
+        scheduler.stop()
+        remaining = [reminder.message for reminder in store.load_pending()]
+        store.close()
+        return remaining
+
+    asyncio.run(schedule())
+    assert asyncio.run(restart()) == ["other shard"]
+    assert dispatch.batches == [["mine"]]
+
+
+def test_failed_delete_keeps_the_dispatcher_running(store, monkeypatch):
+    dispatch = Dispatcher()
+
+    def locked(reminder_ids):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, "delete_many", locked)
+
+    async def check():
+        scheduler = ReminderScheduler(store, dispatch)
+        scheduler.start()
+        await scheduler.schedule(0, 1, 1, "first")
+        await dispatch.wait_for(1)
+        await scheduler.schedule(0, 1, 1, "second")
+        await dispatch.wait_for(2)
+        scheduler.stop()
+
+    asyncio.run(check())
+    assert dispatch.batches == [["first"], ["second"]]
+
+
+def test_store_adds_guild_column_to_old_tables(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE reminders (id INTEGER PRIMARY KEY AUTOINCREMENT, due REAL NOT NULL, "
+        "channel_id INTEGER NOT NULL, user_id INTEGER NOT NULL, message TEXT NOT NULL)"
+    )
+    conn.execute("INSERT INTO reminders (due, channel_id, user_id, message) VALUES (1, 2, 3, 'old')")
+    conn.commit()
+    conn.close()
+    store = ReminderStore(path)
+    assert [(reminder.message, reminder.guild_id) for reminder in store.load_pending()] == [("old", None)]
+    store.close()
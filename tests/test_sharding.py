@@ -0,0 +1,83 @@
+# tests/test_sharding.py
+
+import signal
+import time
+
+import pytest
+
+import launcher
+import sharding
+from sharding import format_shard_ids, parse_shard_ids, shard_for, split_shards
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("0-3,8,10-11", [0, 1, 2, 3, 8, 10, 11]),
+    (" 5 , 2-3,, 3 ", [2, 3, 5]),
+    ("7", [7]),
+    ("", None),
+    ("  ", None),
+    (None, None)
+])
+def test_parse_shard_ids(spec, expected):
+    assert parse_shard_ids(spec) == expected
+
+
+def test_format_round_trips_through_parse():
+    assert parse_shard_ids(format_shard_ids([0, 1, 4])) == [0, 1, 4]
+
+
+@pytest.mark.parametrize("shard_ids, workers, expected", [
+    (list(range(10)), 3, [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]),
+    (list(range(4)), 4, [[0], [1], [2], [3]]),
+    ([0, 1], 8, [[0], [1]]),
+    ([3, 5, 9], 0, [[3, 5, 9]])
+])
+def test_split_shards(shard_ids, workers, expected):
+    assert split_shards(shard_ids, workers) == expected
+
+
+def test_split_shards_covers_every_shard_once():
+    groups = split_shards(list(range(97)), 8)
+    assert [shard for group in groups for shard in group] == list(range(97))
+    assert max(map(len, groups)) - min(map(len, groups)) <= 1
+
+
+def test_shard_for_follows_discord_formula():
+    guild_id = 81384788765712384
+    assert shard_for(guild_id, 4) == (guild_id >> 22) % 4
+    assert shard_for(None, 4) == 0
+    assert shard_for(guild_id, None) == 0
+
+
+def test_owns_guild(monkeypatch):
+    guild_id = 6 << 22
+    monkeypatch.setattr(sharding, "SHARD_IDS", None)
+    assert sharding.owns_guild(guild_id)
+    monkeypatch.setattr(sharding, "SHARD_COUNT", 4)
+    monkeypatch.setattr(sharding, "SHARD_IDS", [0, 1])
+    assert sharding.owns_guild(4 << 22)
+    assert not sharding.owns_guild(guild_id)
+    assert sharding.owns_guild(None)
+
+
+def test_worker_environment_splits_budgets_and_ports(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_SHARE", "1")
+    monkeypatch.setenv("METRICS_PORT", "9108")
+    env = launcher.Worker(2, [4, 5], 8, 4).environment()
+    assert (env["SHARD_COUNT"], env["SHARD_IDS"]) == ("8", "4,5")
+    assert float(env["RATE_LIMIT_SHARE"]) == 0.25
+    assert env["METRICS_PORT"] == "9110"
+    monkeypatch.setenv("METRICS_PORT", "0")
+    assert launcher.Worker(2, [4, 5], 8, 4).environment()["METRICS_PORT"] == "0"
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="SIGHUP is POSIX-only")
+def test_reload_before_worker_is_ready_does_not_kill_it(monkeypatch, tmp_path):
+    script = tmp_path / "slow_start.py"
+    script.write_text("import time\ntime.sleep(0.5)\n")
+    monkeypatch.setattr(launcher, "BOT_SCRIPT", str(script))
+    worker = launcher.Worker(0, [0], 1, 1)
+    worker.start()
+    time.sleep(0.1)
+    worker.reload()
+    assert worker.process.wait(timeout=5) == 0
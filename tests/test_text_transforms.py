@@ -0,0 +1,45 @@
+# tests/test_text_transforms.py
+
+import pytest
+
+from text_transforms import from_binary, from_morse, paginate, to_binary, to_morse
+
+
+@pytest.mark.parametrize("text", ["SOS", "HELLO WORLD", "ABCDEFGHIJKLMNOPQRSTUVWXYZ 0123456789"])
+def test_morse_round_trip(text):
+    assert from_morse(to_morse(text)) == text
+
+
+def test_morse_is_case_insensitive_and_drops_unknown_characters():
+    assert to_morse("sos!") == "... --- ..."
+    assert from_morse(to_morse("Hi, you")) == "HI YOU"
+
+
+def test_unknown_morse_symbol_decodes_to_question_mark():
+    assert from_morse(".... ...... ..") == "H?I"
+
+
+@pytest.mark.parametrize("text", ["", "hello", "Grüße, 世界 🎉", "tab\tand\nnewline"])
+def test_binary_round_trip(text):
+    assert from_binary(to_binary(text)) == text
+
+
+def test_binary_encodes_bytes_as_eight_bits():
+    assert to_binary("Hi") == "01001000 01101001"
+
+
+@pytest.mark.parametrize("bits", ["0102", "1" * 64])
+def test_malformed_binary_raises_value_error(bits):
+    with pytest.raises(ValueError):
+        from_binary(bits)
+
+
+def test_paginate_breaks_at_whitespace():
+    text = "alpha beta gamma delta"
+    chunks = list(paginate(text, 11))
+    assert chunks == ["alpha beta", "gamma delta"]
+    assert all(len(chunk) <= 11 for chunk in chunks)
+
+
+def test_paginate_splits_long_words():
+    assert list(paginate("x" * 25, 10)) == ["x" * 10, "x" * 10, "x" * 5]
@@ -0,0 +1,54 @@
+# tests/test_throttle.py
+
+import pytest
+
+from throttle import TokenBucket, parse_limits
+
+
+def test_burst_then_wait_for_refill(clock):
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+    assert [bucket.reserve(max_wait=0) for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve(max_wait=0) is None
+    assert bucket.wait_time() == pytest.approx(0.5)
+    clock.advance(0.5)
+    assert bucket.reserve(max_wait=0) == 0
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock)
+    clock.advance(60)
+    assert [bucket.reserve(max_wait=0) for _ in range(2)] == [0, 0]
+    assert bucket.reserve(max_wait=0) is None
+
+
+def test_reservation_queues_within_max_wait(clock):
+    bucket = TokenBucket(rate=1, capacity=1, clock=clock)
+    assert bucket.reserve(max_wait=5) == 0
+    assert bucket.reserve(max_wait=5) == pytest.approx(1)
+    assert bucket.reserve(max_wait=5) == pytest.approx(2)
+    assert bucket.reserve(max_wait=1.5) is None
+
+
+def test_penalty_blocks_for_given_seconds(clock):
+    bucket = TokenBucket(rate=5, capacity=10, clock=clock)
+    bucket.penalize(30)
+    assert bucket.wait_time() == pytest.approx(30)
+    clock.advance(29)
+    assert bucket.reserve(max_wait=0) is None
+    clock.advance(1)
+    assert bucket.reserve(max_wait=0) == 0
+
+
+def test_penalty_does_not_refill_a_drained_bucket(clock):
+    bucket = TokenBucket(rate=1, capacity=1, clock=clock)
+    for _ in range(10):
+        bucket.reserve(max_wait=60)
+    bucket.penalize(2)
+    assert bucket.wait_time() == pytest.approx(10)
+
+
+def test_parse_limits():
+    assert parse_limits("api.example.com=10/60:5, other.example.com=3") == {
+        "api.example.com": (10.0, 60.0, 5),
+        "other.example.com": (3.0, 1.0, None)
+    }
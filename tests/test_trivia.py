@@ -0,0 +1,139 @@
+# tests/test_trivia.py
+
+import asyncio
+
+import pytest
+
+import http_client
+import trivia
+from throttle import RateLimited
+from trivia import OPENTDB_TOKEN_URL, OPENTDB_URL, TriviaBank
+
+
+class FakeOpenTDB:
+    """Answers opentdb requests; `codes` scripts the response codes of successive question requests."""
+
+    def __init__(self, codes=()):
+        self.codes = list(codes)
+        self.requests = []
+        self.tokens = 0
+        self.rate_limited = 0
+
+    async def get(self, url, params=None, **kwargs):
+        await asyncio.sleep(0)
+        self.requests.append((url, dict(params or {})))
+        if self.rate_limited:
+            self.rate_limited -= 1
+            raise RateLimited("opentdb.com", 0.001)
+        if url == OPENTDB_TOKEN_URL:
+            if params["command"] == "request":
+                self.tokens += 1
+                return http_client.Response(200, url, {}, f'{{"response_code": 0, "token": "t{self.tokens}"}}'.encode())
+            return http_client.Response(200, url, {}, b'{"response_code": 0}')
+        code = self.codes.pop(0) if self.codes else 0
+        results = ",".join(f'{{"question": "q{n}"}}' for n in range(params["amount"])) if code == 0 else ""
+        return http_client.Response(200, url, {}, f'{{"response_code": {code}, "results": [{results}]}}'.encode())
+
+    def question_requests(self):
+        return [params for url, params in self.requests if url == OPENTDB_URL]
+
+    def token_requests(self):
+        return [params for url, params in self.requests if url == OPENTDB_TOKEN_URL]
+
+
+@pytest.fixture
+def opentdb(monkeypatch):
+    fake = FakeOpenTDB()
+    monkeypatch.setattr(http_client, "get", fake.get)
+    monkeypatch.setattr(trivia, "RATE_LIMIT_BACKOFF", 0.001)
+    return fake
+
+
+def test_token_is_fetched_once_and_shared_by_concurrent_refills(opentdb):
+    bank = TriviaBank(batch_size=5, low_water=2)
+
+    async def check():
+        bank.start("general")
+        questions = await asyncio.gather(bank.get_question("science"), bank.get_question("math"))
+        assert all(questions)
+        await bank.get_question("general")
+
+    asyncio.run(check())
+    assert opentdb.token_requests() == [{"command": "request"}]
+    assert all(params["token"] == "t1" for params in opentdb.question_requests())
+
+
+def test_refill_starts_below_low_water(opentdb):
+    bank = TriviaBank(batch_size=5, low_water=3)
+
+    async def check():
+        await bank.start()
+        for _ in range(2):
+            await bank.get_question()
+        await asyncio.sleep(0.01)
+        assert len(opentdb.question_requests()) == 1
+        await bank.get_question()
+        await asyncio.sleep(0.01)
+        assert len(opentdb.question_requests()) == 2
+        assert len(bank._queues[None]) == 7
+
+    asyncio.run(check())
+
+
+def test_rate_limited_response_backs_off_inside_one_refill(opentdb):
+    opentdb.codes = [trivia.RESPONSE_RATE_LIMIT]
+    bank = TriviaBank(batch_size=5, low_water=0)
+
+    async def check():
+        questions = await asyncio.gather(*(bank.get_question() for _ in range(3)))
+        assert all(questions)
+
+    asyncio.run(check())
+    assert len(opentdb.question_requests()) == 2
+
+
+def test_host_rate_limit_is_waited_out_instead_of_failing_the_refill(opentdb):
+    opentdb.rate_limited = 2
+    bank = TriviaBank(batch_size=5)
+
+    async def check():
+        assert await bank.get_question()
+
+    asyncio.run(check())
+    assert len(opentdb.token_requests()) == 3
+
+
+def test_used_up_token_is_reset_and_kept(opentdb):
+    opentdb.codes = [trivia.RESPONSE_TOKEN_EMPTY]
+    bank = TriviaBank(batch_size=5)
+
+    async def check():
+        assert await bank.get_question()
+
+    asyncio.run(check())
+    assert opentdb.token_requests() == [{"command": "request"}, {"command": "reset", "token": "t1"}]
+    assert bank._token == "t1"
+
+
+def test_unknown_token_is_replaced(opentdb):
+    opentdb.codes = [trivia.RESPONSE_TOKEN_NOT_FOUND]
+    bank = TriviaBank(batch_size=5)
+
+    async def check():
+        assert await bank.get_question()
+
+    asyncio.run(check())
+    assert bank._token == "t2"
+
+
+def test_stop_cancels_refills(opentdb):
+    bank = TriviaBank(batch_size=5)
+
+    async def check():
+        tasks = [bank.start("general"), bank.refill(bank.category_id("science"))]
+        await bank.stop()
+        assert all(task.cancelled() for task in tasks)
+        assert not bank._refills
+        assert await bank.get_question("general")
+
+    asyncio.run(check())
@@ -0,0 +1,44 @@
+# tests/test_upstreams.py
+
+import glob
+import os
+import re
+
+import metrics
+import throttle
+from upstreams import UPSTREAM_HOSTS, host_limits
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Hosts that only appear as links in embeds and are never requested
+LINK_ONLY_HOSTS = {"github.com", "github.githubassets.com"}
+
+
+def called_hosts():
+    hosts = set()
+    for path in glob.glob(os.path.join(ROOT, "cogs", "*.py")) + [os.path.join(ROOT, "trivia.py")]:
+        with open(path, encoding="utf-8") as f:
+            hosts.update(re.findall(r"https?://([A-Za-z0-9.-]+)", f.read()))
+    return hosts - LINK_ONLY_HOSTS
+
+
+def test_every_called_host_is_registered():
+    assert called_hosts() - set(UPSTREAM_HOSTS) == set()
+
+
+def test_registry_has_no_stale_hosts():
+    assert set(UPSTREAM_HOSTS) - called_hosts() == set()
+
+
+def test_default_budgets_come_from_the_registry():
+    assert throttle.DEFAULT_HOST_LIMITS == host_limits()
+    assert host_limits()["opentdb.com"] == (1, 5, 1)
+
+
+def test_unregistered_hosts_share_one_metrics_label():
+    metrics.observe_upstream("dog.ceo", 200, 0.01)
+    metrics.observe_upstream("bit.ly", 200, 0.01)
+    metrics.observe_upstream("tinyurl.com", 200, 0.01)
+    hosts = {labels[0] for labels in metrics.upstream_requests._values}
+    assert "dog.ceo" in hosts and metrics.OTHER_HOST in hosts
+    assert not hosts & {"bit.ly", "tinyurl.com"}
@@ -0,0 +1,175 @@
+# tests/test_user_store.py
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from user_store import JSONUserStore, SQLiteUserStore, UserRegistry
+
+USERS = {
+    "1": {"username": "alice", "registered_at": "2024-01-01 10:00:00"},
+    "2": {"username": "bob", "registered_at": "2024-01-02 11:00:00"}
+}
+
+
+@pytest.fixture
+def legacy_file(tmp_path):
+    path = tmp_path / "user_data.json"
+    path.write_text(json.dumps(USERS))
+    return str(path)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "users.db")
+
+
+def test_sqlite_upserts_and_lookups(db_path):
+    store = SQLiteUserStore(db_path)
+    store.upsert_many(USERS)
+    store.upsert_many({2: {"username": "bobby", "registered_at": "2024-02-01 09:00:00"}})
+    assert store.get(1) == USERS["1"]
+    assert store.get("2")["username"] == "bobby"
+    assert store.get(3) is None
+    assert set(store.load_all()) == {"1", "2"}
+    store.close()
+
+
+def test_json_import_runs_once(db_path, legacy_file):
+    store = SQLiteUserStore(db_path)
+    assert store.import_json(legacy_file) == 2
+    with open(legacy_file, "w") as f:
+        json.dump({"3": {"username": "carol", "registered_at": "2024-01-03 12:00:00"}}, f)
+    assert store.import_json(legacy_file) == 0
+    assert set(store.load_all()) == {"1", "2"}
+    store.close()
+    # The marker lives in the database, so a restarted process doesn't import again either
+    store = SQLiteUserStore(db_path)
+    assert store.import_json(legacy_file) == 0
+    store.close()
+
+
+def test_missing_json_file_leaves_no_marker(db_path, legacy_file, tmp_path):
+    store = SQLiteUserStore(db_path)
+    assert store.import_json(str(tmp_path / "missing.json")) == 0
+    assert store.import_json(legacy_file) == 2
+    store.close()
+
+
+def test_concurrent_workers_import_once(db_path, legacy_file):
+    stores = [SQLiteUserStore(db_path) for _ in range(4)]
+    results = []
+    start = threading.Barrier(len(stores))
+
+    def worker(store):
+        start.wait()
+        results.append(store.import_json(legacy_file))
+
+    threads = [threading.Thread(target=worker, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(results) == [0, 0, 0, 2]
+    assert len(stores[0].load_all()) == 2
+    for store in stores:
+        store.close()
+
+
+def test_json_store_merges_writes(tmp_path, legacy_file):
+    store = JSONUserStore(legacy_file)
+    store.upsert_many({"3": {"username": "carol", "registered_at": "2024-01-03 12:00:00"}})
+    assert set(store.load_all()) == {"1", "2", "3"}
+    assert JSONUserStore(str(tmp_path / "missing.json")).get(1) is None
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+class RecordingSave:
+    """Stands in for `upsert_many`, keeping every batch and failing the first `failures` calls."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+
+    def __call__(self, batch):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        self.batches.append(dict(batch))
+
+
+def make_registry(save, **options):
+    registry = UserRegistry(lambda: USERS, save, **options)
+    registry.load()
+    return registry
+
+
+def test_registrations_are_coalesced_into_one_save():
+    save = RecordingSave()
+
+    async def check():
+        registry = make_registry(save, flush_delay=0.01)
+        for user_id in (3, 4, 5):
+            registry.register(user_id, {"username": f"user{user_id}"})
+        assert registry.is_registered(4) and save.batches == []
+        await asyncio.sleep(0.05)
+        return registry
+
+    registry = asyncio.run(check())
+    assert save.batches == [{str(user_id): {"username": f"user{user_id}"} for user_id in (3, 4, 5)}]
+    assert len(registry) == 5
+
+
+def test_failed_save_is_retried():
+    save = RecordingSave(failures=1)
+
+    async def check():
+        registry = make_registry(save, flush_delay=0.01)
+        registry.register(3, {"username": "carol"})
+        await asyncio.sleep(0.015)
+        registry.register(4, {"username": "dave"})
+        await asyncio.sleep(0.05)
+
+    asyncio.run(check())
+    assert save.batches == [{"3": {"username": "carol"}, "4": {"username": "dave"}}]
+
+
+def test_flush_writes_pending_registrations_immediately():
+    save = RecordingSave()
+
+    async def check():
+        registry = make_registry(save, flush_delay=60)
+        registry.register(3, {"username": "carol"})
+        await registry.flush()
+        assert save.batches == [{"3": {"username": "carol"}}]
+        # Nothing left for the background flush to write
+        await registry.flush()
+        registry._flush_task.cancel()
+
+    asyncio.run(check())
+    assert len(save.batches) == 1
+
+
+def test_lookup_falls_back_to_the_store(db_path):
+    store = SQLiteUserStore(db_path)
+    store.upsert_many(USERS)
+    fetched = []
+
+    def fetch(user_id):
+        fetched.append(user_id)
+        return store.get(user_id)
+
+    async def check():
+        registry = UserRegistry(lambda: {}, store.upsert_many, fetch=fetch)
+        registry.load()
+        assert await registry.lookup(1) == USERS["1"]
+        assert await registry.lookup(1) == USERS["1"]
+        assert await registry.lookup(3) is None
+        return registry
+
+    registry = asyncio.run(check())
+    assert fetched == ["1", "3"]
+    assert registry.is_registered(1) and not registry.is_registered(3)
+    store.close()
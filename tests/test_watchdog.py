@@ -0,0 +1,48 @@
+# tests/test_watchdog.py
+
+import asyncio
+import time
+
+from watchdog import Watchdog
+
+
+def fetch_slow_thing():
+    # A blocking call in a fetch helper, the kind the watchdog exists to catch
+    time.sleep(0.4)
+    return "done"
+
+
+async def slow_command(ctx):
+    return fetch_slow_thing()
+
+
+def test_blocked_loop_is_reported_with_command_and_helper():
+    watchdog = Watchdog(lambda: {slow_command.__code__: "slow"}, threshold=0.1)
+
+    async def check():
+        watchdog.start()
+        await asyncio.sleep(0)
+        await slow_command(None)
+        # Let the heartbeat notice the loop has recovered
+        await asyncio.sleep(0.05)
+        watchdog.stop()
+
+    asyncio.run(check())
+    assert len(watchdog.reports) == 1
+    report = watchdog.reports[0]
+    assert report["command"] == "slow"
+    assert report["helper"] == "fetch_slow_thing"
+    assert report["blocked_for"] >= 0.3
+    assert any("fetch_slow_thing" in entry for entry in report["stack"])
+
+
+def test_responsive_loop_is_not_reported():
+    watchdog = Watchdog(threshold=0.2)
+
+    async def check():
+        watchdog.start()
+        await asyncio.sleep(0.5)
+        watchdog.stop()
+
+    asyncio.run(check())
+    assert not watchdog.reports
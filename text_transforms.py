@@ -0,0 +1,74 @@
+# text_transforms.py
+
+MORSE_CODE = {
+    'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.', 'F': '..-.',
+    'G': '--.', 'H': '....', 'I': '..', 'J': '.---', 'K': '-.-', 'L': '.-..',
+    'M': '--', 'N': '-.', 'O': '---', 'P': '.--.', 'Q': '--.-', 'R': '.-.',
+    'S': '...', 'T': '-', 'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-',
+    'Y': '-.--', 'Z': '--..',
+    '0': '-----', '1': '.----', '2': '..---', '3': '...--', '4': '....-',
+    '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
+    ' ': '/'
+}
+
+MORSE_DECODE = {code: char for char, code in MORSE_CODE.items()}
+
+
+class _DropUnknown(dict):
+    """Translation table that drops characters it has no entry for."""
+
+    def __missing__(self, key):
+        return ""
+
+
+class _BinaryTable(dict):
+    """Translation table with byte values precomputed and wider code points formatted on demand."""
+
+    def __missing__(self, key):
+        return format(key, '08b') + " "
+
+
+# Translation tables built once at import; each symbol carries its trailing separator
+MORSE_ENCODE_TABLE = _DropUnknown(
+    {ord(char): code + " " for char, code in MORSE_CODE.items()}
+)
+MORSE_ENCODE_TABLE.update({ord(char.lower()): code + " " for char, code in MORSE_CODE.items()})
+BINARY_ENCODE_TABLE = _BinaryTable({value: format(value, '08b') + " " for value in range(256)})
+
+
+def to_morse(text):
+    return text.translate(MORSE_ENCODE_TABLE).rstrip()
+
+
+def from_morse(code):
+    """Decode space-separated Morse symbols; '/' separates words and unknown symbols become '?'."""
+    return "".join(MORSE_DECODE.get(symbol, "?") for symbol in code.split())
+
+
+def to_binary(text):
+    return text.translate(BINARY_ENCODE_TABLE).rstrip()
+
+
+def from_binary(bits):
+    """Decode space-separated binary code points. Raises ValueError on malformed input."""
+    try:
+        return "".join(chr(int(group, 2)) for group in bits.split())
+    except OverflowError:
+        raise ValueError("code point out of range") from None
+
+
+def reverse(text):
+    return text[::-1]
+
+
+def paginate(text, limit):
+    """Lazily yield chunks of at most `limit` characters, breaking at whitespace where possible."""
+    start = 0
+    while len(text) - start > limit:
+        end = text.rfind(" ", start, start + limit + 1)
+        if end <= start:
+            end = start + limit
+        yield text[start:end]
+        start = end + 1 if text[end:end + 1] == " " else end
+    if start < len(text):
+        yield text[start:]
@@ -0,0 +1,113 @@
+# throttle.py
+
+import asyncio
+import os
+import time
+
+from upstreams import host_limits
+
+# Default outbound budgets per host: (requests, per_seconds, burst)
+DEFAULT_HOST_LIMITS = host_limits()
+
+# Longest a request may queue for a token before failing fast
+MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "5"))
+
+# Fraction of every host budget this process may spend; launcher.py splits budgets between its workers
+RATE_LIMIT_SHARE = float(os.getenv("RATE_LIMIT_SHARE", "1"))
+
+
+class RateLimited(Exception):
+    """Raised when an outbound request would exceed its host's budget."""
+
+    def __init__(self, host, retry_after):
+        super().__init__(f"Rate limit for {host} reached, retry in {retry_after:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second up to `capacity`.
+
+    Requests reserve a token up front; when the bucket is empty the reservation
+    goes negative and the caller sleeps until its token has been refilled.
+    `clock` returns the current time in seconds.
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self):
+        """Seconds until the next token is available."""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    def reserve(self, max_wait):
+        """Reserve one token and return how long to wait for it, or None if that exceeds `max_wait`."""
+        wait = self.wait_time()
+        if wait > max_wait:
+            return None
+        self._tokens -= 1
+        return wait
+
+    def penalize(self, seconds):
+        """Drain the bucket so nothing is sent for `seconds` (e.g. after an upstream 429)."""
+        self._refill()
+        self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+class HostRateLimiter:
+    """Per-host token buckets that every outbound request passes through."""
+
+    def __init__(self, limits, share=RATE_LIMIT_SHARE):
+        self.share = share
+        self._buckets = {}
+        for host, (requests, per, burst) in limits.items():
+            self.set_limit(host, requests, per, burst)
+
+    def set_limit(self, host, requests, per, burst=None):
+        capacity = (burst or requests) * self.share
+        self._buckets[host] = TokenBucket(requests * self.share / per, max(1, capacity))
+
+    async def acquire(self, host, max_wait=None):
+        """Wait for a token for `host`; raise `RateLimited` if the wait would exceed `max_wait`."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            return
+        wait = bucket.reserve(MAX_WAIT if max_wait is None else max_wait)
+        if wait is None:
+            raise RateLimited(host, bucket.wait_time())
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, host, seconds):
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            bucket.penalize(seconds)
+
+
+def parse_limits(spec):
+    """Parse `host=requests/seconds[:burst]` entries separated by commas."""
+    limits = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        host, _, budget = entry.partition("=")
+        budget, _, burst = budget.partition(":")
+        requests, _, per = budget.partition("/")
+        limits[host.strip()] = (float(requests), float(per or 1), int(burst) if burst else None)
+    return limits
+
+
+# Budgets set explicitly by the operator; these win over every default
+configured_limits = parse_limits(os.getenv("HTTP_RATE_LIMITS", ""))
+
+limits = dict(DEFAULT_HOST_LIMITS)
+limits.update(configured_limits)
+host_limiter = HostRateLimiter(limits)
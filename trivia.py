@@ -0,0 +1,181 @@
+# trivia.py
+
+import asyncio
+import functools
+import logging
+from collections import deque
+
+import deadline
+import http_client
+from throttle import RateLimited
+
+logger = logging.getLogger('discord')
+
+OPENTDB_URL = "https://opentdb.com/api.php"
+OPENTDB_TOKEN_URL = "https://opentdb.com/api_token.php"
+
+TRIVIA_CATEGORIES = {
+    "general": 9,
+    "books": 10,
+    "film": 11,
+    "music": 12,
+    "science": 17,
+    "computers": 18,
+    "math": 19,
+    "sports": 21,
+    "geography": 22,
+    "history": 23,
+    "politics": 24,
+    "art": 25,
+    "celebrities": 26,
+    "animals": 27,
+    "vehicles": 28,
+    "comics": 29,
+    "gadgets": 30,
+    "anime": 31,
+    "cartoon": 32
+}
+
+# Open Trivia DB response codes
+RESPONSE_OK = 0
+RESPONSE_NO_RESULTS = 1
+RESPONSE_TOKEN_NOT_FOUND = 3
+RESPONSE_TOKEN_EMPTY = 4
+RESPONSE_RATE_LIMIT = 5
+
+# Open Trivia DB answers one request per IP every 5 seconds; wait this long after a rate-limited response
+RATE_LIMIT_BACKOFF = 5
+
+# Requests one refill makes for a batch before giving up
+MAX_ATTEMPTS = 3
+
+
+class TriviaBank:
+    """Per-category question queues filled from Open Trivia DB in batches.
+
+    A session token, fetched once by `start()` and kept, keeps opentdb from
+    repeating questions. Each queue is refilled in the background once it
+    drops below `low_water`. opentdb only serves one request every few
+    seconds, so the default keeps a whole batch in reserve and a burst of
+    `!trivia` calls is still answered without a network round trip.
+    """
+
+    def __init__(self, batch_size=50, low_water=50):
+        self.batch_size = batch_size
+        self.low_water = low_water
+        self._queues = {}
+        self._refills = {}
+        self._token = None
+        self._token_request = None
+
+    def category_id(self, category):
+        return TRIVIA_CATEGORIES.get(category.lower()) if category else None
+
+    async def get_question(self, category=None):
+        """Return the next queued question for `category`, or None if none could be fetched."""
+        category_id = self.category_id(category)
+        queue = self._queues.setdefault(category_id, deque())
+        if not queue:
+            await deadline.wait(self.refill(category_id))
+            if not queue:
+                return None
+        question = queue.popleft()
+        if len(queue) < self.low_water:
+            self.refill(category_id)
+        return question
+
+    def start(self, category=None):
+        """Fetch the session token and fill `category`'s queue in the background."""
+        return self.refill(self.category_id(category))
+
+    async def stop(self):
+        """Cancel the background refills and token request and wait for them to finish."""
+        tasks = list(self._refills.values())
+        if self._token_request is not None:
+            tasks.append(self._token_request)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def refill(self, category_id):
+        """Start (or join) the background refill of one category's queue."""
+        task = self._refills.get(category_id)
+        if task is None:
+            task = self._refills[category_id] = deadline.spawn(self._refill(category_id))
+            task.add_done_callback(functools.partial(self._refill_done, category_id))
+        return task
+
+    def _refill_done(self, category_id, task):
+        # Also runs for refills cancelled before they started
+        if self._refills.get(category_id) is task:
+            del self._refills[category_id]
+        task.cancelled() or task.exception()
+
+    async def _refill(self, category_id):
+        try:
+            questions = await self._fetch_batch(category_id)
+            self._queues.setdefault(category_id, deque()).extend(questions)
+        except Exception as e:
+            logger.warning(f"Refilling trivia category {category_id} failed: {e}")
+
+    async def _get(self, url, params):
+        """GET from opentdb, waiting out the host's rate limit; refills run in the background, so they can wait."""
+        while True:
+            try:
+                return await http_client.get(url, params=params)
+            except RateLimited as e:
+                await asyncio.sleep(e.retry_after)
+
+    async def _fetch_batch(self, category_id):
+        amount = self.batch_size
+        for _ in range(MAX_ATTEMPTS):
+            params = {"amount": amount}
+            if category_id:
+                params["category"] = category_id
+            token = await self._get_token()
+            if token:
+                params["token"] = token
+            response = await self._get(OPENTDB_URL, params)
+            if response.status_code != 200:
+                return []
+            data = response.json()
+            code = data.get("response_code")
+            if code == RESPONSE_OK:
+                return data.get("results", [])
+            if code == RESPONSE_NO_RESULTS and amount > 10:
+                # Fewer unseen questions than a full batch are left in this category
+                amount = 10
+            elif code == RESPONSE_TOKEN_NOT_FOUND:
+                self._token = None
+            elif code in (RESPONSE_NO_RESULTS, RESPONSE_TOKEN_EMPTY):
+                await self._reset_token()
+            elif code == RESPONSE_RATE_LIMIT:
+                # Wait inside this refill so callers join it instead of starting another request
+                await asyncio.sleep(RATE_LIMIT_BACKOFF)
+            else:
+                return []
+        return []
+
+    async def _get_token(self):
+        """Return the session token; refills that find none share a single token request."""
+        if self._token is None:
+            if self._token_request is None or self._token_request.done():
+                self._token_request = deadline.spawn(self._request_token())
+            await self._token_request
+        return self._token
+
+    async def _request_token(self):
+        response = await self._get(OPENTDB_TOKEN_URL, {"command": "request"})
+        if response.status_code == 200:
+            self._token = response.json().get("token")
+
+    async def _reset_token(self):
+        if self._token is None:
+            return
+        response = await self._get(OPENTDB_TOKEN_URL, {"command": "reset", "token": self._token})
+        if response.status_code != 200 or response.json().get("response_code") != RESPONSE_OK:
+            self._token = None
+
+
+# Questions served by !trivia, kept across reloads of the games cog
+trivia_bank = TriviaBank()
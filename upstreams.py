@@ -0,0 +1,40 @@
+# upstreams.py
+
+# Every API host the commands call, with its default outbound budget as (requests, per_seconds, burst),
+# or None for hosts without a published limit. Metrics record hosts missing here as "other", and
+# tests/test_upstreams.py fails if a command calls a host that isn't listed.
+UPSTREAM_HOSTS = {
+    "api.coindesk.com": None,
+    "api.dictionaryapi.dev": None,
+    "api.github.com": (60, 3600, 10),
+    "api.nasa.gov": (1000, 3600, 20),
+    "api.quotable.io": None,
+    "api.thecatapi.com": None,
+    "aztro.sameerkumar.website": None,
+    "dog.ceo": None,
+    "ghapi.huchen.dev": None,
+    "hp-api.onrender.com": None,
+    "icanhazdadjoke.com": None,
+    "libretranslate.de": None,
+    "meme-api.herokuapp.com": None,
+    "numbersapi.com": None,
+    "official-joke-api.appspot.com": None,
+    "openlibrary.org": None,
+    "opentdb.com": (1, 5, 1),
+    "pokeapi.co": None,
+    "randomfox.ca": None,
+    "tenor.googleapis.com": (5, 1, 10),
+    "uselessfacts.jsph.pl": None,
+    "www.alphavantage.co": (5, 60, 5),
+    "www.boredapi.com": None,
+    "www.omdbapi.com": (1000, 86400, 20),
+    "www.reddit.com": None,
+    "www.thecolorapi.com": None,
+    "www.themealdb.com": None,
+    "xkcd.com": None
+}
+
+
+def host_limits():
+    """Return {host: (requests, per_seconds, burst)} for the hosts that have a default budget."""
+    return {host: limit for host, limit in UPSTREAM_HOSTS.items() if limit is not None}
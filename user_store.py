@@ -0,0 +1,191 @@
+# user_store.py
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+
+logger = logging.getLogger('discord')
+
+
+class JSONUserStore:
+    """Legacy backend that keeps every user in a single JSON file."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load_all(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def get(self, user_id):
+        return self.load_all().get(str(user_id))
+
+    def upsert_many(self, records):
+        data = self.load_all()
+        data.update(records)
+        # Write to a temporary file and swap it in so a crash never leaves a partial file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False, suffix=".tmp") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, self.path)
+
+    def close(self):
+        pass
+
+
+UPSERT_USER = (
+    "INSERT INTO users (user_id, username, registered_at) VALUES (?, ?, ?) "
+    "ON CONFLICT(user_id) DO UPDATE SET "
+    "username = excluded.username, registered_at = excluded.registered_at"
+)
+
+
+class SQLiteUserStore:
+    """SQLite backend in WAL mode with indexed single-row upserts and lookups."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS users ("
+                "user_id TEXT PRIMARY KEY, username TEXT NOT NULL, registered_at TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def load_all(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT user_id, username, registered_at FROM users").fetchall()
+        return {user_id: {"username": username, "registered_at": registered_at}
+                for user_id, username, registered_at in rows}
+
+    def get(self, user_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT username, registered_at FROM users WHERE user_id = ?", (str(user_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"username": row[0], "registered_at": row[1]}
+
+    @staticmethod
+    def _rows(records):
+        return [(str(user_id), record["username"], record["registered_at"])
+                for user_id, record in records.items()]
+
+    def upsert_many(self, records):
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT_USER, self._rows(records))
+
+    def import_json(self, json_path):
+        """Import a legacy `user_data.json` file once; later calls are no-ops.
+
+        Several shard workers may start together, so the check, the import and
+        the marker are one write transaction and only the first worker imports.
+        """
+        if not os.path.exists(json_path):
+            return 0
+        records = JSONUserStore(json_path).load_all()
+        with self._lock, self._conn:
+            # Take the write lock before checking, so a concurrent worker waits for our marker
+            self._conn.execute("BEGIN IMMEDIATE")
+            if self._conn.execute("SELECT value FROM meta WHERE key = 'json_import'").fetchone():
+                return 0
+            self._conn.executemany(UPSERT_USER, self._rows(records))
+            self._conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('json_import', ?)", (json_path,))
+        logger.info(f"Imported {len(records)} users from {json_path}")
+        return len(records)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class UserRegistry:
+    """Resident index of registered users with coalesced write-behind persistence.
+
+    `load` and `save` are the underlying persistence functions. The full user map is
+    read once with `load()`, membership checks are answered from memory, and new
+    records are handed to `save` in a single background batch per `flush_delay`.
+    When several processes share the store, `fetch(user_id)` is consulted on a
+    miss so users registered by another process are picked up.
+    """
+
+    def __init__(self, load, save, flush_delay=1.0, fetch=None):
+        self._load = load
+        self._save = save
+        self._fetch = fetch
+        self.flush_delay = flush_delay
+        self._users = {}
+        self._pending = set()
+        self._flush_task = None
+        self._write_lock = None
+
+    def load(self):
+        """Populate the index from persistent storage."""
+        self._users = dict(self._load())
+        self._write_lock = asyncio.Lock()
+
+    def __len__(self):
+        return len(self._users)
+
+    def is_registered(self, user_id):
+        return str(user_id) in self._users
+
+    def get(self, user_id):
+        return self._users.get(str(user_id))
+
+    async def lookup(self, user_id):
+        """Return a user's record, falling back to `fetch` when it isn't held in memory."""
+        record = self._users.get(str(user_id))
+        if record is None and self._fetch is not None:
+            record = await asyncio.get_running_loop().run_in_executor(None, self._fetch, str(user_id))
+            if record is not None:
+                self._users.setdefault(str(user_id), record)
+        return record
+
+    def register(self, user_id, record):
+        """Add or replace a user's record and schedule a background write."""
+        self._users[str(user_id)] = record
+        self._pending.add(str(user_id))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self):
+        # Keep flushing while registrations arrive during a write
+        while True:
+            await asyncio.sleep(self.flush_delay)
+            try:
+                await self._write()
+            except Exception as e:
+                logger.error(f"Failed to persist user data: {e}")
+            if not self._pending:
+                break
+
+    async def _write(self):
+        async with self._write_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, set()
+            batch = {user_id: self._users[user_id] for user_id in pending}
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._save, batch)
+            except BaseException:
+                self._pending |= pending
+                raise
+
+    async def flush(self):
+        """Write any pending changes immediately (used on shutdown)."""
+        if self._write_lock is not None:
+            await self._write()
@@ -0,0 +1,125 @@
+# watchdog.py
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+
+logger = logging.getLogger('discord')
+
+# Seconds the event loop may go without a heartbeat before it counts as stalled
+STALL_THRESHOLD = float(os.getenv("STALL_THRESHOLD", "0.5"))
+
+# How often the loop-side heartbeat ticks, in seconds
+HEARTBEAT_INTERVAL = 0.1
+
+# Most recent stall reports kept for the owner command
+MAX_REPORTS = 20
+
+# Innermost frames kept in a report
+MAX_STACK_FRAMES = 12
+
+
+class Watchdog:
+    """Detect event loop stalls from a separate thread and report what was running.
+
+    A task on the loop updates a heartbeat timestamp; a daemon thread checks
+    it and, once it is older than `threshold`, captures the loop thread's
+    stack. The stall is attributed to the innermost command callback (looked
+    up in `command_names()`, a {code object: command name} mapping) and the
+    innermost `fetch_*` helper on that stack. Reports are logged as JSON and
+    kept in a ring buffer; a report's `blocked_for` is updated to the full
+    stall length once the loop recovers.
+    """
+
+    def __init__(self, command_names=dict, threshold=STALL_THRESHOLD, max_reports=MAX_REPORTS):
+        self.command_names = command_names
+        self.threshold = threshold
+        self.reports = deque(maxlen=max_reports)
+        self._beat = time.monotonic()
+        self._active = None
+        self._loop_thread_id = None
+        self._heartbeat_task = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Start the heartbeat inside the running loop and the watcher thread."""
+        if self._heartbeat_task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def _heartbeat(self):
+        while True:
+            now = time.monotonic()
+            if self._active is not None:
+                report, started = self._active
+                self._active = None
+                report["blocked_for"] = round(now - started, 3)
+                logger.warning(json.dumps({"event": "event_loop_stall_ended", **report}))
+            self._beat = now
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    def _watch(self):
+        poll_interval = max(0.05, self.threshold / 4)
+        while not self._stopped.wait(poll_interval):
+            beat = self._beat
+            blocked_for = time.monotonic() - beat
+            if blocked_for < self.threshold or self._active is not None:
+                continue
+            try:
+                report = self._capture(blocked_for)
+            except Exception as e:
+                logger.error(f"Couldn't capture event loop stall: {e}")
+                continue
+            if report is None:
+                continue
+            # Skip if the loop recovered while the stack was being captured
+            if self._beat != beat:
+                continue
+            self.reports.append(report)
+            self._active = (report, beat)
+            logger.warning(json.dumps({"event": "event_loop_stall", **report}))
+
+    def _capture(self, blocked_for):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        codes = []
+        current = frame
+        while current is not None:
+            codes.append(current.f_code)
+            current = current.f_back
+        names = self.command_names()
+        command = next((names[code] for code in codes if code in names), None)
+        helper = next((code.co_name for code in codes if code.co_name.startswith("fetch_")), None)
+        stack = traceback.extract_stack(frame)[-MAX_STACK_FRAMES:]
+        return {
+            "at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "blocked_for": round(blocked_for, 3),
+            "command": command,
+            "helper": helper,
+            "stack": [_format_entry(entry) for entry in stack]
+        }
+
+
+def _format_entry(entry):
+    location = f"{os.path.basename(entry.filename)}:{entry.lineno} in {entry.name}"
+    return f"{location}: {entry.line}" if entry.line else location